@@ -4,7 +4,11 @@ import os
 import shutil
 import base64
 import redis
+import threading
+import time
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 from typing import Generic, Union, Optional, TypeVar
@@ -24,6 +28,7 @@ from open_webui.env import (
     REDIS_KEY_PREFIX,
     REDIS_SENTINEL_HOSTS,
     REDIS_SENTINEL_PORT,
+    REDIS_CONFIG_SYNC_INTERVAL,
     FRONTEND_BUILD_DIR,
     OFFLINE_MODE,
     OPEN_WEBUI_DIR,
@@ -208,7 +213,7 @@ class PersistentConfig(Generic[T]):
             self.value = new_value
             log.info(f"Updated {self.env_name} to new value {self.value}")
 
-    def save(self):
+    def save(self, commit: bool = True):
         log.info(f"Saving '{self.env_name}' to the database")
         path_parts = self.config_path.split(".")
         sub_config = CONFIG_DATA
@@ -217,15 +222,31 @@ class PersistentConfig(Generic[T]):
                 sub_config[key] = {}
             sub_config = sub_config[key]
         sub_config[path_parts[-1]] = self.value
-        save_to_db(CONFIG_DATA)
+        if commit:
+            save_to_db(CONFIG_DATA)
         self.config_value = self.value
 
 
 class AppConfig:
+    """
+    In-process snapshot of all PersistentConfig values.
+
+    Reads are served from memory. When Redis is configured, writes bump a
+    shared version counter and publish the changed keys, and every instance
+    listens for those notifications to refresh its snapshot. The version is
+    also re-checked at most every REDIS_CONFIG_SYNC_INTERVAL seconds, in case
+    a pub/sub message was missed.
+    """
+
     _redis: Union[redis.Redis, redis.cluster.RedisCluster] = None
     _redis_key_prefix: str
 
     _state: dict[str, PersistentConfig]
+    _version: int
+    _last_sync: float
+    _listener = None
+    _lock: threading.Lock
+    _batch: ContextVar
 
     def __init__(
         self,
@@ -247,40 +268,179 @@ class AppConfig:
             )
 
         super().__setattr__("_state", {})
+        super().__setattr__("_version", -1)
+        super().__setattr__("_last_sync", 0.0)
+        super().__setattr__("_lock", threading.Lock())
+        super().__setattr__("_batch", ContextVar("config_batch", default=None))
 
     def __setattr__(self, key, value):
         if isinstance(value, PersistentConfig):
             self._state[key] = value
-        else:
-            self._state[key].value = value
-            self._state[key].save()
+            return
 
-            if self._redis:
-                redis_key = f"{self._redis_key_prefix}:config:{key}"
-                self._redis.set(redis_key, json.dumps(self._state[key].value))
+        pending = self._batch.get()
+        if pending is not None and key not in pending:
+            pending[key] = self._state[key].value
+
+        self._state[key].value = value
+        self._state[key].save(commit=False)
+        if pending is None:
+            self._commit([key])
 
     def __getattr__(self, key):
         if key not in self._state:
             raise AttributeError(f"Config key '{key}' not found")
 
-        # If Redis is available, check for an updated value
         if self._redis:
-            redis_key = f"{self._redis_key_prefix}:config:{key}"
-            redis_value = self._redis.get(redis_key)
+            self._sync()
 
-            if redis_value is not None:
-                try:
-                    decoded_value = json.loads(redis_value)
+        return self._state[key].value
 
-                    # Update the in-memory value if different
-                    if self._state[key].value != decoded_value:
-                        self._state[key].value = decoded_value
-                        log.info(f"Updated {key} from Redis: {decoded_value}")
+    @contextmanager
+    def batch(self):
+        """
+        Group several config updates into one database write and one Redis
+        notification. If the block raises, the in-memory values are restored.
+
+            with request.app.state.config.batch():
+                request.app.state.config.TOP_K = 5
+                ...
+        """
+        if self._batch.get() is not None:
+            yield self
+            return
+
+        pending = {}
+        token = self._batch.set(pending)
+        try:
+            yield self
+        except Exception:
+            for key, value in pending.items():
+                self._state[key].value = value
+                self._state[key].save(commit=False)
+            raise
+        finally:
+            self._batch.reset(token)
 
-                except json.JSONDecodeError:
-                    log.error(f"Invalid JSON format in Redis for {key}: {redis_value}")
+        if pending:
+            self._commit(list(pending.keys()))
 
-        return self._state[key].value
+    def _redis_key(self, key: str) -> str:
+        return f"{self._redis_key_prefix}:config:{key}"
+
+    @property
+    def _redis_version_key(self) -> str:
+        return f"{self._redis_key_prefix}:config:_version"
+
+    @property
+    def _redis_channel(self) -> str:
+        return f"{self._redis_key_prefix}:config:_updates"
+
+    def _commit(self, keys: list[str]):
+        save_to_db(CONFIG_DATA)
+
+        if not self._redis:
+            return
+
+        try:
+            pipe = self._redis.pipeline(
+                transaction=not isinstance(self._redis, redis.cluster.RedisCluster)
+            )
+            for key in keys:
+                pipe.set(self._redis_key(key), json.dumps(self._state[key].value))
+            pipe.incr(self._redis_version_key)
+            version = pipe.execute()[-1]
+
+            super().__setattr__("_version", version)
+            self._redis.publish(
+                self._redis_channel, json.dumps({"version": version, "keys": keys})
+            )
+        except Exception as e:
+            log.error(f"Failed to publish config update to Redis: {e}")
+
+    def _sync(self):
+        if (
+            self._listener is not None
+            and time.monotonic() - self._last_sync < REDIS_CONFIG_SYNC_INTERVAL
+        ):
+            return
+
+        with self._lock:
+            if time.monotonic() - self._last_sync < REDIS_CONFIG_SYNC_INTERVAL:
+                return
+            super().__setattr__("_last_sync", time.monotonic())
+
+            if self._listener is None:
+                self._start_listener()
+
+            try:
+                version = int(self._redis.get(self._redis_version_key) or 0)
+                if version != self._version:
+                    self._reload()
+                    super().__setattr__("_version", version)
+            except Exception as e:
+                log.error(f"Failed to sync config from Redis: {e}")
+
+    def _start_listener(self):
+        def handle_exception(e, pubsub, thread):
+            log.warning(f"Config update listener stopped: {e}")
+            thread.stop()
+            # Restart on the next read
+            super(AppConfig, self).__setattr__("_listener", None)
+            super(AppConfig, self).__setattr__("_last_sync", 0.0)
+
+        try:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self._redis_channel: self._on_message})
+            listener = pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=handle_exception
+            )
+        except Exception as e:
+            log.warning(
+                f"Config update listener unavailable, polling every {REDIS_CONFIG_SYNC_INTERVAL}s: {e}"
+            )
+            listener = False
+
+        super().__setattr__("_listener", listener)
+
+    def _on_message(self, message):
+        try:
+            data = json.loads(message["data"])
+            version = int(data["version"])
+            if version <= self._version:
+                return
+
+            # Reload everything if we missed an update in between
+            self._reload(None if version > self._version + 1 else data.get("keys"))
+            super().__setattr__("_version", version)
+        except Exception as e:
+            log.error(f"Invalid config update message from Redis: {e}")
+
+    def _reload(self, keys: Optional[list[str]] = None):
+        keys = [key for key in (keys or self._state.keys()) if key in self._state]
+        if not keys:
+            return
+
+        redis_keys = [self._redis_key(key) for key in keys]
+        if isinstance(self._redis, redis.cluster.RedisCluster):
+            values = self._redis.mget_nonatomic(redis_keys)
+        else:
+            values = self._redis.mget(redis_keys)
+
+        for key, redis_value in zip(keys, values):
+            if redis_value is None:
+                continue
+
+            try:
+                decoded_value = json.loads(redis_value)
+
+                # Update the in-memory value if different
+                if self._state[key].value != decoded_value:
+                    self._state[key].value = decoded_value
+                    log.info(f"Updated {key} from Redis: {decoded_value}")
+
+            except json.JSONDecodeError:
+                log.error(f"Invalid JSON format in Redis for {key}: {redis_value}")
 
 
 ####################################
@@ -1808,6 +1968,36 @@ ENABLE_TITLE_GENERATION = PersistentConfig(
     os.environ.get("ENABLE_TITLE_GENERATION", "True").lower() == "true",
 )
 
+ENABLE_COMBINED_TASK_GENERATION = PersistentConfig(
+    "ENABLE_COMBINED_TASK_GENERATION",
+    "task.combined.enable",
+    os.environ.get("ENABLE_COMBINED_TASK_GENERATION", "False").lower() == "true",
+)
+
+COMBINED_TASK_GENERATION_PROMPT_TEMPLATE = PersistentConfig(
+    "COMBINED_TASK_GENERATION_PROMPT_TEMPLATE",
+    "task.combined.prompt_template",
+    os.environ.get("COMBINED_TASK_GENERATION_PROMPT_TEMPLATE", ""),
+)
+
+DEFAULT_COMBINED_TASK_GENERATION_PROMPT_TEMPLATE = """### Task:
+Analyze the chat history and generate all of the following in a single response:
+{{TASKS}}
+### Guidelines:
+- Use the chat's primary language; default to English if multilingual.
+- Prioritize accuracy over excessive creativity; keep it clear and simple.
+- Only include the keys listed above.
+- Your entire response must be a single raw JSON object, without any markdown code fences or other encapsulating text.
+### Output:
+JSON format: { "title": "📉 Stock Market Trends", "tags": ["Business", "Finance"], "follow_ups": ["Question 1?", "Question 2?", "Question 3?"] }
+### Chat History:
+<chat_history>
+{{MESSAGES:END:6}}
+</chat_history>"""
+
+# Token budget for the chat history sent to task models (0 disables truncation)
+TASK_MESSAGES_MAX_TOKENS = int(os.environ.get("TASK_MESSAGES_MAX_TOKENS", "4000"))
+
 
 ENABLE_SEARCH_QUERY_GENERATION = PersistentConfig(
     "ENABLE_SEARCH_QUERY_GENERATION",
@@ -2128,6 +2318,16 @@ Ensure that the tools are effectively utilized to achieve the highest-quality an
 
 VECTOR_DB = os.environ.get("VECTOR_DB", "chroma")
 
+# Seconds a known collection (and its client handle) is reused without asking
+# the vector DB again, to pick up changes made by other instances (0 disables)
+VECTOR_DB_COLLECTION_CACHE_TTL = int(
+    os.environ.get("VECTOR_DB_COLLECTION_CACHE_TTL", "30")
+)
+
+# Maximum concurrent requests when a backend without a batch API searches
+# for several query vectors at once
+VECTOR_DB_QUERY_CONCURRENCY = int(os.environ.get("VECTOR_DB_QUERY_CONCURRENCY", "8"))
+
 # Chroma
 CHROMA_DATA_PATH = f"{DATA_DIR}/vector_db"
 
@@ -2198,6 +2398,7 @@ OPENSEARCH_CERT_VERIFY = (
 )
 OPENSEARCH_USERNAME = os.environ.get("OPENSEARCH_USERNAME", None)
 OPENSEARCH_PASSWORD = os.environ.get("OPENSEARCH_PASSWORD", None)
+OPENSEARCH_KNN_EF_SEARCH = int(os.environ.get("OPENSEARCH_KNN_EF_SEARCH", "100"))
 
 # ElasticSearch
 ELASTICSEARCH_URL = os.environ.get("ELASTICSEARCH_URL", "https://localhost:9200")
@@ -2210,6 +2411,9 @@ SSL_ASSERT_FINGERPRINT = os.environ.get("SSL_ASSERT_FINGERPRINT", None)
 ELASTICSEARCH_INDEX_PREFIX = os.environ.get(
     "ELASTICSEARCH_INDEX_PREFIX", "open_webui_collections"
 )
+ELASTICSEARCH_KNN_NUM_CANDIDATES = int(
+    os.environ.get("ELASTICSEARCH_KNN_NUM_CANDIDATES", "100")
+)
 # Pgvector
 PGVECTOR_DB_URL = os.environ.get("PGVECTOR_DB_URL", DATABASE_URL)
 if VECTOR_DB == "pgvector" and not PGVECTOR_DB_URL.startswith("postgres"):
@@ -3573,6 +3777,10 @@ WHISPER_VAD_FILTER = PersistentConfig(
 
 WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "").lower() or None
 
+# Number of VAD segments decoded together by the local batched whisper pipeline.
+# Set to 0 to fall back to sequential (non-batched) decoding.
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "8"))
+
 # Add Deepgram configuration
 DEEPGRAM_API_KEY = PersistentConfig(
     "DEEPGRAM_API_KEY",
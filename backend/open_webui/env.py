@@ -374,6 +374,30 @@ ENABLE_REALTIME_CHAT_SAVE = (
 
 ENABLE_QUERIES_CACHE = os.environ.get("ENABLE_QUERIES_CACHE", "False").lower() == "true"
 
+# Cross-request cache of generated search/retrieval queries (0 disables)
+try:
+    QUERIES_CACHE_TTL = int(os.environ.get("QUERIES_CACHE_TTL", "300"))
+except ValueError:
+    QUERIES_CACHE_TTL = 300
+
+try:
+    QUERIES_CACHE_MAX_SIZE = int(os.environ.get("QUERIES_CACHE_MAX_SIZE", "1000"))
+except ValueError:
+    QUERIES_CACHE_MAX_SIZE = 1000
+
+# Number of most recent messages that make up the cache key
+try:
+    QUERIES_CACHE_HISTORY_SIZE = int(
+        os.environ.get("QUERIES_CACHE_HISTORY_SIZE", "6")
+    )
+except ValueError:
+    QUERIES_CACHE_HISTORY_SIZE = 6
+
+# Start retrieval with the raw user message while queries are being generated
+ENABLE_SPECULATIVE_RETRIEVAL = (
+    os.environ.get("ENABLE_SPECULATIVE_RETRIEVAL", "False").lower() == "true"
+)
+
 ####################################
 # REDIS
 ####################################
@@ -395,6 +419,14 @@ try:
 except ValueError:
     REDIS_SENTINEL_MAX_RETRY_COUNT = 2
 
+# Upper bound (in seconds) on how stale the in-process config snapshot can get
+# if a Redis pub/sub invalidation message is missed
+REDIS_CONFIG_SYNC_INTERVAL = os.environ.get("REDIS_CONFIG_SYNC_INTERVAL", "10")
+try:
+    REDIS_CONFIG_SYNC_INTERVAL = float(REDIS_CONFIG_SYNC_INTERVAL)
+except ValueError:
+    REDIS_CONFIG_SYNC_INTERVAL = 10.0
+
 ####################################
 # UVICORN WORKERS
 ####################################
@@ -409,6 +441,22 @@ except ValueError:
     UVICORN_WORKERS = 1
     log.info(f"Invalid UVICORN_WORKERS value, defaulting to {UVICORN_WORKERS}")
 
+# "blocking" loads local models, function dependencies and the model list before
+# serving; "background" serves immediately and reports progress on /health/ready
+STARTUP_WARMUP_MODE = os.environ.get("STARTUP_WARMUP_MODE", "blocking").lower()
+if STARTUP_WARMUP_MODE not in ("blocking", "background"):
+    log.warning(
+        f"Invalid STARTUP_WARMUP_MODE value, defaulting to blocking: {STARTUP_WARMUP_MODE}"
+    )
+    STARTUP_WARMUP_MODE = "blocking"
+
+# How long (in seconds) a request waits for a model still loading in the background
+STARTUP_WARMUP_WAIT_TIMEOUT = os.environ.get("STARTUP_WARMUP_WAIT_TIMEOUT", "120")
+try:
+    STARTUP_WARMUP_WAIT_TIMEOUT = float(STARTUP_WARMUP_WAIT_TIMEOUT)
+except ValueError:
+    STARTUP_WARMUP_WAIT_TIMEOUT = 120.0
+
 ####################################
 # WEBUI_AUTH (Required for security)
 ####################################
@@ -593,6 +641,36 @@ else:
         CHAT_RESPONSE_MAX_TOOL_CALL_RETRIES = 30
 
 
+# Maximum number of tool calls from a single model turn executed concurrently
+CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS = os.environ.get(
+    "CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS", "4"
+)
+
+if CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS == "":
+    CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS = 4
+else:
+    try:
+        CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS = max(
+            int(CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS), 1
+        )
+    except Exception:
+        CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS = 4
+
+
+# Timeout (in seconds) for a single tool call, empty to disable
+CHAT_RESPONSE_TOOL_CALL_TIMEOUT = os.environ.get(
+    "CHAT_RESPONSE_TOOL_CALL_TIMEOUT", "300"
+)
+
+if CHAT_RESPONSE_TOOL_CALL_TIMEOUT == "":
+    CHAT_RESPONSE_TOOL_CALL_TIMEOUT = None
+else:
+    try:
+        CHAT_RESPONSE_TOOL_CALL_TIMEOUT = int(CHAT_RESPONSE_TOOL_CALL_TIMEOUT)
+    except Exception:
+        CHAT_RESPONSE_TOOL_CALL_TIMEOUT = 300
+
+
 CHAT_STREAM_RESPONSE_CHUNK_MAX_BUFFER_SIZE = os.environ.get(
     "CHAT_STREAM_RESPONSE_CHUNK_MAX_BUFFER_SIZE", ""
 )
@@ -662,6 +740,22 @@ try:
 except ValueError:
     WEBSOCKET_SERVER_PING_INTERVAL = 25
 
+ENABLE_STREAM_JOURNAL = (
+    os.environ.get("ENABLE_STREAM_JOURNAL", "False").lower() == "true"
+)
+
+STREAM_JOURNAL_MAX_LEN = os.environ.get("STREAM_JOURNAL_MAX_LEN", "1000")
+try:
+    STREAM_JOURNAL_MAX_LEN = int(STREAM_JOURNAL_MAX_LEN)
+except ValueError:
+    STREAM_JOURNAL_MAX_LEN = 1000
+
+STREAM_JOURNAL_TTL = os.environ.get("STREAM_JOURNAL_TTL", "3600")
+try:
+    STREAM_JOURNAL_TTL = int(STREAM_JOURNAL_TTL)
+except ValueError:
+    STREAM_JOURNAL_TTL = 3600
+
 
 AIOHTTP_CLIENT_TIMEOUT = os.environ.get("AIOHTTP_CLIENT_TIMEOUT", "")
 
@@ -711,6 +805,31 @@ AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL = (
     os.environ.get("AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL", "True").lower() == "true"
 )
 
+# Cached tool server specs older than this are revalidated in the background
+TOOL_SERVER_SPEC_CACHE_TTL = os.environ.get("TOOL_SERVER_SPEC_CACHE_TTL", "300")
+
+try:
+    TOOL_SERVER_SPEC_CACHE_TTL = int(TOOL_SERVER_SPEC_CACHE_TTL)
+except Exception:
+    TOOL_SERVER_SPEC_CACHE_TTL = 300
+
+
+# MCP sessions are kept open and reused across requests until idle for this
+# many seconds, 0 disables pooling
+MCP_SESSION_IDLE_TIMEOUT = os.environ.get("MCP_SESSION_IDLE_TIMEOUT", "300")
+
+try:
+    MCP_SESSION_IDLE_TIMEOUT = int(MCP_SESSION_IDLE_TIMEOUT)
+except Exception:
+    MCP_SESSION_IDLE_TIMEOUT = 300
+
+MCP_TOOL_SPECS_CACHE_TTL = os.environ.get("MCP_TOOL_SPECS_CACHE_TTL", "300")
+
+try:
+    MCP_TOOL_SPECS_CACHE_TTL = int(MCP_TOOL_SPECS_CACHE_TTL)
+except Exception:
+    MCP_TOOL_SPECS_CACHE_TTL = 300
+
 
 ####################################
 # SENTENCE TRANSFORMERS
@@ -756,6 +875,214 @@ else:
     except Exception:
         SENTENCE_TRANSFORMERS_CROSS_ENCODER_MODEL_KWARGS = None
 
+
+# Coalesce concurrent local embedding requests into batches
+ENABLE_EMBEDDING_BATCHING = (
+    os.environ.get("ENABLE_EMBEDDING_BATCHING", "True").lower() == "true"
+)
+
+EMBEDDING_BATCH_MAX_SIZE = os.environ.get("EMBEDDING_BATCH_MAX_SIZE", "32")
+try:
+    EMBEDDING_BATCH_MAX_SIZE = int(EMBEDDING_BATCH_MAX_SIZE)
+except ValueError:
+    EMBEDDING_BATCH_MAX_SIZE = 32
+
+EMBEDDING_BATCH_MAX_WAIT_MS = os.environ.get("EMBEDDING_BATCH_MAX_WAIT_MS", "5")
+try:
+    EMBEDDING_BATCH_MAX_WAIT_MS = float(EMBEDDING_BATCH_MAX_WAIT_MS)
+except ValueError:
+    EMBEDDING_BATCH_MAX_WAIT_MS = 5.0
+
+# Requests with at most this many texts are treated as interactive (queries)
+# and are scheduled ahead of larger, bulk ones (document ingestion)
+EMBEDDING_INTERACTIVE_MAX_ITEMS = os.environ.get(
+    "EMBEDDING_INTERACTIVE_MAX_ITEMS", "8"
+)
+try:
+    EMBEDDING_INTERACTIVE_MAX_ITEMS = int(EMBEDDING_INTERACTIVE_MAX_ITEMS)
+except ValueError:
+    EMBEDDING_INTERACTIVE_MAX_ITEMS = 8
+
+# "thread" (default) or "process" to run the embedding model in its own process
+SENTENCE_TRANSFORMERS_EXECUTION_MODE = os.environ.get(
+    "SENTENCE_TRANSFORMERS_EXECUTION_MODE", "thread"
+).lower()
+
+# Window (in ms) in which concurrent reranking calls are scored as one batch
+RERANK_BATCH_MAX_WAIT_MS = os.environ.get("RERANK_BATCH_MAX_WAIT_MS", "5")
+try:
+    RERANK_BATCH_MAX_WAIT_MS = float(RERANK_BATCH_MAX_WAIT_MS)
+except ValueError:
+    RERANK_BATCH_MAX_WAIT_MS = 5.0
+
+# Number of (query, chunk) reranking scores kept in memory (0 disables)
+RERANK_SCORE_CACHE_SIZE = os.environ.get("RERANK_SCORE_CACHE_SIZE", "10000")
+try:
+    RERANK_SCORE_CACHE_SIZE = int(RERANK_SCORE_CACHE_SIZE)
+except ValueError:
+    RERANK_SCORE_CACHE_SIZE = 10000
+
+# Long-lived browser shared by the playwright web loader
+ENABLE_PLAYWRIGHT_BROWSER_POOL = (
+    os.environ.get("ENABLE_PLAYWRIGHT_BROWSER_POOL", "True").lower() == "true"
+)
+
+PLAYWRIGHT_MAX_CONCURRENT_PAGES = os.environ.get("PLAYWRIGHT_MAX_CONCURRENT_PAGES", "4")
+try:
+    PLAYWRIGHT_MAX_CONCURRENT_PAGES = int(PLAYWRIGHT_MAX_CONCURRENT_PAGES)
+except ValueError:
+    PLAYWRIGHT_MAX_CONCURRENT_PAGES = 4
+
+# Comma-separated Playwright resource types not needed for text extraction
+PLAYWRIGHT_BLOCK_RESOURCE_TYPES = [
+    resource_type.strip()
+    for resource_type in os.environ.get(
+        "PLAYWRIGHT_BLOCK_RESOURCE_TYPES", "image,font,media"
+    ).split(",")
+    if resource_type.strip()
+]
+
+# Seconds resolved web loader hostnames are cached for
+WEB_LOADER_DNS_CACHE_TTL = os.environ.get("WEB_LOADER_DNS_CACHE_TTL", "300")
+try:
+    WEB_LOADER_DNS_CACHE_TTL = int(WEB_LOADER_DNS_CACHE_TTL)
+except ValueError:
+    WEB_LOADER_DNS_CACHE_TTL = 300
+
+# Web pages are truncated to this many bytes (0 disables the limit)
+WEB_LOADER_MAX_RESPONSE_SIZE = os.environ.get(
+    "WEB_LOADER_MAX_RESPONSE_SIZE", str(10 * 1024 * 1024)
+)
+try:
+    WEB_LOADER_MAX_RESPONSE_SIZE = int(WEB_LOADER_MAX_RESPONSE_SIZE)
+except ValueError:
+    WEB_LOADER_MAX_RESPONSE_SIZE = 10 * 1024 * 1024
+
+# Worker processes extracting text from fetched HTML (0 uses threads instead)
+WEB_LOADER_PARSER_WORKERS = os.environ.get("WEB_LOADER_PARSER_WORKERS", "2")
+try:
+    WEB_LOADER_PARSER_WORKERS = int(WEB_LOADER_PARSER_WORKERS)
+except ValueError:
+    WEB_LOADER_PARSER_WORKERS = 2
+
+# Tiered cache of web search results, fetched pages and their chunk embeddings
+ENABLE_WEB_SEARCH_CACHE = (
+    os.environ.get("ENABLE_WEB_SEARCH_CACHE", "True").lower() == "true"
+)
+
+# Search engine responses, by (engine, query, params)
+WEB_SEARCH_CACHE_TTL = os.environ.get("WEB_SEARCH_CACHE_TTL", "300")
+try:
+    WEB_SEARCH_CACHE_TTL = int(WEB_SEARCH_CACHE_TTL)
+except ValueError:
+    WEB_SEARCH_CACHE_TTL = 300
+
+WEB_SEARCH_CACHE_MAX_SIZE = os.environ.get("WEB_SEARCH_CACHE_MAX_SIZE", "1000")
+try:
+    WEB_SEARCH_CACHE_MAX_SIZE = int(WEB_SEARCH_CACHE_MAX_SIZE)
+except ValueError:
+    WEB_SEARCH_CACHE_MAX_SIZE = 1000
+
+# Extracted page text, by URL. Pages without caching headers are kept for
+# WEB_PAGE_CACHE_TTL seconds, which also caps the lifetime they advertise.
+WEB_PAGE_CACHE_TTL = os.environ.get("WEB_PAGE_CACHE_TTL", "3600")
+try:
+    WEB_PAGE_CACHE_TTL = int(WEB_PAGE_CACHE_TTL)
+except ValueError:
+    WEB_PAGE_CACHE_TTL = 3600
+
+# Total characters of page text kept in memory
+WEB_PAGE_CACHE_MAX_SIZE = os.environ.get(
+    "WEB_PAGE_CACHE_MAX_SIZE", str(64 * 1024 * 1024)
+)
+try:
+    WEB_PAGE_CACHE_MAX_SIZE = int(WEB_PAGE_CACHE_MAX_SIZE)
+except ValueError:
+    WEB_PAGE_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+# Bytes of page chunk embeddings kept in memory (stored as float32)
+WEB_EMBEDDING_CACHE_MAX_SIZE = os.environ.get(
+    "WEB_EMBEDDING_CACHE_MAX_SIZE", str(128 * 1024 * 1024)
+)
+try:
+    WEB_EMBEDDING_CACHE_MAX_SIZE = int(WEB_EMBEDDING_CACHE_MAX_SIZE)
+except ValueError:
+    WEB_EMBEDDING_CACHE_MAX_SIZE = 128 * 1024 * 1024
+
+# Seconds a web search collection is kept after its last search (0 keeps it)
+WEB_SEARCH_COLLECTION_TTL = os.environ.get("WEB_SEARCH_COLLECTION_TTL", "604800")
+try:
+    WEB_SEARCH_COLLECTION_TTL = int(WEB_SEARCH_COLLECTION_TTL)
+except ValueError:
+    WEB_SEARCH_COLLECTION_TTL = 604800
+
+# Background deletion of expired ephemeral collections
+EPHEMERAL_COLLECTION_REAPER_INTERVAL = os.environ.get(
+    "EPHEMERAL_COLLECTION_REAPER_INTERVAL", "3600"
+)
+try:
+    EPHEMERAL_COLLECTION_REAPER_INTERVAL = int(EPHEMERAL_COLLECTION_REAPER_INTERVAL)
+except ValueError:
+    EPHEMERAL_COLLECTION_REAPER_INTERVAL = 3600
+
+EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE = os.environ.get(
+    "EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE", "100"
+)
+try:
+    EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE = int(EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE)
+except ValueError:
+    EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE = 100
+
+# Maximum collection deletions per second, to spare the vector DB
+EPHEMERAL_COLLECTION_REAPER_RATE = os.environ.get(
+    "EPHEMERAL_COLLECTION_REAPER_RATE", "5"
+)
+try:
+    EPHEMERAL_COLLECTION_REAPER_RATE = float(EPHEMERAL_COLLECTION_REAPER_RATE)
+except ValueError:
+    EPHEMERAL_COLLECTION_REAPER_RATE = 5.0
+
+# On-disk cache of extracted documents, by file content and extraction settings
+ENABLE_EXTRACTION_CACHE = (
+    os.environ.get("ENABLE_EXTRACTION_CACHE", "True").lower() == "true"
+)
+
+EXTRACTION_CACHE_MAX_SIZE = os.environ.get(
+    "EXTRACTION_CACHE_MAX_SIZE", str(1024 * 1024 * 1024)
+)
+try:
+    EXTRACTION_CACHE_MAX_SIZE = int(EXTRACTION_CACHE_MAX_SIZE)
+except ValueError:
+    EXTRACTION_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+
+# PDFs longer than this many pages are sent to extraction engines in parts of
+# this many pages, extracted concurrently (0 disables splitting)
+PDF_EXTRACTION_SPLIT_PAGES = os.environ.get("PDF_EXTRACTION_SPLIT_PAGES", "50")
+try:
+    PDF_EXTRACTION_SPLIT_PAGES = int(PDF_EXTRACTION_SPLIT_PAGES)
+except ValueError:
+    PDF_EXTRACTION_SPLIT_PAGES = 50
+
+PDF_EXTRACTION_CONCURRENCY = os.environ.get("PDF_EXTRACTION_CONCURRENCY", "4")
+try:
+    PDF_EXTRACTION_CONCURRENCY = int(PDF_EXTRACTION_CONCURRENCY)
+except ValueError:
+    PDF_EXTRACTION_CONCURRENCY = 4
+
+# Worker processes splitting large documents into chunks (0 splits in-thread),
+# in batches of documents of about this many characters
+TEXT_SPLITTER_WORKERS = os.environ.get("TEXT_SPLITTER_WORKERS", "2")
+try:
+    TEXT_SPLITTER_WORKERS = int(TEXT_SPLITTER_WORKERS)
+except ValueError:
+    TEXT_SPLITTER_WORKERS = 2
+
+TEXT_SPLITTER_BATCH_SIZE = os.environ.get("TEXT_SPLITTER_BATCH_SIZE", "200000")
+try:
+    TEXT_SPLITTER_BATCH_SIZE = int(TEXT_SPLITTER_BATCH_SIZE)
+except ValueError:
+    TEXT_SPLITTER_BATCH_SIZE = 200000
+
 ####################################
 # OFFLINE_MODE
 ####################################
@@ -877,6 +1204,46 @@ PIP_OPTIONS = os.getenv("PIP_OPTIONS", "").split()
 PIP_PACKAGE_INDEX_OPTIONS = os.getenv("PIP_PACKAGE_INDEX_OPTIONS", "").split()
 
 
+####################################
+# TOOLS/FUNCTIONS EXECUTION
+####################################
+
+# How synchronous plugin handlers are run: inline, thread or process.
+# Plugins can override it with an `execution` attribute.
+PLUGIN_SYNC_EXECUTION_MODE = os.environ.get(
+    "PLUGIN_SYNC_EXECUTION_MODE", "inline"
+).lower()
+if PLUGIN_SYNC_EXECUTION_MODE not in ("inline", "thread", "process"):
+    PLUGIN_SYNC_EXECUTION_MODE = "inline"
+
+PLUGIN_SYNC_EXECUTION_TIMEOUT = os.environ.get("PLUGIN_SYNC_EXECUTION_TIMEOUT", "")
+
+if PLUGIN_SYNC_EXECUTION_TIMEOUT == "":
+    PLUGIN_SYNC_EXECUTION_TIMEOUT = None
+else:
+    try:
+        PLUGIN_SYNC_EXECUTION_TIMEOUT = float(PLUGIN_SYNC_EXECUTION_TIMEOUT)
+    except Exception:
+        PLUGIN_SYNC_EXECUTION_TIMEOUT = None
+
+PLUGIN_PROCESS_POOL_SIZE = os.environ.get("PLUGIN_PROCESS_POOL_SIZE", "2")
+
+try:
+    PLUGIN_PROCESS_POOL_SIZE = max(int(PLUGIN_PROCESS_POOL_SIZE), 1)
+except Exception:
+    PLUGIN_PROCESS_POOL_SIZE = 2
+
+# Sync handlers running inline for longer than this are reported as blocking
+PLUGIN_SYNC_BLOCKING_THRESHOLD_MS = os.environ.get(
+    "PLUGIN_SYNC_BLOCKING_THRESHOLD_MS", "100"
+)
+
+try:
+    PLUGIN_SYNC_BLOCKING_THRESHOLD_MS = float(PLUGIN_SYNC_BLOCKING_THRESHOLD_MS)
+except Exception:
+    PLUGIN_SYNC_BLOCKING_THRESHOLD_MS = 100.0
+
+
 ####################################
 # PROGRESSIVE WEB APP OPTIONS
 ####################################
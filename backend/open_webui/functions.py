@@ -35,6 +35,7 @@ from open_webui.utils.plugin import (
     get_function_module_from_cache,
 )
 from open_webui.utils.tools import get_tools
+from open_webui.utils.executor import run_sync_handler
 from open_webui.utils.access_control import has_access
 
 from open_webui.env import SRC_LOG_LEVELS, GLOBAL_LOG_LEVEL
@@ -163,7 +164,7 @@ async def generate_function_chat_completion(
         if inspect.iscoroutinefunction(pipe):
             return await pipe(**params)
         else:
-            return pipe(**params)
+            return await run_sync_handler(pipe, plugin_id=pipe_id, **params)
 
     async def get_message_content(res: str | Generator | AsyncGenerator) -> str:
         if isinstance(res, str):
@@ -417,12 +417,14 @@ from open_webui.config import (
     ENABLE_TAGS_GENERATION,
     ENABLE_TITLE_GENERATION,
     ENABLE_FOLLOW_UP_GENERATION,
+    ENABLE_COMBINED_TASK_GENERATION,
     ENABLE_SEARCH_QUERY_GENERATION,
     ENABLE_RETRIEVAL_QUERY_GENERATION,
     ENABLE_AUTOCOMPLETE_GENERATION,
     TITLE_GENERATION_PROMPT_TEMPLATE,
     FOLLOW_UP_GENERATION_PROMPT_TEMPLATE,
     TAGS_GENERATION_PROMPT_TEMPLATE,
+    COMBINED_TASK_GENERATION_PROMPT_TEMPLATE,
     IMAGE_PROMPT_GENERATION_PROMPT_TEMPLATE,
     TOOLS_FUNCTION_CALLING_PROMPT_TEMPLATE,
     VOICE_MODE_PROMPT_TEMPLATE,
@@ -469,6 +471,8 @@ from open_webui.env import (
     EXTERNAL_PWA_MANIFEST_URL,
     AIOHTTP_CLIENT_SESSION_SSL,
     ENABLE_STAR_SESSIONS_MIDDLEWARE,
+    STARTUP_WARMUP_MODE,
+    STARTUP_WARMUP_WAIT_TIMEOUT,
 )
 
 
@@ -505,6 +509,20 @@ from open_webui.utils.oauth import (
 )
 from open_webui.utils.security_headers import SecurityHeadersMiddleware
 from open_webui.utils.redis import get_redis_connection
+from open_webui.utils.images.client import close_session as close_image_backend_session
+from open_webui.utils.images.comfyui import close_comfyui_connections
+from open_webui.utils.mcp.client import close_mcp_sessions
+from open_webui.utils.executor import shutdown_process_pool
+from open_webui.retrieval.web.browser_pool import (
+    PLAYWRIGHT_BROWSER_POOL,
+    close_playwright_browser_pool,
+)
+from open_webui.retrieval.vector.lifecycle import periodic_collection_reaper
+from open_webui.retrieval.loaders.session import close_document_loader_session
+from open_webui.retrieval.text_splitter import shutdown_splitter_pool
+from open_webui.retrieval.web.parser import shutdown_parser_pool
+from open_webui.retrieval.web.utils import close_web_loader_sessions
+from open_webui.utils.readiness import READINESS
 
 from open_webui.tasks import (
     redis_task_command_listener,
@@ -573,9 +591,15 @@ async def lifespan(app: FastAPI):
         get_license_data(app, LICENSE_KEY)
 
     # This should be blocking (sync) so functions are not deactivated on first /get_models calls
-    # when the first user lands on the / route.
+    # when the first user lands on the / route. In background mode, loading the
+    # models waits for it instead.
     log.info("Installing external dependencies of functions and tools...")
-    install_tool_and_function_dependencies()
+    if STARTUP_WARMUP_MODE == "background":
+        READINESS.run_in_background(
+            "function_dependencies", install_tool_and_function_dependencies
+        )
+    else:
+        install_tool_and_function_dependencies()
 
     app.state.redis = get_redis_connection(
         redis_url=REDIS_URL,
@@ -596,33 +620,66 @@ async def lifespan(app: FastAPI):
         limiter.total_tokens = THREAD_POOL_SIZE
 
     asyncio.create_task(periodic_usage_pool_cleanup())
+    asyncio.create_task(periodic_collection_reaper())
+
+    # Let sync web loads (run in worker threads) use the shared browser
+    PLAYWRIGHT_BROWSER_POOL.bind(asyncio.get_running_loop())
 
     if app.state.config.ENABLE_BASE_MODELS_CACHE:
-        await get_all_models(
-            Request(
-                # Creating a mock request object to pass to get_all_models
-                {
-                    "type": "http",
-                    "asgi.version": "3.0",
-                    "asgi.spec_version": "2.0",
-                    "method": "GET",
-                    "path": "/internal",
-                    "query_string": b"",
-                    "headers": Headers({}).raw,
-                    "client": ("127.0.0.1", 12345),
-                    "server": ("127.0.0.1", 80),
-                    "scheme": "http",
-                    "app": app,
-                }
-            ),
-            None,
-        )
+
+        async def load_base_models():
+            READINESS.start("base_models")
+            try:
+                # Function modules must not be loaded before their requirements
+                await asyncio.to_thread(
+                    READINESS.wait,
+                    "function_dependencies",
+                    STARTUP_WARMUP_WAIT_TIMEOUT,
+                )
+                await get_all_models(
+                    Request(
+                        # Creating a mock request object to pass to get_all_models
+                        {
+                            "type": "http",
+                            "asgi.version": "3.0",
+                            "asgi.spec_version": "2.0",
+                            "method": "GET",
+                            "path": "/internal",
+                            "query_string": b"",
+                            "headers": Headers({}).raw,
+                            "client": ("127.0.0.1", 12345),
+                            "server": ("127.0.0.1", 80),
+                            "scheme": "http",
+                            "app": app,
+                        }
+                    ),
+                    None,
+                )
+                READINESS.set_ready("base_models")
+            except Exception as e:
+                log.exception(f"Failed to load base models: {e}")
+                READINESS.set_failed("base_models", e)
+
+        if STARTUP_WARMUP_MODE == "background":
+            app.state.base_models_task = asyncio.create_task(load_base_models())
+        else:
+            await load_base_models()
 
     yield
 
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    await close_comfyui_connections()
+    await close_image_backend_session()
+    await close_mcp_sessions()
+    await close_playwright_browser_pool()
+    await close_web_loader_sessions()
+    await close_document_loader_session()
+    shutdown_parser_pool()
+    shutdown_splitter_pool()
+    shutdown_process_pool()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -978,65 +1035,100 @@ app.state.rf = None
 app.state.YOUTUBE_LOADER_TRANSLATION = None
 
 
-try:
-    app.state.ef = get_ef(
+def load_embedding_model():
+    try:
+        app.state.ef = get_ef(
+            app.state.config.RAG_EMBEDDING_ENGINE,
+            app.state.config.RAG_EMBEDDING_MODEL,
+            RAG_EMBEDDING_MODEL_AUTO_UPDATE,
+        )
+    except Exception as e:
+        log.error(f"Error updating models: {e}")
+        pass
+
+    app.state.EMBEDDING_FUNCTION = get_embedding_function(
         app.state.config.RAG_EMBEDDING_ENGINE,
         app.state.config.RAG_EMBEDDING_MODEL,
-        RAG_EMBEDDING_MODEL_AUTO_UPDATE,
+        embedding_function=app.state.ef,
+        url=(
+            app.state.config.RAG_OPENAI_API_BASE_URL
+            if app.state.config.RAG_EMBEDDING_ENGINE == "openai"
+            else (
+                app.state.config.RAG_OLLAMA_BASE_URL
+                if app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
+                else app.state.config.RAG_AZURE_OPENAI_BASE_URL
+            )
+        ),
+        key=(
+            app.state.config.RAG_OPENAI_API_KEY
+            if app.state.config.RAG_EMBEDDING_ENGINE == "openai"
+            else (
+                app.state.config.RAG_OLLAMA_API_KEY
+                if app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
+                else app.state.config.RAG_AZURE_OPENAI_API_KEY
+            )
+        ),
+        embedding_batch_size=app.state.config.RAG_EMBEDDING_BATCH_SIZE,
+        azure_api_version=(
+            app.state.config.RAG_AZURE_OPENAI_API_VERSION
+            if app.state.config.RAG_EMBEDDING_ENGINE == "azure_openai"
+            else None
+        ),
     )
-    if (
-        app.state.config.ENABLE_RAG_HYBRID_SEARCH
-        and not app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
-    ):
-        app.state.rf = get_rf(
-            app.state.config.RAG_RERANKING_ENGINE,
-            app.state.config.RAG_RERANKING_MODEL,
-            app.state.config.RAG_EXTERNAL_RERANKER_URL,
-            app.state.config.RAG_EXTERNAL_RERANKER_API_KEY,
-            RAG_RERANKING_MODEL_AUTO_UPDATE,
-        )
-    else:
-        app.state.rf = None
-except Exception as e:
-    log.error(f"Error updating models: {e}")
-    pass
-
-
-app.state.EMBEDDING_FUNCTION = get_embedding_function(
-    app.state.config.RAG_EMBEDDING_ENGINE,
-    app.state.config.RAG_EMBEDDING_MODEL,
-    embedding_function=app.state.ef,
-    url=(
-        app.state.config.RAG_OPENAI_API_BASE_URL
-        if app.state.config.RAG_EMBEDDING_ENGINE == "openai"
-        else (
-            app.state.config.RAG_OLLAMA_BASE_URL
-            if app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
-            else app.state.config.RAG_AZURE_OPENAI_BASE_URL
-        )
-    ),
-    key=(
-        app.state.config.RAG_OPENAI_API_KEY
-        if app.state.config.RAG_EMBEDDING_ENGINE == "openai"
-        else (
-            app.state.config.RAG_OLLAMA_API_KEY
-            if app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
-            else app.state.config.RAG_AZURE_OPENAI_API_KEY
+
+
+def load_reranking_model():
+    try:
+        if (
+            app.state.config.ENABLE_RAG_HYBRID_SEARCH
+            and not app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+        ):
+            app.state.rf = get_rf(
+                app.state.config.RAG_RERANKING_ENGINE,
+                app.state.config.RAG_RERANKING_MODEL,
+                app.state.config.RAG_EXTERNAL_RERANKER_URL,
+                app.state.config.RAG_EXTERNAL_RERANKER_API_KEY,
+                RAG_RERANKING_MODEL_AUTO_UPDATE,
+            )
+        else:
+            app.state.rf = None
+    except Exception as e:
+        log.error(f"Error updating models: {e}")
+        pass
+
+    app.state.RERANKING_FUNCTION = get_reranking_function(
+        app.state.config.RAG_RERANKING_ENGINE,
+        app.state.config.RAG_RERANKING_MODEL,
+        reranking_function=app.state.rf,
+    )
+
+
+def get_pending_embedding_function():
+    """
+    Stand-in for the embedding function while the model loads in the
+    background: waits for it (up to STARTUP_WARMUP_WAIT_TIMEOUT) and delegates.
+    """
+
+    async def pending_embedding_function(query, prefix=None, user=None):
+        await asyncio.to_thread(
+            READINESS.wait, "embedding_model", STARTUP_WARMUP_WAIT_TIMEOUT
         )
-    ),
-    embedding_batch_size=app.state.config.RAG_EMBEDDING_BATCH_SIZE,
-    azure_api_version=(
-        app.state.config.RAG_AZURE_OPENAI_API_VERSION
-        if app.state.config.RAG_EMBEDDING_ENGINE == "azure_openai"
-        else None
-    ),
-)
+        if app.state.EMBEDDING_FUNCTION is pending_embedding_function:
+            raise Exception("The embedding model is still loading, try again later.")
+        return await app.state.EMBEDDING_FUNCTION(query, prefix=prefix, user=user)
+
+    return pending_embedding_function
 
-app.state.RERANKING_FUNCTION = get_reranking_function(
-    app.state.config.RAG_RERANKING_ENGINE,
-    app.state.config.RAG_RERANKING_MODEL,
-    reranking_function=app.state.rf,
-)
+
+if STARTUP_WARMUP_MODE == "background":
+    # Serve immediately. Until the reranker is loaded, hybrid search falls
+    # back to scoring with the embedding model.
+    app.state.EMBEDDING_FUNCTION = get_pending_embedding_function()
+    READINESS.run_in_background("embedding_model", load_embedding_model)
+    READINESS.run_in_background("reranking_model", load_reranking_model)
+else:
+    load_embedding_model()
+    load_reranking_model()
 
 ########################################
 #
@@ -1185,10 +1277,14 @@ app.state.config.ENABLE_AUTOCOMPLETE_GENERATION = ENABLE_AUTOCOMPLETE_GENERATION
 app.state.config.ENABLE_TAGS_GENERATION = ENABLE_TAGS_GENERATION
 app.state.config.ENABLE_TITLE_GENERATION = ENABLE_TITLE_GENERATION
 app.state.config.ENABLE_FOLLOW_UP_GENERATION = ENABLE_FOLLOW_UP_GENERATION
+app.state.config.ENABLE_COMBINED_TASK_GENERATION = ENABLE_COMBINED_TASK_GENERATION
 
 
 app.state.config.TITLE_GENERATION_PROMPT_TEMPLATE = TITLE_GENERATION_PROMPT_TEMPLATE
 app.state.config.TAGS_GENERATION_PROMPT_TEMPLATE = TAGS_GENERATION_PROMPT_TEMPLATE
+app.state.config.COMBINED_TASK_GENERATION_PROMPT_TEMPLATE = (
+    COMBINED_TASK_GENERATION_PROMPT_TEMPLATE
+)
 app.state.config.IMAGE_PROMPT_GENERATION_PROMPT_TEMPLATE = (
     IMAGE_PROMPT_GENERATION_PROMPT_TEMPLATE
 )
@@ -1428,6 +1524,10 @@ if audit_level != AuditLevel.NONE:
 async def get_models(
     request: Request, refresh: bool = False, user=Depends(get_verified_user)
 ):
+    # Function modules must not be loaded before their requirements
+    await asyncio.to_thread(
+        READINESS.wait, "function_dependencies", STARTUP_WARMUP_WAIT_TIMEOUT
+    )
     all_models = await get_all_models(request, refresh=refresh, user=user)
 
     models = []
@@ -2266,6 +2366,15 @@ async def healthcheck():
     return {"status": True}
 
 
+@app.get("/health/ready")
+async def healthcheck_ready():
+    ready = READINESS.is_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": ready, "components": READINESS.model_dump()},
+    )
+
+
 @app.get("/health/db")
 async def healthcheck_with_db():
     Session.execute(text("SELECT 1;")).all()
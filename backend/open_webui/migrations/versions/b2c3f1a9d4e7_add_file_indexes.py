@@ -0,0 +1,34 @@
+"""Add file indexes
+
+Revision ID: b2c3f1a9d4e7
+Revises: 37f288994c47
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b2c3f1a9d4e7"
+down_revision: Union[str, None] = "37f288994c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # File listing (per user and admin), newest first
+    op.create_index("file_user_id_created_at_idx", "file", ["user_id", "created_at"])
+    op.create_index("file_created_at_id_idx", "file", ["created_at", "id"])
+
+    # Case-insensitive filename search
+    op.create_index("file_filename_lower_idx", "file", [sa.text("lower(filename)")])
+
+
+def downgrade() -> None:
+    op.drop_index("file_filename_lower_idx", table_name="file")
+    op.drop_index("file_created_at_id_idx", table_name="file")
+    op.drop_index("file_user_id_created_at_idx", table_name="file")
@@ -0,0 +1,44 @@
+"""Add ephemeral_collection table
+
+Revision ID: e4a9c3d2b1f0
+Revises: b2c3f1a9d4e7
+Create Date: 2025-11-24 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a9c3d2b1f0"
+down_revision: Union[str, None] = "b2c3f1a9d4e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lifecycle of vector DB collections that are safe to delete once expired
+    op.create_table(
+        "ephemeral_collection",
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("type", sa.Text(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=True),
+        sa.Column("expires_at", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    op.create_index(
+        "idx_ephemeral_collection_expires_at", "ephemeral_collection", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_ephemeral_collection_expires_at", table_name="ephemeral_collection"
+    )
+    op.drop_table("ephemeral_collection")
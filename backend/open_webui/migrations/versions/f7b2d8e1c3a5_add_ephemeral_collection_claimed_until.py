@@ -0,0 +1,31 @@
+"""Add claimed_until to ephemeral_collection
+
+Revision ID: f7b2d8e1c3a5
+Revises: e4a9c3d2b1f0
+Create Date: 2025-11-26 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7b2d8e1c3a5"
+down_revision: Union[str, None] = "e4a9c3d2b1f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Set while a reaper deletes the collection, so it is not registered again
+    op.add_column(
+        "ephemeral_collection",
+        sa.Column("claimed_until", sa.BigInteger(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ephemeral_collection", "claimed_until")
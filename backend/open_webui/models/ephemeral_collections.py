@@ -0,0 +1,188 @@
+import time
+import logging
+from typing import Optional, List
+
+from open_webui.internal.db import Base, get_db
+from open_webui.env import SRC_LOG_LEVELS
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import BigInteger, Column, Text, Index, or_
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MODELS"])
+
+####################
+# DB MODEL
+####################
+
+
+class EphemeralCollection(Base):
+    __tablename__ = "ephemeral_collection"
+
+    name = Column(Text, primary_key=True)  # vector DB collection name
+    type = Column(Text, nullable=False)  # e.g. "web_search"
+    user_id = Column(Text, nullable=True)
+    expires_at = Column(BigInteger, nullable=False)
+    # Set while a reaper deletes the collection, until the claim lapses
+    claimed_until = Column(BigInteger, nullable=True)
+    created_at = Column(BigInteger, nullable=False)
+    updated_at = Column(BigInteger, nullable=False)
+
+    __table_args__ = (Index("idx_ephemeral_collection_expires_at", "expires_at"),)
+
+
+class EphemeralCollectionModel(BaseModel):
+    name: str
+    type: str
+    user_id: Optional[str] = None
+    expires_at: int  # timestamp in epoch
+    claimed_until: Optional[int] = None  # timestamp in epoch
+    created_at: int  # timestamp in epoch
+    updated_at: int  # timestamp in epoch
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EphemeralCollectionTable:
+    def _is_unclaimed(self, current_time: int):
+        return or_(
+            EphemeralCollection.claimed_until.is_(None),
+            EphemeralCollection.claimed_until < current_time,
+        )
+
+    def touch(
+        self,
+        name: str,
+        type: str,
+        ttl: int,
+        user_id: Optional[str] = None,
+        force: bool = False,
+    ) -> Optional[EphemeralCollectionModel]:
+        """
+        Register a collection, or push back its expiry if already registered.
+        Returns None while a reaper holds a claim on it, unless `force` is set,
+        which drops the claim.
+        """
+        try:
+            with get_db() as db:
+                current_time = int(time.time())
+
+                query = db.query(EphemeralCollection).filter_by(name=name)
+                if not force:
+                    query = query.filter(self._is_unclaimed(current_time))
+                updated = query.update(
+                    {
+                        "expires_at": current_time + ttl,
+                        "claimed_until": None,
+                        "updated_at": current_time,
+                    },
+                    synchronize_session=False,
+                )
+
+                if not updated:
+                    if db.get(EphemeralCollection, name):
+                        # Claimed, it is being deleted
+                        db.rollback()
+                        return None
+
+                    db.add(
+                        EphemeralCollection(
+                            **{
+                                "name": name,
+                                "type": type,
+                                "user_id": user_id,
+                                "expires_at": current_time + ttl,
+                                "created_at": current_time,
+                                "updated_at": current_time,
+                            }
+                        )
+                    )
+
+                db.commit()
+                return EphemeralCollectionModel.model_validate(
+                    db.get(EphemeralCollection, name)
+                )
+        except Exception as e:
+            log.error(f"Error registering ephemeral collection {name}: {e}")
+            return None
+
+    def get_expired(self, limit: int = 100) -> List[EphemeralCollectionModel]:
+        """Get expired, unclaimed collections, longest expired first"""
+        try:
+            with get_db() as db:
+                current_time = int(time.time())
+                collections = (
+                    db.query(EphemeralCollection)
+                    .filter(EphemeralCollection.expires_at <= current_time)
+                    .filter(self._is_unclaimed(current_time))
+                    .order_by(EphemeralCollection.expires_at)
+                    .limit(limit)
+                    .all()
+                )
+                return [
+                    EphemeralCollectionModel.model_validate(collection)
+                    for collection in collections
+                ]
+        except Exception as e:
+            log.error(f"Error getting expired ephemeral collections: {e}")
+            return []
+
+    def claim(self, name: str, expires_at: int, lease: int) -> Optional[int]:
+        """
+        Take an expired collection for deletion for `lease` seconds, returning
+        the claim's end. Returns None if another instance claimed it, or it was
+        touched again, since `expires_at` was read. While the claim holds,
+        `touch` does not register the collection again.
+        """
+        try:
+            with get_db() as db:
+                current_time = int(time.time())
+                claimed_until = current_time + lease
+                claimed = (
+                    db.query(EphemeralCollection)
+                    .filter_by(name=name, expires_at=expires_at)
+                    .filter(self._is_unclaimed(current_time))
+                    .update(
+                        {"claimed_until": claimed_until}, synchronize_session=False
+                    )
+                )
+                db.commit()
+                return claimed_until if claimed == 1 else None
+        except Exception as e:
+            log.error(f"Error claiming ephemeral collection {name}: {e}")
+            return None
+
+    def is_claimed(self, name: str, claimed_until: int) -> bool:
+        """Check a claim still holds, i.e. it has neither lapsed nor been dropped"""
+        try:
+            with get_db() as db:
+                return (
+                    db.query(EphemeralCollection)
+                    .filter_by(name=name, claimed_until=claimed_until)
+                    .filter(EphemeralCollection.claimed_until >= int(time.time()))
+                    .first()
+                    is not None
+                )
+        except Exception as e:
+            log.error(f"Error checking ephemeral collection {name}: {e}")
+            return False
+
+    def delete_by_name(self, name: str, claimed_until: Optional[int] = None) -> bool:
+        """
+        Delete a collection's registration. If `claimed_until` is given, only
+        while that claim holds, so a registration made since is kept.
+        """
+        try:
+            with get_db() as db:
+                query = db.query(EphemeralCollection).filter_by(name=name)
+                if claimed_until is not None:
+                    query = query.filter_by(claimed_until=claimed_until)
+                query.delete()
+                db.commit()
+                return True
+        except Exception as e:
+            log.error(f"Error deleting ephemeral collection {name}: {e}")
+            return False
+
+
+EphemeralCollections = EphemeralCollectionTable()
@@ -1,11 +1,24 @@
 import logging
 import time
+from fnmatch import fnmatch
 from typing import Optional
 
 from open_webui.internal.db import Base, JSONField, get_db
 from open_webui.env import SRC_LOG_LEVELS
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, String, Text, JSON
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    String,
+    Text,
+    JSON,
+    Index,
+    and_,
+    func,
+    literal_column,
+    or_,
+    type_coerce,
+)
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -32,6 +45,15 @@ class File(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        # WHERE user_id = ... ORDER BY created_at DESC, id DESC
+        Index("file_user_id_created_at_idx", "user_id", "created_at"),
+        # ORDER BY created_at DESC, id DESC (admin listing)
+        Index("file_created_at_id_idx", "created_at", "id"),
+        # WHERE lower(filename) LIKE ...
+        Index("file_filename_lower_idx", func.lower(filename)),
+    )
+
 
 class FileModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -104,6 +126,36 @@ class FileUpdateForm(BaseModel):
     meta: Optional[dict] = None
 
 
+def glob_to_like(pattern: str) -> tuple[str, bool]:
+    """
+    Translate a glob pattern ('*', '?', '[...]') into a SQL LIKE pattern using
+    '\\' as the escape character. Character classes have no LIKE equivalent,
+    so they are widened to '_' and the second return value tells the caller
+    to re-check matches with fnmatch.
+    """
+    like = []
+    needs_recheck = False
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "*":
+            like.append("%")
+        elif char == "?":
+            like.append("_")
+        elif char == "[" and "]" in pattern[i + 1 :]:
+            like.append("_")
+            needs_recheck = True
+            i = pattern.index("]", i + 1)
+        elif char in ("%", "_", "\\"):
+            like.append(f"\\{char}")
+        else:
+            like.append(char)
+        i += 1
+
+    return "".join(like), needs_recheck
+
+
 class FilesTable:
     def insert_new_file(self, user_id: str, form_data: FileForm) -> Optional[FileModel]:
         with get_db() as db:
@@ -166,6 +218,106 @@ class FilesTable:
         with get_db() as db:
             return [FileModel.model_validate(file) for file in db.query(File).all()]
 
+    def get_files_page(
+        self,
+        user_id: Optional[str] = None,
+        filename: Optional[str] = None,
+        include_content: bool = True,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[list[FileModel], Optional[str]]:
+        """
+        List files newest first with keyset pagination, filtering by owner and
+        filename glob in SQL. When include_content is False, `data.content` is
+        stripped by the database so extracted text is never loaded.
+
+        Returns the page and the cursor for the next page (None on the last page).
+        """
+        with get_db() as db:
+            data_column = File.data
+            strip_content_in_python = False
+            if not include_content:
+                dialect_name = db.bind.dialect.name
+                if dialect_name == "sqlite":
+                    data_column = type_coerce(
+                        func.json_remove(File.data, "$.content"), JSON
+                    )
+                elif dialect_name == "postgresql":
+                    # json_object_agg over no keys is NULL, not {}
+                    data_column = literal_column(
+                        "(CASE WHEN json_typeof(file.data) = 'object' THEN "
+                        "COALESCE((SELECT json_object_agg(key, value) "
+                        "FROM json_each(file.data) WHERE key <> 'content'), "
+                        "'{}'::json) END)",
+                        type_=JSON,
+                    )
+                else:
+                    strip_content_in_python = True
+
+            query = db.query(
+                File.id,
+                File.user_id,
+                File.hash,
+                File.filename,
+                File.path,
+                data_column.label("data"),
+                File.meta,
+                File.access_control,
+                File.created_at,
+                File.updated_at,
+            )
+
+            if user_id:
+                query = query.filter(File.user_id == user_id)
+
+            needs_recheck = False
+            if filename:
+                like_pattern, needs_recheck = glob_to_like(filename.lower())
+                query = query.filter(
+                    func.lower(File.filename).like(like_pattern, escape="\\")
+                )
+
+            if cursor:
+                try:
+                    cursor_created_at, cursor_id = cursor.split(":", 1)
+                    cursor_created_at = int(cursor_created_at)
+                except ValueError:
+                    raise ValueError("Invalid cursor")
+
+                query = query.filter(
+                    or_(
+                        File.created_at < cursor_created_at,
+                        and_(
+                            File.created_at == cursor_created_at,
+                            File.id < cursor_id,
+                        ),
+                    )
+                )
+
+            query = query.order_by(File.created_at.desc(), File.id.desc())
+            if limit:
+                query = query.limit(limit)
+
+            rows = query.all()
+
+            next_cursor = None
+            if limit and len(rows) == limit:
+                next_cursor = f"{rows[-1].created_at}:{rows[-1].id}"
+
+            files = []
+            for row in rows:
+                if needs_recheck and not fnmatch(
+                    row.filename.lower(), filename.lower()
+                ):
+                    continue
+
+                file = FileModel.model_validate(row._asdict())
+                if strip_content_in_python and file.data and "content" in file.data:
+                    del file.data["content"]
+                files.append(file)
+
+            return files, next_cursor
+
     def check_access_by_user_id(self, id, user_id, permission="write") -> bool:
         file = self.get_file_by_id(id)
         if not file:
@@ -246,6 +246,24 @@ class FunctionsTable:
                     for function in db.query(Function).filter_by(type=type).all()
                 ]
 
+    def get_function_versions_by_type(
+        self, type: str, active_only=False
+    ) -> list[tuple[str, bool, int, Optional[dict]]]:
+        """
+        Lightweight (id, is_global, updated_at, valves) rows, used to detect
+        changes without loading function content.
+        """
+        with get_db() as db:
+            query = db.query(
+                Function.id, Function.is_global, Function.updated_at, Function.valves
+            ).filter_by(type=type)
+            if active_only:
+                query = query.filter_by(is_active=True)
+            return [
+                (id, bool(is_global), updated_at, valves)
+                for id, is_global, updated_at, valves in query.all()
+            ]
+
     def get_global_filter_functions(self) -> list[FunctionModel]:
         with get_db() as db:
             return [
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from open_webui.config import CACHE_DIR
+from open_webui.env import (
+    ENABLE_EXTRACTION_CACHE,
+    EXTRACTION_CACHE_MAX_SIZE,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+def get_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk cache of extracted documents, so re-uploading, reprocessing or
+    reindexing a file does not extract the same content again.
+
+    Entries are JSON files named after their key. Reads refresh an entry's
+    modification time, and the least recently used entries are removed once
+    the cache grows past `max_size` bytes.
+    """
+
+    def __init__(self, directory: Path, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+
+    @property
+    def enabled(self) -> bool:
+        return ENABLE_EXTRACTION_CACHE and self.max_size > 0
+
+    def get_key(self, file_path: str, **params) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                [get_file_hash(file_path), params], sort_keys=True, default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[list[Document]]:
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Ignoring unreadable extraction cache entry {key}: {e}")
+            return None
+
+        return [
+            Document(page_content=entry["page_content"], metadata=entry["metadata"])
+            for entry in entries
+        ]
+
+    def set(self, key: str, docs: list[Document]):
+        try:
+            content = json.dumps(
+                [
+                    {"page_content": doc.page_content, "metadata": doc.metadata}
+                    for doc in docs
+                ],
+                default=str,
+            )
+        except Exception as e:
+            log.debug(f"Not caching extraction result: {e}")
+            return
+
+        if len(content) > self.max_size:
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, self.directory / f"{key}.json")
+        except Exception as e:
+            log.warning(f"Failed to write extraction cache entry {key}: {e}")
+            return
+
+        self.prune()
+
+    def prune(self):
+        try:
+            entries = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry)
+                for entry in self.directory.glob("*.json")
+            ]
+        except Exception as e:
+            log.debug(f"Failed to list extraction cache: {e}")
+            return
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            try:
+                entry.unlink()
+                total_size -= size
+            except FileNotFoundError:
+                total_size -= size
+            except Exception as e:
+                log.debug(f"Failed to remove extraction cache entry {entry}: {e}")
+
+
+EXTRACTION_CACHE = ExtractionCache(
+    Path(CACHE_DIR) / "extraction", EXTRACTION_CACHE_MAX_SIZE
+)
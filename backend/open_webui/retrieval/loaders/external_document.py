@@ -5,6 +5,7 @@ from urllib.parse import quote
 
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
+from open_webui.retrieval.loaders.session import get_document_loader_session
 from open_webui.utils.headers import include_user_info_headers
 from open_webui.env import SRC_LOG_LEVELS
 
@@ -30,10 +31,7 @@ class ExternalDocumentLoader(BaseLoader):
 
         self.user = user
 
-    def load(self) -> List[Document]:
-        with open(self.file_path, "rb") as f:
-            data = f.read()
-
+    def _get_request(self) -> tuple[str, dict]:
         headers = {}
         if self.mime_type is not None:
             headers["Content-Type"] = self.mime_type
@@ -53,39 +51,68 @@ class ExternalDocumentLoader(BaseLoader):
         if url.endswith("/"):
             url = url[:-1]
 
+        return f"{url}/process", headers
+
+    def _get_documents(self, response_data) -> List[Document]:
+        if response_data:
+            if isinstance(response_data, dict):
+                return [
+                    Document(
+                        page_content=response_data.get("page_content"),
+                        metadata=response_data.get("metadata"),
+                    )
+                ]
+            elif isinstance(response_data, list):
+                documents = []
+                for document in response_data:
+                    documents.append(
+                        Document(
+                            page_content=document.get("page_content"),
+                            metadata=document.get("metadata"),
+                        )
+                    )
+                return documents
+            else:
+                raise Exception("Error loading document: Unable to parse content")
+
+        else:
+            raise Exception("Error loading document: No content returned")
+
+    def load(self) -> List[Document]:
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+
+        url, headers = self._get_request()
+
         try:
-            response = requests.put(f"{url}/process", data=data, headers=headers)
+            response = requests.put(url, data=data, headers=headers)
         except Exception as e:
             log.error(f"Error connecting to endpoint: {e}")
             raise Exception(f"Error connecting to endpoint: {e}")
 
         if response.ok:
-
-            response_data = response.json()
-            if response_data:
-                if isinstance(response_data, dict):
-                    return [
-                        Document(
-                            page_content=response_data.get("page_content"),
-                            metadata=response_data.get("metadata"),
-                        )
-                    ]
-                elif isinstance(response_data, list):
-                    documents = []
-                    for document in response_data:
-                        documents.append(
-                            Document(
-                                page_content=document.get("page_content"),
-                                metadata=document.get("metadata"),
-                            )
-                        )
-                    return documents
-                else:
-                    raise Exception("Error loading document: Unable to parse content")
-
-            else:
-                raise Exception("Error loading document: No content returned")
+            return self._get_documents(response.json())
         else:
             raise Exception(
                 f"Error loading document: {response.status_code} {response.text}"
             )
+
+    async def aload(self) -> List[Document]:
+        url, headers = self._get_request()
+
+        # The file is streamed to the endpoint instead of being read into memory
+        with open(self.file_path, "rb") as f:
+            try:
+                response = await get_document_loader_session().put(
+                    url, data=f, headers=headers
+                )
+            except Exception as e:
+                log.error(f"Error connecting to endpoint: {e}")
+                raise Exception(f"Error connecting to endpoint: {e}")
+
+        async with response:
+            if response.ok:
+                return self._get_documents(await response.json(content_type=None))
+            else:
+                text = await response.text()
+                raise Exception(f"Error loading document: {response.status} {text}")
@@ -1,8 +1,14 @@
 import requests
+import aiohttp
+import asyncio
 import logging
 import ftfy
 import sys
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from azure.identity import DefaultAzureCredential
 from langchain_community.document_loaders import (
@@ -28,9 +34,16 @@ from open_webui.retrieval.loaders.external_document import ExternalDocumentLoade
 from open_webui.retrieval.loaders.mistral import MistralLoader
 from open_webui.retrieval.loaders.datalab_marker import DatalabMarkerLoader
 from open_webui.retrieval.loaders.mineru import MinerULoader
+from open_webui.retrieval.loaders.cache import EXTRACTION_CACHE
+from open_webui.retrieval.loaders.session import get_document_loader_session
 
 
-from open_webui.env import SRC_LOG_LEVELS, GLOBAL_LOG_LEVEL
+from open_webui.env import (
+    PDF_EXTRACTION_CONCURRENCY,
+    PDF_EXTRACTION_SPLIT_PAGES,
+    SRC_LOG_LEVELS,
+    GLOBAL_LOG_LEVEL,
+)
 
 logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 log = logging.getLogger(__name__)
@@ -98,10 +111,7 @@ class TikaLoader:
 
         self.extract_images = extract_images
 
-    def load(self) -> list[Document]:
-        with open(self.file_path, "rb") as f:
-            data = f.read()
-
+    def _get_request(self) -> tuple[str, dict]:
         if self.mime_type is not None:
             headers = {"Content-Type": self.mime_type}
         else:
@@ -114,22 +124,45 @@ class TikaLoader:
         if not endpoint.endswith("/"):
             endpoint += "/"
         endpoint += "tika/text"
+        return endpoint, headers
 
-        r = requests.put(endpoint, data=data, headers=headers)
+    def _get_documents(self, raw_metadata: dict, headers: dict) -> list[Document]:
+        text = raw_metadata.get("X-TIKA:content", "<No text content found>").strip()
 
-        if r.ok:
-            raw_metadata = r.json()
-            text = raw_metadata.get("X-TIKA:content", "<No text content found>").strip()
+        if "Content-Type" in raw_metadata:
+            headers["Content-Type"] = raw_metadata["Content-Type"]
 
-            if "Content-Type" in raw_metadata:
-                headers["Content-Type"] = raw_metadata["Content-Type"]
+        log.debug("Tika extracted text: %s", text)
 
-            log.debug("Tika extracted text: %s", text)
+        return [Document(page_content=text, metadata=headers)]
 
-            return [Document(page_content=text, metadata=headers)]
+    def load(self) -> list[Document]:
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+
+        endpoint, headers = self._get_request()
+        r = requests.put(endpoint, data=data, headers=headers)
+
+        if r.ok:
+            return self._get_documents(r.json(), headers)
         else:
             raise Exception(f"Error calling Tika: {r.reason}")
 
+    async def aload(self) -> list[Document]:
+        endpoint, headers = self._get_request()
+
+        # The file is streamed to Tika instead of being read into memory
+        with open(self.file_path, "rb") as f:
+            async with get_document_loader_session().put(
+                endpoint, data=f, headers=headers
+            ) as r:
+                if r.ok:
+                    return self._get_documents(
+                        await r.json(content_type=None), headers
+                    )
+                else:
+                    raise Exception(f"Error calling Tika: {r.reason}")
+
 
 class DoclingLoader:
     def __init__(self, url, api_key=None, file_path=None, mime_type=None, params=None):
@@ -140,12 +173,23 @@ class DoclingLoader:
 
         self.params = params or {}
 
+    def _get_headers(self) -> dict:
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _get_documents(self, result: dict) -> list[Document]:
+        document_data = result.get("document", {})
+        text = document_data.get("md_content", "<No text content found>")
+
+        metadata = {"Content-Type": self.mime_type} if self.mime_type else {}
+
+        log.debug("Docling extracted text: %s", text)
+        return [Document(page_content=text, metadata=metadata)]
+
     def load(self) -> list[Document]:
         with open(self.file_path, "rb") as f:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-
             files = {
                 "files": (
                     self.file_path,
@@ -161,17 +205,10 @@ class DoclingLoader:
                     "image_export_mode": "placeholder",
                     **self.params,
                 },
-                headers=headers,
+                headers=self._get_headers(),
             )
         if r.ok:
-            result = r.json()
-            document_data = result.get("document", {})
-            text = document_data.get("md_content", "<No text content found>")
-
-            metadata = {"Content-Type": self.mime_type} if self.mime_type else {}
-
-            log.debug("Docling extracted text: %s", text)
-            return [Document(page_content=text, metadata=metadata)]
+            return self._get_documents(r.json())
         else:
             error_msg = f"Error calling Docling API: {r.reason}"
             if r.text:
@@ -183,6 +220,41 @@ class DoclingLoader:
                     error_msg += f" - {r.text}"
             raise Exception(f"Error calling Docling: {error_msg}")
 
+    async def aload(self) -> list[Document]:
+        form_data = aiohttp.FormData()
+        # Encoded as requests encodes form data: lists as repeated fields
+        for key, value in {"image_export_mode": "placeholder", **self.params}.items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                form_data.add_field(key, str(item))
+
+        # The file is streamed to Docling instead of being read into memory
+        with open(self.file_path, "rb") as f:
+            form_data.add_field(
+                "files",
+                f,
+                filename=self.file_path,
+                content_type=self.mime_type or "application/octet-stream",
+            )
+
+            async with get_document_loader_session().post(
+                f"{self.url}/v1/convert/file",
+                data=form_data,
+                headers=self._get_headers(),
+            ) as r:
+                if r.ok:
+                    return self._get_documents(await r.json(content_type=None))
+
+                error_msg = f"Error calling Docling API: {r.reason}"
+                text = await r.text()
+                if text:
+                    try:
+                        error_data = json.loads(text)
+                        if "detail" in error_data:
+                            error_msg += f" - {error_data['detail']}"
+                    except Exception:
+                        error_msg += f" - {text}"
+                raise Exception(f"Error calling Docling: {error_msg}")
+
 
 class Loader:
     def __init__(self, engine: str = "", **kwargs):
@@ -194,8 +266,77 @@ class Loader:
         self, filename: str, file_content_type: str, file_path: str
     ) -> list[Document]:
         loader = self._get_loader(filename, file_content_type, file_path)
-        docs = loader.load()
 
+        cache_key = self._get_cache_key(loader, filename, file_content_type, file_path)
+        if cache_key:
+            docs = EXTRACTION_CACHE.get(cache_key)
+            if docs is not None:
+                log.info(f"Using cached extraction of {filename}")
+                return docs
+
+        docs = None
+        if self._is_splittable(loader, filename):
+            try:
+                docs = self._load_pdf_parts(filename, file_content_type, file_path)
+            except Exception as e:
+                log.warning(f"Failed to split {filename}, extracting it whole: {e}")
+
+        if docs is None:
+            docs = loader.load()
+
+        docs = self._fix_docs(docs)
+        if cache_key:
+            EXTRACTION_CACHE.set(cache_key, docs)
+        return docs
+
+    async def aload(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> list[Document]:
+        """
+        `load` without holding a thread while waiting on remote extraction
+        engines: loaders with an async variant are awaited, and the others
+        (local parsing) run in a thread.
+        """
+        loader = self._get_loader(filename, file_content_type, file_path)
+
+        cache_key = await asyncio.to_thread(
+            self._get_cache_key, loader, filename, file_content_type, file_path
+        )
+        if cache_key:
+            docs = await asyncio.to_thread(EXTRACTION_CACHE.get, cache_key)
+            if docs is not None:
+                log.info(f"Using cached extraction of {filename}")
+                return docs
+
+        docs = None
+        if self._is_splittable(loader, filename):
+            try:
+                docs = await self._aload_pdf_parts(
+                    filename, file_content_type, file_path
+                )
+            except Exception as e:
+                log.warning(f"Failed to split {filename}, extracting it whole: {e}")
+
+        if docs is None:
+            docs = await self._aload_with(loader)
+
+        docs = await asyncio.to_thread(self._fix_docs, docs)
+        if cache_key:
+            await asyncio.to_thread(EXTRACTION_CACHE.set, cache_key, docs)
+        return docs
+
+    @staticmethod
+    async def _aload_with(loader) -> list[Document]:
+        if isinstance(loader, MistralLoader):
+            return await loader.load_async()
+        if isinstance(
+            loader, (TikaLoader, DoclingLoader, ExternalDocumentLoader, MinerULoader)
+        ):
+            return await loader.aload()
+        return await asyncio.to_thread(loader.load)
+
+    @staticmethod
+    def _fix_docs(docs: list[Document]) -> list[Document]:
         return [
             Document(
                 page_content=ftfy.fix_text(doc.page_content), metadata=doc.metadata
@@ -203,6 +344,150 @@ class Loader:
             for doc in docs
         ]
 
+    def _get_cache_key(
+        self, loader, filename: str, file_content_type: str, file_path: str
+    ) -> Optional[str]:
+        # Local text files are cheaper to read again than to look up
+        if not EXTRACTION_CACHE.enabled or isinstance(loader, TextLoader):
+            return None
+
+        try:
+            return EXTRACTION_CACHE.get_key(
+                file_path,
+                engine=self.engine,
+                loader=type(loader).__name__,
+                file_ext=filename.split(".")[-1].lower(),
+                file_content_type=file_content_type,
+                # Credentials do not change the extracted content
+                kwargs={
+                    key: value
+                    for key, value in self.kwargs.items()
+                    if key != "user" and not key.endswith("_KEY")
+                },
+            )
+        except Exception as e:
+            log.debug(f"Not using extraction cache for {filename}: {e}")
+            return None
+
+    def _is_splittable(self, loader, filename: str) -> bool:
+        """
+        Whether the file is a PDF sent to a remote extraction engine, which
+        takes long enough on large documents to be worth extracting in parts.
+        """
+        if PDF_EXTRACTION_SPLIT_PAGES <= 0 or not filename.lower().endswith(".pdf"):
+            return False
+        if isinstance(loader, MinerULoader) and loader.page_ranges:
+            return False
+        return isinstance(
+            loader,
+            (
+                TikaLoader,
+                DoclingLoader,
+                DatalabMarkerLoader,
+                AzureAIDocumentIntelligenceLoader,
+                MistralLoader,
+                MinerULoader,
+            ),
+        )
+
+    def _split_pdf(
+        self, filename: str, file_path: str, tmp_dir: str
+    ) -> tuple[int, list[tuple[int, str]]]:
+        """
+        Write the parts of `PDF_EXTRACTION_SPLIT_PAGES` pages of a PDF to
+        `tmp_dir`, as (first page, path). No parts if it is too short to split.
+        """
+        from pypdf import PdfReader, PdfWriter
+
+        reader = PdfReader(file_path)
+        total_pages = len(reader.pages)
+
+        parts = []
+        if total_pages > PDF_EXTRACTION_SPLIT_PAGES:
+            for start in range(0, total_pages, PDF_EXTRACTION_SPLIT_PAGES):
+                writer = PdfWriter()
+                for page in reader.pages[start : start + PDF_EXTRACTION_SPLIT_PAGES]:
+                    writer.add_page(page)
+
+                # Keep the original name, some engines use it to detect the type
+                part_path = os.path.join(tmp_dir, str(len(parts)), filename)
+                os.makedirs(os.path.dirname(part_path))
+                with open(part_path, "wb") as f:
+                    writer.write(f)
+                parts.append((start, part_path))
+        return total_pages, parts
+
+    @staticmethod
+    def _offset_pages(
+        docs: list[Document], start: int, total_pages: int
+    ) -> list[Document]:
+        """Map the page metadata of a part's documents back to the whole PDF."""
+        for doc in docs:
+            for key in ("page", "page_label"):
+                if isinstance(doc.metadata.get(key), int):
+                    doc.metadata[key] += start
+            if "total_pages" in doc.metadata:
+                doc.metadata["total_pages"] = total_pages
+        return docs
+
+    def _load_pdf_parts(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> Optional[list[Document]]:
+        """
+        Extract a large PDF in parts, `PDF_EXTRACTION_CONCURRENCY` at a time,
+        and merge the results in page order. Returns None if the PDF is not
+        large enough to split.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            total_pages, parts = self._split_pdf(filename, file_path, tmp_dir)
+            if not parts:
+                return None
+
+            log.info(
+                f"Extracting {filename} ({total_pages} pages) in {len(parts)} parts"
+            )
+
+            def load_part(part):
+                start, part_path = part
+                docs = self._get_loader(filename, file_content_type, part_path).load()
+                return self._offset_pages(docs, start, total_pages)
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, PDF_EXTRACTION_CONCURRENCY)
+            ) as executor:
+                results = list(executor.map(load_part, parts))
+
+        return [doc for docs in results for doc in docs]
+
+    async def _aload_pdf_parts(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> Optional[list[Document]]:
+        """`_load_pdf_parts`, with the parts loaded by `_aload_with`."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            total_pages, parts = await asyncio.to_thread(
+                self._split_pdf, filename, file_path, tmp_dir
+            )
+            if not parts:
+                return None
+
+            log.info(
+                f"Extracting {filename} ({total_pages} pages) in {len(parts)} parts"
+            )
+
+            semaphore = asyncio.Semaphore(max(1, PDF_EXTRACTION_CONCURRENCY))
+
+            async def load_part(part):
+                start, part_path = part
+                async with semaphore:
+                    docs = await self._aload_with(
+                        self._get_loader(filename, file_content_type, part_path)
+                    )
+                return self._offset_pages(docs, start, total_pages)
+
+            results = await asyncio.gather(*[load_part(part) for part in parts])
+
+        return [doc for docs in results for doc in docs]
+
     def _is_text_file(self, file_ext: str, file_content_type: str) -> bool:
         return file_ext in known_source_ext or (
             file_content_type
@@ -1,5 +1,8 @@
+import asyncio
+import json
 import os
 import time
+import aiohttp
 import requests
 import logging
 import tempfile
@@ -8,6 +11,8 @@ from typing import List, Optional
 from langchain_core.documents import Document
 from fastapi import HTTPException, status
 
+from open_webui.retrieval.loaders.session import get_document_loader_session
+
 log = logging.getLogger(__name__)
 
 
@@ -66,15 +71,22 @@ class MinerULoader:
             log.error(f"Error loading document with MinerU: {e}")
             raise
 
-    def _load_local_api(self) -> List[Document]:
+    async def aload(self) -> List[Document]:
         """
-        Load document using Local API (synchronous).
-        Posts file to /file_parse endpoint and gets immediate response.
+        Async variant of `load`, which does not hold a thread while MinerU
+        parses the document: the Local API request is made with aiohttp, and
+        the Cloud API is polled with async sleeps between status requests.
         """
-        log.info(f"Using MinerU Local API at {self.api_url}")
-
-        filename = os.path.basename(self.file_path)
+        try:
+            if self.api_mode == "cloud":
+                return await self._aload_cloud_api()
+            else:
+                return await self._aload_local_api()
+        except Exception as e:
+            log.error(f"Error loading document with MinerU: {e}")
+            raise
 
+    def _get_local_form_data(self) -> dict:
         # Build form data for Local API
         form_data = {
             **self.params,
@@ -89,6 +101,17 @@ class MinerULoader:
                 f"Page ranges '{self.page_ranges}' specified but Local API uses different format. "
                 "Consider using start_page_id/end_page_id parameters if needed."
             )
+        return form_data
+
+    def _load_local_api(self) -> List[Document]:
+        """
+        Load document using Local API (synchronous).
+        Posts file to /file_parse endpoint and gets immediate response.
+        """
+        log.info(f"Using MinerU Local API at {self.api_url}")
+
+        filename = os.path.basename(self.file_path)
+        form_data = self._get_local_form_data()
 
         try:
             with open(self.file_path, "rb") as f:
@@ -138,6 +161,81 @@ class MinerULoader:
                 detail=f"Invalid JSON response from MinerU Local API: {e}",
             )
 
+        return self._get_local_documents(result, filename)
+
+    async def _aload_local_api(self) -> List[Document]:
+        """Async variant of `_load_local_api`, streaming the file upload."""
+        log.info(f"Using MinerU Local API at {self.api_url}")
+
+        filename = os.path.basename(self.file_path)
+        form_data = self._get_local_form_data()
+
+        try:
+            with open(self.file_path, "rb") as f:
+                data = aiohttp.FormData()
+                # Encoded as requests encodes form data: lists as repeated fields
+                for key, value in form_data.items():
+                    for item in value if isinstance(value, (list, tuple)) else [value]:
+                        data.add_field(key, str(item))
+                data.add_field(
+                    "files",
+                    f,
+                    filename=filename,
+                    content_type="application/octet-stream",
+                )
+
+                log.info(f"Sending file to MinerU Local API: {filename}")
+                log.debug(f"Local API parameters: {form_data}")
+
+                async with get_document_loader_session().post(
+                    f"{self.api_url}/file_parse",
+                    data=data,
+                    # 5 minute timeout for large documents
+                    timeout=aiohttp.ClientTimeout(total=300),
+                ) as response:
+                    body = await response.text()
+                    if not response.ok:
+                        error_detail = (
+                            f"MinerU Local API request failed: "
+                            f"{response.status} {response.reason}"
+                        )
+                        try:
+                            error_detail += f" - {json.loads(body)}"
+                        except:
+                            error_detail += f" - {body}"
+                        raise HTTPException(
+                            status.HTTP_400_BAD_REQUEST, detail=error_detail
+                        )
+
+        except HTTPException:
+            raise
+        except FileNotFoundError:
+            raise HTTPException(
+                status.HTTP_404_NOT_FOUND, detail=f"File not found: {self.file_path}"
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="MinerU Local API request timed out",
+            )
+        except Exception as e:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error calling MinerU Local API: {str(e)}",
+            )
+
+        # Parse response
+        try:
+            result = json.loads(body)
+        except ValueError as e:
+            raise HTTPException(
+                status.HTTP_502_BAD_GATEWAY,
+                detail=f"Invalid JSON response from MinerU Local API: {e}",
+            )
+
+        return self._get_local_documents(result, filename)
+
+    def _get_local_documents(self, result: dict, filename: str) -> List[Document]:
         # Extract markdown content from response
         if "results" not in result:
             raise HTTPException(
@@ -197,6 +295,31 @@ class MinerULoader:
             result["full_zip_url"], filename
         )
 
+        return self._get_cloud_documents(markdown_content, filename, batch_id)
+
+    async def _aload_cloud_api(self) -> List[Document]:
+        """
+        Async variant of `_load_cloud_api`. The short requests run in a thread,
+        the wait for MinerU to finish does not.
+        """
+        log.info(f"Using MinerU Cloud API at {self.api_url}")
+
+        filename = os.path.basename(self.file_path)
+
+        batch_id, upload_url = await asyncio.to_thread(
+            self._request_upload_url, filename
+        )
+        await asyncio.to_thread(self._upload_to_presigned_url, upload_url)
+        result = await self._apoll_batch_status(batch_id, filename)
+        markdown_content = await asyncio.to_thread(
+            self._download_and_extract_zip, result["full_zip_url"], filename
+        )
+
+        return self._get_cloud_documents(markdown_content, filename, batch_id)
+
+    def _get_cloud_documents(
+        self, markdown_content: str, filename: str, batch_id: str
+    ) -> List[Document]:
         log.info(f"Successfully parsed document with MinerU Cloud API: {filename}")
 
         # Create metadata
@@ -325,100 +448,126 @@ class MinerULoader:
 
         log.info("File uploaded successfully")
 
+    # 10 minutes max (2 seconds per iteration)
+    poll_max_iterations = 300
+    poll_interval = 2  # seconds
+
     def _poll_batch_status(self, batch_id: str, filename: str) -> dict:
         """
         Poll batch status until completion.
         Returns the result dict for the file.
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
+        log.info(f"Polling batch status: {batch_id}")
+
+        for iteration in range(self.poll_max_iterations):
+            file_result = self._get_batch_result(batch_id, filename)
+            if self._is_batch_done(file_result, filename, iteration):
+                return file_result
+            time.sleep(self.poll_interval)
 
-        max_iterations = 300  # 10 minutes max (2 seconds per iteration)
-        poll_interval = 2  # seconds
+        # Timeout
+        raise HTTPException(
+            status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="MinerU processing timed out after 10 minutes",
+        )
 
+    async def _apoll_batch_status(self, batch_id: str, filename: str) -> dict:
+        """Async variant of `_poll_batch_status`."""
         log.info(f"Polling batch status: {batch_id}")
 
-        for iteration in range(max_iterations):
-            try:
-                response = requests.get(
-                    f"{self.api_url}/extract-results/batch/{batch_id}",
-                    headers=headers,
-                    timeout=30,
-                )
-                response.raise_for_status()
-            except requests.HTTPError as e:
-                error_detail = f"Failed to poll batch status: {e}"
-                if e.response is not None:
-                    try:
-                        error_data = e.response.json()
-                        error_detail += f" - {error_data.get('msg', error_data)}"
-                    except:
-                        error_detail += f" - {e.response.text}"
-                raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=error_detail)
-            except Exception as e:
-                raise HTTPException(
-                    status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Error polling batch status: {str(e)}",
-                )
+        for iteration in range(self.poll_max_iterations):
+            file_result = await asyncio.to_thread(
+                self._get_batch_result, batch_id, filename
+            )
+            if self._is_batch_done(file_result, filename, iteration):
+                return file_result
+            await asyncio.sleep(self.poll_interval)
 
-            try:
-                result = response.json()
-            except ValueError as e:
-                raise HTTPException(
-                    status.HTTP_502_BAD_GATEWAY,
-                    detail=f"Invalid JSON response while polling: {e}",
-                )
+        # Timeout
+        raise HTTPException(
+            status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="MinerU processing timed out after 10 minutes",
+        )
+
+    def _is_batch_done(self, file_result: dict, filename: str, iteration: int) -> bool:
+        state = file_result.get("state")
 
-            # Check for API error response
-            if result.get("code") != 0:
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    detail=f"MinerU Cloud API error: {result.get('msg', 'Unknown error')}",
+        if state == "done":
+            log.info(f"Processing complete for {filename}")
+            return True
+        elif state == "failed":
+            error_msg = file_result.get("err_msg", "Unknown error")
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                detail=f"MinerU processing failed: {error_msg}",
+            )
+        elif state in ["waiting-file", "pending", "running", "converting"]:
+            # Still processing
+            if iteration % 10 == 0:  # Log every 20 seconds
+                log.info(
+                    f"Processing status: {state} (iteration {iteration + 1}/{self.poll_max_iterations})"
                 )
+        else:
+            log.warning(f"Unknown state: {state}")
+        return False
 
-            data = result.get("data", {})
-            extract_result = data.get("extract_result", [])
+    def _get_batch_result(self, batch_id: str, filename: str) -> dict:
+        """
+        Request the batch status once.
+        Returns the result dict for the file, whatever its state.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+        try:
+            response = requests.get(
+                f"{self.api_url}/extract-results/batch/{batch_id}",
+                headers=headers,
+                timeout=30,
+            )
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            error_detail = f"Failed to poll batch status: {e}"
+            if e.response is not None:
+                try:
+                    error_data = e.response.json()
+                    error_detail += f" - {error_data.get('msg', error_data)}"
+                except:
+                    error_detail += f" - {e.response.text}"
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=error_detail)
+        except Exception as e:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error polling batch status: {str(e)}",
+            )
 
-            # Find our file in the batch results
-            file_result = None
-            for item in extract_result:
-                if item.get("file_name") == filename:
-                    file_result = item
-                    break
+        try:
+            result = response.json()
+        except ValueError as e:
+            raise HTTPException(
+                status.HTTP_502_BAD_GATEWAY,
+                detail=f"Invalid JSON response while polling: {e}",
+            )
 
-            if not file_result:
-                raise HTTPException(
-                    status.HTTP_502_BAD_GATEWAY,
-                    detail=f"File {filename} not found in batch results",
-                )
+        # Check for API error response
+        if result.get("code") != 0:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                detail=f"MinerU Cloud API error: {result.get('msg', 'Unknown error')}",
+            )
 
-            state = file_result.get("state")
+        data = result.get("data", {})
+        extract_result = data.get("extract_result", [])
 
-            if state == "done":
-                log.info(f"Processing complete for {filename}")
-                return file_result
-            elif state == "failed":
-                error_msg = file_result.get("err_msg", "Unknown error")
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    detail=f"MinerU processing failed: {error_msg}",
-                )
-            elif state in ["waiting-file", "pending", "running", "converting"]:
-                # Still processing
-                if iteration % 10 == 0:  # Log every 20 seconds
-                    log.info(
-                        f"Processing status: {state} (iteration {iteration + 1}/{max_iterations})"
-                    )
-                time.sleep(poll_interval)
-            else:
-                log.warning(f"Unknown state: {state}")
-                time.sleep(poll_interval)
+        # Find our file in the batch results
+        for item in extract_result:
+            if item.get("file_name") == filename:
+                return item
 
-        # Timeout
         raise HTTPException(
-            status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="MinerU processing timed out after 10 minutes",
+            status.HTTP_502_BAD_GATEWAY,
+            detail=f"File {filename} not found in batch results",
         )
 
     def _download_and_extract_zip(self, zip_url: str, filename: str) -> str:
@@ -0,0 +1,35 @@
+import logging
+from typing import Optional
+
+import aiohttp
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_document_loader_session() -> aiohttp.ClientSession:
+    """
+    Session shared by the async document loaders, so requests to extraction
+    engines reuse pooled connections.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            # Extraction (e.g. OCR of large documents) can take minutes, so only
+            # establishing the connection is bounded, as with the sync loaders
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30),
+            # Proxies from the environment apply, as they do with requests
+            trust_env=True,
+        )
+    return _session
+
+
+async def close_document_loader_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
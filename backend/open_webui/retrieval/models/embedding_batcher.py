@@ -0,0 +1,261 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Union
+
+from open_webui.env import (
+    EMBEDDING_BATCH_MAX_SIZE,
+    EMBEDDING_BATCH_MAX_WAIT_MS,
+    EMBEDDING_INTERACTIVE_MAX_ITEMS,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+
+####################
+# Process execution
+####################
+
+_WORKER_MODEL = None
+
+
+def _load_model_in_process(model_kwargs: dict):
+    global _WORKER_MODEL
+    from sentence_transformers import SentenceTransformer
+
+    _WORKER_MODEL = SentenceTransformer(**model_kwargs)
+
+
+def _encode_in_process(texts: list[str], encode_kwargs: dict):
+    return _WORKER_MODEL.encode(texts, **encode_kwargs)
+
+
+class SentenceTransformerProcess:
+    """
+    Runs a SentenceTransformer in a dedicated worker process, so encoding does
+    not contend for the GIL with the web server. Exposes the `encode` subset
+    used by `get_embedding_function`.
+    """
+
+    def __init__(self, **model_kwargs):
+        self.model_kwargs = model_kwargs
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_load_model_in_process,
+            initargs=(model_kwargs,),
+        )
+        # Load the model now and surface loading errors like SentenceTransformer would
+        self.executor.submit(_encode_in_process, [""], {}).result()
+
+    def encode(self, sentences: Union[str, list[str]], **kwargs):
+        return self.executor.submit(_encode_in_process, sentences, kwargs).result()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+####################
+# Batching
+####################
+
+
+class EmbeddingRequest:
+    def __init__(self, texts: list[str], prefix: Optional[str]):
+        self.texts = texts
+        self.prefix = prefix
+        self.future = Future()
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent `encode` calls for one model into dynamically sized
+    batches, run one at a time on a dedicated thread.
+
+    A batch is dispatched once it holds `max_batch_size` texts or `max_wait_ms`
+    after its first request arrived. Interactive requests (queries) are always
+    dequeued before bulk ones (document ingestion), and bulk requests are split
+    into batch-sized chunks so queries can slip in between them. Results are
+    delivered through concurrent futures, so callers may run on any event loop.
+    """
+
+    def __init__(
+        self,
+        model,
+        max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE,
+        max_wait_ms: float = EMBEDDING_BATCH_MAX_WAIT_MS,
+    ):
+        # Weak, so unloading the model from app state releases it (and stops
+        # this batcher through the finalizer below)
+        self.model_ref = weakref.ref(model)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self.queue = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.thread = threading.Thread(
+            target=self._run, name="embedding-batcher", daemon=True
+        )
+        self.thread.start()
+        weakref.finalize(model, self.close)
+
+    def submit(
+        self,
+        texts: list[str],
+        prefix: Optional[str] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> list[Future]:
+        futures = []
+        for i in range(0, len(texts), self.max_batch_size):
+            request = EmbeddingRequest(texts[i : i + self.max_batch_size], prefix)
+            self.queue.put((priority, next(self.counter), request))
+            futures.append(request.future)
+        return futures
+
+    async def encode(
+        self,
+        texts: Union[str, list[str]],
+        prefix: Optional[str] = None,
+        priority: Optional[int] = None,
+    ) -> list:
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        if not texts:
+            return []
+
+        if priority is None:
+            priority = (
+                PRIORITY_INTERACTIVE
+                if len(texts) <= EMBEDDING_INTERACTIVE_MAX_ITEMS
+                else PRIORITY_BULK
+            )
+
+        results = await asyncio.gather(
+            *[
+                asyncio.wrap_future(future)
+                for future in self.submit(texts, prefix, priority)
+            ]
+        )
+        embeddings = [embedding for result in results for embedding in result]
+        return embeddings[0] if single else embeddings
+
+    def close(self):
+        self.queue.put((-1, next(self.counter), None))
+
+    def _collect(self, first: EmbeddingRequest) -> list[EmbeddingRequest]:
+        batch = [first]
+        size = len(first.texts)
+        deadline = time.monotonic() + self.max_wait
+
+        while size < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = (
+                    self.queue.get(timeout=timeout)
+                    if timeout > 0
+                    else self.queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+
+            priority, _, request = item
+            if request is None or size + len(request.texts) > self.max_batch_size:
+                # Leave it for the next batch
+                self.queue.put(item)
+                break
+
+            batch.append(request)
+            size += len(request.texts)
+
+        return batch
+
+    def _encode(self, batch: list[EmbeddingRequest]):
+        model = self.model_ref()
+        if model is None:
+            for request in batch:
+                request.future.set_exception(Exception("Embedding model unloaded"))
+            return
+
+        # Requests with different prefixes (prompts) cannot share an encode call
+        groups = {}
+        for request in batch:
+            groups.setdefault(request.prefix, []).append(request)
+
+        for prefix, requests in groups.items():
+            texts = [text for request in requests for text in request.texts]
+            try:
+                embeddings = model.encode(
+                    texts,
+                    batch_size=len(texts),
+                    **({"prompt": prefix} if prefix else {}),
+                ).tolist()
+            except Exception as e:
+                log.exception(f"Error generating embeddings: {e}")
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+
+            offset = 0
+            for request in requests:
+                request.future.set_result(
+                    embeddings[offset : offset + len(request.texts)]
+                )
+                offset += len(request.texts)
+
+    def _run(self):
+        while True:
+            _, _, request = self.queue.get()
+            if request is None:
+                break
+
+            batch = self._collect(request)
+            log.debug(
+                f"Embedding batch: {len(batch)} requests, "
+                f"{sum(len(request.texts) for request in batch)} texts"
+            )
+            self._encode(batch)
+
+        # Fail whatever is still queued
+        while True:
+            try:
+                _, _, request = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request.future.set_exception(Exception("Embedding model unloaded"))
+
+
+EMBEDDING_BATCHERS = weakref.WeakKeyDictionary()
+
+
+def get_embedding_batcher(model) -> EmbeddingBatcher:
+    batcher = EMBEDDING_BATCHERS.get(model)
+    if batcher is None:
+        batcher = EmbeddingBatcher(model)
+        EMBEDDING_BATCHERS[model] = batcher
+    return batcher
+
+
+def close_embedding_model(model):
+    """Stop the model's batcher and worker process, if any."""
+    if model is None:
+        return
+
+    batcher = EMBEDDING_BATCHERS.pop(model, None)
+    if batcher is not None:
+        batcher.close()
+
+    if isinstance(model, SentenceTransformerProcess):
+        model.close()
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional
+
+from open_webui.env import (
+    RERANK_BATCH_MAX_WAIT_MS,
+    RERANK_SCORE_CACHE_SIZE,
+    SRC_LOG_LEVELS,
+)
+from open_webui.retrieval.models.base_reranker import BaseReranker
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+def get_text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RerankScoreCache:
+    """LRU cache of relevance scores keyed by (engine, model, query, chunk hash)."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: OrderedDict[tuple, float] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[float]:
+        with self.lock:
+            score = self.entries.get(key)
+            if score is not None:
+                self.entries.move_to_end(key)
+            return score
+
+    def set(self, key: tuple, score: float):
+        if self.max_size <= 0:
+            return
+
+        with self.lock:
+            self.entries[key] = score
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+
+RERANK_SCORE_CACHE = RerankScoreCache(RERANK_SCORE_CACHE_SIZE)
+
+
+class RerankScheduler:
+    """
+    Scores (query, document) pairs for one reranking model off the event loop.
+
+    Pairwise models (CrossEncoder) score each pair independently, so the pairs
+    of all `score` calls arriving within `RERANK_BATCH_MAX_WAIT_MS` (e.g. the
+    multi-query fan-out of one hybrid search) are de-duplicated and scored in
+    a single `predict` call, and their scores are cached. Listwise models
+    (ColBERT normalizes over the candidate set) and external rerankers (one
+    query per request) are called once per query instead.
+    """
+
+    def __init__(self, model, engine: str = "", model_name: str = ""):
+        # Weak, so unloading the model from app state releases it
+        self.model_ref = weakref.ref(model)
+        self.engine = engine
+        self.model_name = model_name
+
+        self.pairwise = engine != "external" and not isinstance(model, BaseReranker)
+        self.cacheable = self.pairwise or engine == "external"
+
+        # Models are not safe to call from several threads at once
+        self.lock = threading.Lock()
+        # event loop -> (pending pairs, future), flushed after the batch window
+        self.pending: dict = {}
+        self.tasks = set()
+
+    def predict(self, pairs: list[tuple[str, str]], user=None) -> list[float]:
+        model = self.model_ref()
+        if model is None:
+            raise Exception("Reranking model unloaded")
+
+        with self.lock:
+            if self.engine == "external":
+                scores = model.predict(pairs, user=user)
+            else:
+                scores = model.predict(pairs)
+
+        if scores is None:
+            raise Exception("Reranking model returned no scores")
+        return scores.tolist() if not isinstance(scores, list) else scores
+
+    async def score(self, query: str, texts: list[str], user=None) -> list[float]:
+        if not texts:
+            return []
+
+        if not self.cacheable:
+            return await asyncio.to_thread(
+                self.predict, [(query, text) for text in texts], user
+            )
+
+        query_hash = get_text_hash(query)
+        keys = [
+            (self.engine, self.model_name, query_hash, get_text_hash(text))
+            for text in texts
+        ]
+
+        scores = {}
+        missing = {}
+        for key, text in zip(keys, texts):
+            score = RERANK_SCORE_CACHE.get(key)
+            if score is not None:
+                scores[key] = score
+            else:
+                missing[key] = (query, text)
+
+        if missing:
+            if self.pairwise:
+                scores.update(await self.score_batched(missing))
+            else:
+                missing_keys = list(missing.keys())
+                results = await asyncio.to_thread(
+                    self.predict, list(missing.values()), user
+                )
+                for key, score in zip(missing_keys, results):
+                    RERANK_SCORE_CACHE.set(key, score)
+                    scores[key] = score
+
+        return [scores[key] for key in keys]
+
+    async def score_batched(self, pairs: dict[tuple, tuple[str, str]]) -> dict:
+        loop = asyncio.get_running_loop()
+
+        batch = self.pending.get(loop)
+        if batch is None:
+            batch = ({}, loop.create_future())
+            self.pending[loop] = batch
+            loop.call_later(RERANK_BATCH_MAX_WAIT_MS / 1000.0, self.start_flush, loop)
+
+        batch[0].update(pairs)
+        results = await asyncio.shield(batch[1])
+        return {key: results[key] for key in pairs}
+
+    def start_flush(self, loop):
+        task = loop.create_task(self.flush(loop))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def flush(self, loop):
+        pairs, future = self.pending.pop(loop)
+
+        keys = list(pairs.keys())
+        log.debug(f"Reranking batch: {len(keys)} unique pairs")
+        try:
+            results = await asyncio.to_thread(
+                self.predict, [pairs[key] for key in keys]
+            )
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting on it
+            future.exception()
+            return
+
+        scores = {}
+        for key, score in zip(keys, results):
+            RERANK_SCORE_CACHE.set(key, score)
+            scores[key] = score
+        future.set_result(scores)
+
+
+RERANK_SCHEDULERS = weakref.WeakKeyDictionary()
+
+
+def get_rerank_scheduler(model, engine: str = "", model_name: str = ""):
+    scheduler = RERANK_SCHEDULERS.get(model)
+    if scheduler is None:
+        scheduler = RerankScheduler(model, engine, model_name)
+        RERANK_SCHEDULERS[model] = scheduler
+    return scheduler
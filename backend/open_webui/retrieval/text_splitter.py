@@ -0,0 +1,180 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from langchain_core.documents import Document
+
+from open_webui.env import (
+    TEXT_SPLITTER_BATCH_SIZE,
+    TEXT_SPLITTER_WORKERS,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+TEXT_SPLITTERS = ("", "character", "token", "markdown_header")
+
+# Headers to split on - covering most common markdown header levels
+HEADERS_TO_SPLIT_ON = [
+    ("#", "Header 1"),
+    ("##", "Header 2"),
+    ("###", "Header 3"),
+    ("####", "Header 4"),
+    ("#####", "Header 5"),
+    ("######", "Header 6"),
+]
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+@lru_cache(maxsize=8)
+def get_text_splitter(
+    splitter: str, chunk_size: int, chunk_overlap: int, encoding_name: str = ""
+):
+    """
+    Splitter for the given settings, shared by all calls (and per worker
+    process), so the tiktoken encoding in particular is only loaded once.
+    """
+    from langchain.text_splitter import (
+        RecursiveCharacterTextSplitter,
+        TokenTextSplitter,
+    )
+
+    if splitter == "token":
+        return TokenTextSplitter(
+            encoding_name=encoding_name,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            add_start_index=True,
+        )
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        add_start_index=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_markdown_splitter():
+    from langchain_text_splitters import MarkdownHeaderTextSplitter
+
+    return MarkdownHeaderTextSplitter(
+        headers_to_split_on=HEADERS_TO_SPLIT_ON,
+        strip_headers=False,  # Keep headers in content for context
+    )
+
+
+def split_documents(
+    docs: list[Document],
+    splitter: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    encoding_name: str = "",
+) -> list[Document]:
+    if splitter in ["", "character", "token"]:
+        return get_text_splitter(
+            splitter, chunk_size, chunk_overlap, encoding_name
+        ).split_documents(docs)
+
+    if splitter == "markdown_header":
+        markdown_splitter = get_markdown_splitter()
+        text_splitter = get_text_splitter("character", chunk_size, chunk_overlap)
+
+        md_split_docs = []
+        for doc in docs:
+            md_header_splits = markdown_splitter.split_text(doc.page_content)
+            md_header_splits = text_splitter.split_documents(md_header_splits)
+
+            # Convert back to Document objects, preserving original metadata
+            for split_chunk in md_header_splits:
+                headings_list = []
+                # Extract header values in order based on HEADERS_TO_SPLIT_ON
+                for _, header_meta_key_name in HEADERS_TO_SPLIT_ON:
+                    if header_meta_key_name in split_chunk.metadata:
+                        headings_list.append(split_chunk.metadata[header_meta_key_name])
+
+                md_split_docs.append(
+                    Document(
+                        page_content=split_chunk.page_content,
+                        metadata={**doc.metadata, "headings": headings_list},
+                    )
+                )
+        return md_split_docs
+
+    raise ValueError(f"Invalid text splitter: {splitter}")
+
+
+def get_splitter_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=TEXT_SPLITTER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_splitter_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def get_batches(docs: list[Document]) -> list[list[Document]]:
+    """Group consecutive documents (e.g. pages) into batches to split."""
+    batches = []
+    batch = []
+    batch_size = 0
+    for doc in docs:
+        batch.append(doc)
+        batch_size += len(doc.page_content)
+        if batch_size >= TEXT_SPLITTER_BATCH_SIZE:
+            batches.append(batch)
+            batch = []
+            batch_size = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def iter_split_documents(
+    docs: list[Document],
+    splitter: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    encoding_name: str = "",
+) -> Iterator[list[Document]]:
+    """
+    Split documents in batches, yielding the chunks of each batch in order as
+    soon as it is split, so they can be embedded while later batches are still
+    being split. When the documents make up more than one batch, every batch
+    is split in the worker processes (unless TEXT_SPLITTER_WORKERS is 0); a
+    single batch is split in this process.
+    """
+    batches = get_batches(docs)
+    kwargs = {
+        "splitter": splitter,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "encoding_name": encoding_name,
+    }
+
+    if len(batches) <= 1 or TEXT_SPLITTER_WORKERS <= 0:
+        for batch in batches:
+            yield split_documents(batch, **kwargs)
+        return
+
+    log.debug(f"Splitting {len(docs)} documents in {len(batches)} batches")
+    pool = get_splitter_pool()
+    futures = [pool.submit(split_documents, batch, **kwargs) for batch in batches]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        # Stopped early (e.g. on error), the remaining batches are not needed
+        for future in futures:
+            future.cancel()
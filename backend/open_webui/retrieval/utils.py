@@ -1,3 +1,4 @@
+import inspect
 import logging
 import os
 from typing import Awaitable, Optional, Union
@@ -40,6 +41,7 @@ from open_webui.env import (
     SRC_LOG_LEVELS,
     OFFLINE_MODE,
     ENABLE_FORWARD_USER_INFO_HEADERS,
+    ENABLE_EMBEDDING_BATCHING,
 )
 from open_webui.config import (
     RAG_EMBEDDING_QUERY_PREFIX,
@@ -785,6 +787,18 @@ def get_embedding_function(
     enable_async=True,
 ) -> Awaitable:
     if embedding_engine == "":
+        if ENABLE_EMBEDDING_BATCHING and embedding_function is not None:
+            from open_webui.retrieval.models.embedding_batcher import (
+                get_embedding_batcher,
+            )
+
+            batcher = get_embedding_batcher(embedding_function)
+
+            async def async_embedding_function(query, prefix=None, user=None):
+                return await batcher.encode(query, prefix=prefix)
+
+            return async_embedding_function
+
         # Sentence transformers: CPU-bound sync operation
         async def async_embedding_function(query, prefix=None, user=None):
             return await asyncio.to_thread(
@@ -907,15 +921,21 @@ async def generate_embeddings(
 def get_reranking_function(reranking_engine, reranking_model, reranking_function):
     if reranking_function is None:
         return None
-    if reranking_engine == "external":
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents], user=user
-        )
-    else:
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents]
+
+    from open_webui.retrieval.models.rerank_scheduler import get_rerank_scheduler
+
+    scheduler = get_rerank_scheduler(
+        reranking_function, reranking_engine, reranking_model
+    )
+
+    # Scored off the event loop, batched and cached by the scheduler
+    async def async_reranking_function(query, documents, user=None):
+        return await scheduler.score(
+            query, [doc.page_content for doc in documents], user=user
         )
 
+    return async_reranking_function
+
 
 async def get_sources_from_items(
     request,
@@ -1286,6 +1306,8 @@ class RerankCompressor(BaseDocumentCompressor):
         scores = None
         if reranking:
             scores = self.reranking_function(query, documents)
+            if inspect.isawaitable(scores):
+                scores = await scores
         else:
             from sentence_transformers import util
 
@@ -61,42 +61,86 @@ class ChromaClient(VectorDBBase):
                 database=CHROMA_DATABASE,
             )
 
+    def _get_collection(self, collection_name: str):
+        # Get the collection handle, reusing it across calls. Raises if the
+        # collection does not exist, like `get_collection`.
+        cached = self._get_cached_collection(collection_name)
+        if cached is not None and cached[1] is not None:
+            return cached[1]
+
+        collection = self.client.get_collection(name=collection_name)
+        self._set_cached_collection(collection_name, True, collection)
+        return collection
+
+    def _get_or_create_collection(self, collection_name: str):
+        cached = self._get_cached_collection(collection_name)
+        if cached is not None and cached[1] is not None:
+            return cached[1]
+
+        collection = self.client.get_or_create_collection(
+            name=collection_name, metadata={"hnsw:space": "cosine"}
+        )
+        self._set_cached_collection(collection_name, True, collection)
+        return collection
+
+    def _with_collection(self, collection_name: str, func, create: bool = False):
+        # Call `func` with the collection handle. A cached handle is stale if
+        # the collection was deleted (and recreated) elsewhere, so on failure
+        # the cache entry is dropped and `func` retried once with a fresh one.
+        get_collection = (
+            self._get_or_create_collection if create else self._get_collection
+        )
+
+        cached = self._get_cached_collection(collection_name)
+        try:
+            return func(get_collection(collection_name))
+        except Exception:
+            self._invalidate_cached_collection(collection_name)
+            if cached is None or cached[1] is None:
+                raise
+        return func(get_collection(collection_name))
+
     def has_collection(self, collection_name: str) -> bool:
         # Check if the collection exists based on the collection name.
-        collection_names = self.client.list_collections()
-        return collection_name in collection_names
+        try:
+            return self._get_collection(collection_name) is not None
+        except Exception:
+            return False
 
     def delete_collection(self, collection_name: str):
         # Delete the collection based on the collection name.
-        return self.client.delete_collection(name=collection_name)
+        self._invalidate_cached_collection(collection_name)
+        result = self.client.delete_collection(name=collection_name)
+        self._invalidate_cached_collection(collection_name)
+        return result
 
     def search(
         self, collection_name: str, vectors: list[list[float | int]], limit: int
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
         try:
-            collection = self.client.get_collection(name=collection_name)
-            if collection:
-                result = collection.query(
+            result = self._with_collection(
+                collection_name,
+                lambda collection: collection.query(
                     query_embeddings=vectors,
                     n_results=limit,
-                )
-
-                # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
-                # https://docs.trychroma.com/docs/collections/configure cosine equation
-                distances: list = result["distances"][0]
-                distances = [2 - dist for dist in distances]
-                distances = [[dist / 2 for dist in distances]]
-
-                return SearchResult(
-                    **{
-                        "ids": result["ids"],
-                        "distances": distances,
-                        "documents": result["documents"],
-                        "metadatas": result["metadatas"],
-                    }
-                )
-            return None
+                ),
+            )
+
+            # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
+            # https://docs.trychroma.com/docs/collections/configure cosine equation
+            distances: list = result["distances"][0]
+            distances = [2 - dist for dist in distances]
+            distances = [[dist / 2 for dist in distances]]
+
+            return SearchResult(
+                **{
+                    "ids": result["ids"],
+                    "distances": distances,
+                    "documents": result["documents"],
+                    "metadatas": result["metadatas"],
+                }
+            )
         except Exception as e:
             return None
 
@@ -105,29 +149,14 @@ class ChromaClient(VectorDBBase):
     ) -> Optional[GetResult]:
         # Query the items from the collection based on the filter.
         try:
-            collection = self.client.get_collection(name=collection_name)
-            if collection:
-                result = collection.get(
+            result = self._with_collection(
+                collection_name,
+                lambda collection: collection.get(
                     where=filter,
                     limit=limit,
-                )
-
-                return GetResult(
-                    **{
-                        "ids": [result["ids"]],
-                        "documents": [result["documents"]],
-                        "metadatas": [result["metadatas"]],
-                    }
-                )
-            return None
-        except:
-            return None
+                ),
+            )
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
-        # Get all the items in the collection.
-        collection = self.client.get_collection(name=collection_name)
-        if collection:
-            result = collection.get()
             return GetResult(
                 **{
                     "ids": [result["ids"]],
@@ -135,41 +164,54 @@ class ChromaClient(VectorDBBase):
                     "metadatas": [result["metadatas"]],
                 }
             )
-        return None
+        except:
+            return None
 
-    def insert(self, collection_name: str, items: list[VectorItem]):
-        # Insert the items into the collection, if the collection does not exist, it will be created.
-        collection = self.client.get_or_create_collection(
-            name=collection_name, metadata={"hnsw:space": "cosine"}
+    def get(self, collection_name: str) -> Optional[GetResult]:
+        # Get all the items in the collection.
+        result = self._with_collection(
+            collection_name, lambda collection: collection.get()
+        )
+        return GetResult(
+            **{
+                "ids": [result["ids"]],
+                "documents": [result["documents"]],
+                "metadatas": [result["metadatas"]],
+            }
         )
 
+    def insert(self, collection_name: str, items: list[VectorItem]):
+        # Insert the items into the collection, if the collection does not exist, it will be created.
         ids = [item["id"] for item in items]
         documents = [item["text"] for item in items]
         embeddings = [item["vector"] for item in items]
         metadatas = [process_metadata(item["metadata"]) for item in items]
 
-        for batch in create_batches(
-            api=self.client,
-            documents=documents,
-            embeddings=embeddings,
-            ids=ids,
-            metadatas=metadatas,
-        ):
-            collection.add(*batch)
+        def add(collection):
+            for batch in create_batches(
+                api=self.client,
+                documents=documents,
+                embeddings=embeddings,
+                ids=ids,
+                metadatas=metadatas,
+            ):
+                collection.add(*batch)
+
+        self._with_collection(collection_name, add, create=True)
 
     def upsert(self, collection_name: str, items: list[VectorItem]):
         # Update the items in the collection, if the items are not present, insert them. If the collection does not exist, it will be created.
-        collection = self.client.get_or_create_collection(
-            name=collection_name, metadata={"hnsw:space": "cosine"}
-        )
-
         ids = [item["id"] for item in items]
         documents = [item["text"] for item in items]
         embeddings = [item["vector"] for item in items]
         metadatas = [process_metadata(item["metadata"]) for item in items]
 
-        collection.upsert(
-            ids=ids, documents=documents, embeddings=embeddings, metadatas=metadatas
+        self._with_collection(
+            collection_name,
+            lambda collection: collection.upsert(
+                ids=ids, documents=documents, embeddings=embeddings, metadatas=metadatas
+            ),
+            create=True,
         )
 
     def delete(
@@ -179,13 +221,14 @@ class ChromaClient(VectorDBBase):
         filter: Optional[dict] = None,
     ):
         # Delete the items from the collection based on the ids.
+        def delete(collection):
+            if ids:
+                collection.delete(ids=ids)
+            elif filter:
+                collection.delete(where=filter)
+
         try:
-            collection = self.client.get_collection(name=collection_name)
-            if collection:
-                if ids:
-                    collection.delete(ids=ids)
-                elif filter:
-                    collection.delete(where=filter)
+            self._with_collection(collection_name, delete)
         except Exception as e:
             # If collection doesn't exist, that's fine - nothing to delete
             log.debug(
@@ -195,4 +238,5 @@ class ChromaClient(VectorDBBase):
 
     def reset(self):
         # Resets the database. This will delete all collections and item entries.
+        self._invalidate_cached_collection()
         return self.client.reset()
@@ -19,6 +19,7 @@ from open_webui.config import (
     ELASTICSEARCH_CLOUD_ID,
     ELASTICSEARCH_INDEX_PREFIX,
     SSL_ASSERT_FINGERPRINT,
+    ELASTICSEARCH_KNN_NUM_CANDIDATES,
 )
 
 
@@ -80,25 +81,55 @@ class ElasticsearchClient(VectorDBBase):
         return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
 
     # Status: works
-    def _result_to_search_result(self, result) -> SearchResult:
+    def _result_to_search_result(self, results: list) -> SearchResult:
         ids = []
         distances = []
         documents = []
         metadatas = []
 
-        for hit in result["hits"]["hits"]:
-            ids.append(hit["_id"])
-            distances.append(hit["_score"])
-            documents.append(hit["_source"].get("text"))
-            metadatas.append(hit["_source"].get("metadata"))
+        for result in results:
+            hits = result["hits"]["hits"]
+            ids.append([hit["_id"] for hit in hits])
+            distances.append([hit["_score"] for hit in hits])
+            documents.append([hit["_source"].get("text") for hit in hits])
+            metadatas.append([hit["_source"].get("metadata") for hit in hits])
 
         return SearchResult(
-            ids=[ids],
-            distances=[distances],
-            documents=[documents],
-            metadatas=[metadatas],
+            ids=ids,
+            distances=distances,
+            documents=documents,
+            metadatas=metadatas,
         )
 
+    def _get_filter_clauses(
+        self, collection_name: str, filter: Optional[dict] = None
+    ) -> list[dict]:
+        return [{"term": {"collection": collection_name}}] + [
+            {"term": {f"metadata.{field}": value}}
+            for field, value in (filter or {}).items()
+        ]
+
+    def _get_knn_query(
+        self,
+        collection_name: str,
+        vector: list[float],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict:
+        # Approximate (HNSW) kNN, pre-filtered to the collection. The cosine
+        # similarity score is already normalized to [0, 1].
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "knn": {
+                "field": "vector",
+                "query_vector": vector,
+                "k": limit,
+                "num_candidates": max(ELASTICSEARCH_KNN_NUM_CANDIDATES, limit),
+                "filter": self._get_filter_clauses(collection_name, filter),
+            },
+        }
+
     # Status: works
     def _create_index(self, dimension: int):
         body = {
@@ -126,6 +157,7 @@ class ElasticsearchClient(VectorDBBase):
             }
         }
         self.client.indices.create(index=self._get_index_name(dimension), body=body)
+        self._set_cached_collection(self._get_index_name(dimension), True)
 
     # Status: works
 
@@ -140,44 +172,56 @@ class ElasticsearchClient(VectorDBBase):
             {"term": {"collection": collection_name}}
         )
 
-        try:
-            result = self.client.count(index=f"{self.index_prefix}*", body=query_body)
+        def lookup():
+            try:
+                result = self.client.count(
+                    index=f"{self.index_prefix}*", body=query_body
+                )
 
-            return result.body["count"] > 0
-        except Exception as e:
-            return None
+                return result.body["count"] > 0
+            except Exception as e:
+                return None
+
+        return self._has_collection_cached(collection_name, lookup)
 
     def delete_collection(self, collection_name: str):
+        self._invalidate_cached_collection(collection_name)
         query = {"query": {"term": {"collection": collection_name}}}
         self.client.delete_by_query(index=f"{self.index_prefix}*", body=query)
+        self._invalidate_cached_collection(collection_name)
 
     # Status: works
     def search(
-        self, collection_name: str, vectors: list[list[float]], limit: int
+        self,
+        collection_name: str,
+        vectors: list[list[float]],
+        limit: int,
+        filter: Optional[dict] = None,
     ) -> Optional[SearchResult]:
-        query = {
-            "size": limit,
-            "_source": ["text", "metadata"],
-            "query": {
-                "script_score": {
-                    "query": {
-                        "bool": {"filter": [{"term": {"collection": collection_name}}]}
-                    },
-                    "script": {
-                        "source": "cosineSimilarity(params.vector, 'vector') + 1.0",
-                        "params": {
-                            "vector": vectors[0]
-                        },  # Assuming single query vector
-                    },
-                }
-            },
-        }
-
-        result = self.client.search(
-            index=self._get_index_name(len(vectors[0])), body=query
-        )
+        index_name = self._get_index_name(len(vectors[0]))
+        if len(vectors) == 1:
+            results = [
+                self.client.search(
+                    index=index_name,
+                    body=self._get_knn_query(
+                        collection_name, vectors[0], limit, filter
+                    ),
+                )
+            ]
+        else:
+            # One round trip for all query vectors
+            body = []
+            for vector in vectors:
+                body.append({"index": index_name})
+                body.append(self._get_knn_query(collection_name, vector, limit, filter))
+
+            responses = self.client.msearch(body=body)["responses"]
+            results = [
+                response if "error" not in response else {"hits": {"hits": []}}
+                for response in responses
+            ]
 
-        return self._result_to_search_result(result)
+        return self._result_to_search_result(results)
 
     # Status: only tested halfwat
     def query(
@@ -212,8 +256,11 @@ class ElasticsearchClient(VectorDBBase):
 
     # Status: works
     def _has_index(self, dimension: int):
-        return self.client.indices.exists(
-            index=self._get_index_name(dimension=dimension)
+        # Indexes are shared by all collections of a dimension, cache them
+        # under their index name
+        index_name = self._get_index_name(dimension=dimension)
+        return self._has_collection_cached(
+            index_name, lambda: self.client.indices.exists(index=index_name)
         )
 
     def get_or_create_index(self, dimension: int):
@@ -251,6 +298,7 @@ class ElasticsearchClient(VectorDBBase):
                 for item in batch
             ]
             bulk(self.client, actions)
+        self._set_cached_collection(collection_name, True)
 
     # Upsert documents using the update API with doc_as_upsert=True.
     def upsert(self, collection_name: str, items: list[VectorItem]):
@@ -273,6 +321,7 @@ class ElasticsearchClient(VectorDBBase):
                 for item in batch
             ]
             bulk(self.client, actions)
+        self._set_cached_collection(collection_name, True)
 
     # Delete specific documents from a collection by filtering on both collection and document IDs.
     def delete(
@@ -295,8 +344,11 @@ class ElasticsearchClient(VectorDBBase):
                 )
 
         self.client.delete_by_query(index=f"{self.index_prefix}*", body=query)
+        # The collection may be empty (i.e. gone) now
+        self._invalidate_cached_collection(collection_name)
 
     def reset(self):
+        self._invalidate_cached_collection()
         indices = self.client.indices.get(index=f"{self.index_prefix}*")
         for index in indices:
             self.client.indices.delete(index=index)
@@ -1,3 +1,5 @@
+import math
+
 from opensearchpy import OpenSearch
 from opensearchpy.helpers import bulk
 from typing import Optional
@@ -15,6 +17,7 @@ from open_webui.config import (
     OPENSEARCH_CERT_VERIFY,
     OPENSEARCH_USERNAME,
     OPENSEARCH_PASSWORD,
+    OPENSEARCH_KNN_EF_SEARCH,
 )
 
 
@@ -46,28 +49,71 @@ class OpenSearchClient(VectorDBBase):
 
         return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
 
-    def _result_to_search_result(self, result) -> SearchResult:
-        if not result["hits"]["hits"]:
-            return None
-
+    def _result_to_search_result(self, results: list) -> SearchResult:
         ids = []
         distances = []
         documents = []
         metadatas = []
 
-        for hit in result["hits"]["hits"]:
-            ids.append(hit["_id"])
-            distances.append(hit["_score"])
-            documents.append(hit["_source"].get("text"))
-            metadatas.append(hit["_source"].get("metadata"))
+        for result in results:
+            hits = result["hits"]["hits"]
+            ids.append([hit["_id"] for hit in hits])
+            distances.append([self._normalize_score(hit["_score"]) for hit in hits])
+            documents.append([hit["_source"].get("text") for hit in hits])
+            metadatas.append([hit["_source"].get("metadata") for hit in hits])
+
+        if not any(ids):
+            return None
 
         return SearchResult(
-            ids=[ids],
-            distances=[distances],
-            documents=[documents],
-            metadatas=[metadatas],
+            ids=ids,
+            distances=distances,
+            documents=documents,
+            metadatas=metadatas,
         )
 
+    def _normalize_score(self, score: float) -> float:
+        # The faiss innerproduct space scores 1 + ip for ip >= 0, 1 / (1 - ip)
+        # otherwise. Map it back to the inner product (the cosine similarity,
+        # as vectors are normalized) and then to [0, 1]. Clamped, as vectors
+        # indexed before normalization was added may not be unit length.
+        ip = score - 1.0 if score >= 1.0 else 1.0 - 1.0 / score
+        return min(1.0, max(0.0, (ip + 1.0) / 2.0))
+
+    def _normalize_vector(self, vector: list[float | int]) -> list[float]:
+        # Inner product only ranks like cosine similarity for unit vectors, and
+        # not all embedding models return normalized embeddings
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0:
+            return vector
+        return [value / norm for value in vector]
+
+    def _get_filter_clauses(self, filter: Optional[dict]) -> list[dict]:
+        return [
+            {"term": {"metadata." + str(field) + ".keyword": value}}
+            for field, value in (filter or {}).items()
+        ]
+
+    def _get_knn_query(
+        self, vector: list[float | int], limit: int, filter: Optional[dict] = None
+    ) -> dict:
+        knn = {"vector": self._normalize_vector(vector), "k": limit}
+        if OPENSEARCH_KNN_EF_SEARCH:
+            knn["method_parameters"] = {
+                "ef_search": max(OPENSEARCH_KNN_EF_SEARCH, limit)
+            }
+
+        filter_clauses = self._get_filter_clauses(filter)
+        if filter_clauses:
+            # Efficient (pre-)filtering during the HNSW traversal
+            knn["filter"] = {"bool": {"filter": filter_clauses}}
+
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "query": {"knn": {"vector": knn}},
+        }
+
     def _create_index(self, collection_name: str, dimension: int):
         body = {
             "settings": {"index": {"knn": True}},
@@ -97,6 +143,7 @@ class OpenSearchClient(VectorDBBase):
         self.client.indices.create(
             index=self._get_index_name(collection_name), body=body
         )
+        self._set_cached_collection(collection_name, True)
 
     def _create_batches(self, items: list[VectorItem], batch_size=100):
         for i in range(0, len(items), batch_size):
@@ -105,42 +152,53 @@ class OpenSearchClient(VectorDBBase):
     def has_collection(self, collection_name: str) -> bool:
         # has_collection here means has index.
         # We are simply adapting to the norms of the other DBs.
-        return self.client.indices.exists(index=self._get_index_name(collection_name))
+        return self._has_collection_cached(
+            collection_name,
+            lambda: self.client.indices.exists(
+                index=self._get_index_name(collection_name)
+            ),
+        )
 
     def delete_collection(self, collection_name: str):
         # delete_collection here means delete index.
         # We are simply adapting to the norms of the other DBs.
+        self._invalidate_cached_collection(collection_name)
         self.client.indices.delete(index=self._get_index_name(collection_name))
+        self._invalidate_cached_collection(collection_name)
 
     def search(
-        self, collection_name: str, vectors: list[list[float | int]], limit: int
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
     ) -> Optional[SearchResult]:
         try:
             if not self.has_collection(collection_name):
                 return None
 
-            query = {
-                "size": limit,
-                "_source": ["text", "metadata"],
-                "query": {
-                    "script_score": {
-                        "query": {"match_all": {}},
-                        "script": {
-                            "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
-                            "params": {
-                                "field": "vector",
-                                "query_value": vectors[0],
-                            },  # Assuming single query vector
-                        },
-                    }
-                },
-            }
-
-            result = self.client.search(
-                index=self._get_index_name(collection_name), body=query
-            )
-
-            return self._result_to_search_result(result)
+            index_name = self._get_index_name(collection_name)
+            if len(vectors) == 1:
+                results = [
+                    self.client.search(
+                        index=index_name,
+                        body=self._get_knn_query(vectors[0], limit, filter),
+                    )
+                ]
+            else:
+                # One round trip for all query vectors
+                body = []
+                for vector in vectors:
+                    body.append({"index": index_name})
+                    body.append(self._get_knn_query(vector, limit, filter))
+
+                responses = self.client.msearch(body=body)["responses"]
+                results = [
+                    response if "error" not in response else {"hits": {"hits": []}}
+                    for response in responses
+                ]
+
+            return self._result_to_search_result(results)
 
         except Exception as e:
             return None
@@ -156,10 +214,7 @@ class OpenSearchClient(VectorDBBase):
             "_source": ["text", "metadata"],
         }
 
-        for field, value in filter.items():
-            query_body["query"]["bool"]["filter"].append(
-                {"term": {"metadata." + str(field) + ".keyword": value}}
-            )
+        query_body["query"]["bool"]["filter"].extend(self._get_filter_clauses(filter))
 
         size = limit if limit else 10000
 
@@ -176,7 +231,12 @@ class OpenSearchClient(VectorDBBase):
             return None
 
     def _create_index_if_not_exists(self, collection_name: str, dimension: int):
-        if not self.has_collection(collection_name):
+        # Checked against the cluster rather than the collection cache: if the
+        # index was deleted elsewhere, bulk writes would auto-create it with a
+        # dynamic mapping that knn search does not work on
+        if self.client.indices.exists(index=self._get_index_name(collection_name)):
+            self._set_cached_collection(collection_name, True)
+        else:
             self._create_index(collection_name, dimension)
 
     def get(self, collection_name: str) -> Optional[GetResult]:
@@ -199,7 +259,7 @@ class OpenSearchClient(VectorDBBase):
                     "_index": self._get_index_name(collection_name),
                     "_id": item["id"],
                     "_source": {
-                        "vector": item["vector"],
+                        "vector": self._normalize_vector(item["vector"]),
                         "text": item["text"],
                         "metadata": process_metadata(item["metadata"]),
                     },
@@ -221,7 +281,7 @@ class OpenSearchClient(VectorDBBase):
                     "_index": self._get_index_name(collection_name),
                     "_id": item["id"],
                     "doc": {
-                        "vector": item["vector"],
+                        "vector": self._normalize_vector(item["vector"]),
                         "text": item["text"],
                         "metadata": process_metadata(item["metadata"]),
                     },
@@ -262,6 +322,7 @@ class OpenSearchClient(VectorDBBase):
         self.client.indices.refresh(self._get_index_name(collection_name))
 
     def reset(self):
+        self._invalidate_cached_collection()
         indices = self.client.indices.get(index=f"{self.index_prefix}_*")
         for index in indices:
             self.client.indices.delete(index=index)
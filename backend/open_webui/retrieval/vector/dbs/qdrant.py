@@ -153,18 +153,28 @@ class QdrantClient(VectorDBBase):
         if limit is None:
             limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
 
-        query_response = self.client.query_points(
-            collection_name=f"{self.collection_prefix}_{collection_name}",
-            query=vectors[0],
-            limit=limit,
+        # One request per query vector, sent concurrently
+        query_responses = self._map_concurrently(
+            lambda vector: self.client.query_points(
+                collection_name=f"{self.collection_prefix}_{collection_name}",
+                query=vector,
+                limit=limit,
+            ),
+            vectors,
         )
-        get_result = self._result_to_get_result(query_response.points)
+        get_results = [
+            self._result_to_get_result(query_response.points)
+            for query_response in query_responses
+        ]
         return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
+            ids=[get_result.ids[0] for get_result in get_results],
+            documents=[get_result.documents[0] for get_result in get_results],
+            metadatas=[get_result.metadatas[0] for get_result in get_results],
             # qdrant distance is [-1, 1], normalize to [0, 1]
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            distances=[
+                [(point.score + 1.0) / 2.0 for point in query_response.points]
+                for query_response in query_responses
+            ],
         )
 
     def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
@@ -269,18 +269,28 @@ class QdrantClient(VectorDBBase):
             return None
 
         tenant_filter = _tenant_filter(tenant_id)
-        query_response = self.client.query_points(
-            collection_name=mt_collection,
-            query=vectors[0],
-            limit=limit,
-            query_filter=models.Filter(must=[tenant_filter]),
+        # One request per query vector, sent concurrently
+        query_responses = self._map_concurrently(
+            lambda vector: self.client.query_points(
+                collection_name=mt_collection,
+                query=vector,
+                limit=limit,
+                query_filter=models.Filter(must=[tenant_filter]),
+            ),
+            vectors,
         )
-        get_result = self._result_to_get_result(query_response.points)
+        get_results = [
+            self._result_to_get_result(query_response.points)
+            for query_response in query_responses
+        ]
         return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            ids=[get_result.ids[0] for get_result in get_results],
+            documents=[get_result.documents[0] for get_result in get_results],
+            metadatas=[get_result.metadatas[0] for get_result in get_results],
+            distances=[
+                [(point.score + 1.0) / 2.0 for point in query_response.points]
+                for query_response in query_responses
+            ],
         )
 
     def query(
@@ -5,11 +5,16 @@ from open_webui.retrieval.vector.main import (
     GetResult,
     SearchResult,
 )
-from open_webui.config import S3_VECTOR_BUCKET_NAME, S3_VECTOR_REGION
+from open_webui.config import (
+    S3_VECTOR_BUCKET_NAME,
+    S3_VECTOR_REGION,
+    VECTOR_DB_QUERY_CONCURRENCY,
+)
 from open_webui.env import SRC_LOG_LEVELS
 from typing import List, Optional, Dict, Any, Union
 import logging
 import boto3
+import numpy as np
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["RAG"])
@@ -64,6 +69,7 @@ class S3VectorClient(VectorDBBase):
                 dimension=dimension,
                 distanceMetric=distance_metric,
             )
+            self._set_cached_collection(index_name, True)
             log.info(
                 f"Created S3 index: {index_name} (dim={dimension}, type={data_type}, metric={distance_metric})"
             )
@@ -120,14 +126,18 @@ class S3VectorClient(VectorDBBase):
         Check if a vector index exists using direct lookup.
         This avoids pagination issues with list_indexes() and is significantly faster.
         """
-        try:
-            self.client.get_index(
-                vectorBucketName=self.bucket_name, indexName=collection_name
-            )
-            return True
-        except Exception as e:
-            log.error(f"Error checking if index '{collection_name}' exists: {e}")
-            return False
+
+        def lookup():
+            try:
+                self.client.get_index(
+                    vectorBucketName=self.bucket_name, indexName=collection_name
+                )
+                return True
+            except Exception as e:
+                log.error(f"Error checking if index '{collection_name}' exists: {e}")
+                return False
+
+        return self._has_collection_cached(collection_name, lookup)
 
     def delete_collection(self, collection_name: str) -> None:
         """
@@ -142,9 +152,11 @@ class S3VectorClient(VectorDBBase):
 
         try:
             log.info(f"Deleting collection '{collection_name}'")
+            self._invalidate_cached_collection(collection_name)
             self.client.delete_index(
                 vectorBucketName=self.bucket_name, indexName=collection_name
             )
+            self._invalidate_cached_collection(collection_name)
             log.info(f"Successfully deleted collection '{collection_name}'")
         except Exception as e:
             log.error(f"Error deleting collection '{collection_name}': {e}")
@@ -296,11 +308,76 @@ class S3VectorClient(VectorDBBase):
             log.error(f"Error upserting vectors: {e}")
             raise
 
+    def _query_vector(
+        self,
+        collection_name: str,
+        query_vector: List[Union[float, int]],
+        limit: int,
+        filter: Optional[Dict] = None,
+    ) -> tuple:
+        """
+        Run a single vector query. Returns (ids, documents, metadatas, distances).
+        """
+        params = {
+            "vectorBucketName": self.bucket_name,
+            "indexName": collection_name,
+            "topK": limit,
+            # Marshal through numpy instead of converting element by element
+            "queryVector": {
+                "float32": np.asarray(query_vector, dtype=np.float32).tolist()
+            },
+            "returnMetadata": True,
+            "returnDistance": True,
+        }
+        if filter:
+            # Metadata filtering is done by the service
+            params["filter"] = filter
+
+        response = self.client.query_vectors(**params)
+
+        # Process results for this query
+        query_ids = []
+        query_documents = []
+        query_metadatas = []
+        query_distances = []
+
+        for vector in response.get("vectors", []):
+            vector_id = vector.get("key")
+            vector_metadata = vector.get("metadata", {})
+            vector_distance = vector.get("distance", 0.0)
+
+            # Extract document text from metadata
+            document_text = ""
+            if isinstance(vector_metadata, dict):
+                # Get the text field first (highest priority)
+                document_text = vector_metadata.get("text")
+                if not document_text:
+                    # Fallback to other possible text fields
+                    document_text = (
+                        vector_metadata.get("content")
+                        or vector_metadata.get("document")
+                        or vector_id
+                    )
+            else:
+                document_text = vector_id
+
+            query_ids.append(vector_id)
+            query_documents.append(document_text)
+            query_metadatas.append(vector_metadata)
+            query_distances.append(vector_distance)
+
+        return query_ids, query_documents, query_metadatas, query_distances
+
     def search(
-        self, collection_name: str, vectors: List[List[Union[float, int]]], limit: int
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        limit: int,
+        filter: Optional[Dict] = None,
     ) -> Optional[SearchResult]:
         """
         Search for similar vectors in a collection using multiple query vectors.
+        The query vectors are sent concurrently.
         """
 
         if not self.has_collection(collection_name):
@@ -316,67 +393,17 @@ class S3VectorClient(VectorDBBase):
                 f"Searching collection '{collection_name}' with {len(vectors)} query vectors, limit={limit}"
             )
 
-            # Initialize result lists
-            all_ids = []
-            all_documents = []
-            all_metadatas = []
-            all_distances = []
-
-            # Process each query vector
-            for i, query_vector in enumerate(vectors):
-                log.debug(f"Processing query vector {i+1}/{len(vectors)}")
-
-                # Prepare the query vector in S3 Vector format
-                query_vector_dict = {"float32": [float(x) for x in query_vector]}
-
-                # Call S3 Vector query API
-                response = self.client.query_vectors(
-                    vectorBucketName=self.bucket_name,
-                    indexName=collection_name,
-                    topK=limit,
-                    queryVector=query_vector_dict,
-                    returnMetadata=True,
-                    returnDistance=True,
-                )
+            results = self._map_concurrently(
+                lambda query_vector: self._query_vector(
+                    collection_name, query_vector, limit, filter
+                ),
+                vectors,
+            )
 
-                # Process results for this query
-                query_ids = []
-                query_documents = []
-                query_metadatas = []
-                query_distances = []
-
-                result_vectors = response.get("vectors", [])
-
-                for vector in result_vectors:
-                    vector_id = vector.get("key")
-                    vector_metadata = vector.get("metadata", {})
-                    vector_distance = vector.get("distance", 0.0)
-
-                    # Extract document text from metadata
-                    document_text = ""
-                    if isinstance(vector_metadata, dict):
-                        # Get the text field first (highest priority)
-                        document_text = vector_metadata.get("text")
-                        if not document_text:
-                            # Fallback to other possible text fields
-                            document_text = (
-                                vector_metadata.get("content")
-                                or vector_metadata.get("document")
-                                or vector_id
-                            )
-                    else:
-                        document_text = vector_id
-
-                    query_ids.append(vector_id)
-                    query_documents.append(document_text)
-                    query_metadatas.append(vector_metadata)
-                    query_distances.append(vector_distance)
-
-                # Add this query's results to the overall results
-                all_ids.append(query_ids)
-                all_documents.append(query_documents)
-                all_metadatas.append(query_metadatas)
-                all_distances.append(query_distances)
+            all_ids = [result[0] for result in results]
+            all_documents = [result[1] for result in results]
+            all_metadatas = [result[2] for result in results]
+            all_distances = [result[3] for result in results]
 
             log.info(f"Search completed. Found results for {len(all_ids)} queries")
 
@@ -490,6 +517,80 @@ class S3VectorClient(VectorDBBase):
                     return GetResult(ids=[[]], documents=[[]], metadatas=[[]])
             raise
 
+    def _list_vectors_segment(
+        self, collection_name: str, segment_index: int, segment_count: int
+    ) -> tuple:
+        """
+        List one segment of an index. Returns (ids, documents, metadatas).
+        """
+        # Initialize result lists
+        all_ids = []
+        all_documents = []
+        all_metadatas = []
+
+        # Handle pagination
+        next_token = None
+
+        while True:
+            # Prepare request parameters
+            request_params = {
+                "vectorBucketName": self.bucket_name,
+                "indexName": collection_name,
+                "returnData": False,  # Don't include vector data (not needed for get)
+                "returnMetadata": True,  # Include metadata
+                "maxResults": 500,  # Use reasonable page size
+                "segmentCount": segment_count,
+                "segmentIndex": segment_index,
+            }
+
+            if next_token:
+                request_params["nextToken"] = next_token
+
+            # Call S3 Vector API
+            response = self.client.list_vectors(**request_params)
+
+            # Process vectors in this page
+            vectors = response.get("vectors", [])
+
+            for vector in vectors:
+                vector_id = vector.get("key")
+                vector_data = vector.get("data", {})
+                vector_metadata = vector.get("metadata", {})
+
+                # Extract the actual vector array
+                vector_array = vector_data.get("float32", [])
+
+                # For documents, we try to extract text from metadata or use the vector ID
+                document_text = ""
+                if isinstance(vector_metadata, dict):
+                    # Get the text field first (highest priority)
+                    document_text = vector_metadata.get("text")
+                    if not document_text:
+                        # Fallback to other possible text fields
+                        document_text = (
+                            vector_metadata.get("content")
+                            or vector_metadata.get("document")
+                            or vector_id
+                        )
+
+                    # Log the actual content for debugging
+                    log.debug(
+                        f"Document text preview (first 200 chars): {str(document_text)[:200]}"
+                    )
+                else:
+                    document_text = vector_id
+
+                all_ids.append(vector_id)
+                all_documents.append(document_text)
+                all_metadatas.append(vector_metadata)
+
+            # Check if there are more pages
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+
+        return all_ids, all_documents, all_metadatas
+
     def get(self, collection_name: str) -> Optional[GetResult]:
         """
         Retrieve all vectors from a collection.
@@ -502,69 +603,18 @@ class S3VectorClient(VectorDBBase):
         try:
             log.info(f"Retrieving all vectors from collection '{collection_name}'")
 
-            # Initialize result lists
-            all_ids = []
-            all_documents = []
-            all_metadatas = []
-
-            # Handle pagination
-            next_token = None
-
-            while True:
-                # Prepare request parameters
-                request_params = {
-                    "vectorBucketName": self.bucket_name,
-                    "indexName": collection_name,
-                    "returnData": False,  # Don't include vector data (not needed for get)
-                    "returnMetadata": True,  # Include metadata
-                    "maxResults": 500,  # Use reasonable page size
-                }
-
-                if next_token:
-                    request_params["nextToken"] = next_token
-
-                # Call S3 Vector API
-                response = self.client.list_vectors(**request_params)
-
-                # Process vectors in this page
-                vectors = response.get("vectors", [])
-
-                for vector in vectors:
-                    vector_id = vector.get("key")
-                    vector_data = vector.get("data", {})
-                    vector_metadata = vector.get("metadata", {})
-
-                    # Extract the actual vector array
-                    vector_array = vector_data.get("float32", [])
-
-                    # For documents, we try to extract text from metadata or use the vector ID
-                    document_text = ""
-                    if isinstance(vector_metadata, dict):
-                        # Get the text field first (highest priority)
-                        document_text = vector_metadata.get("text")
-                        if not document_text:
-                            # Fallback to other possible text fields
-                            document_text = (
-                                vector_metadata.get("content")
-                                or vector_metadata.get("document")
-                                or vector_id
-                            )
-
-                        # Log the actual content for debugging
-                        log.debug(
-                            f"Document text preview (first 200 chars): {str(document_text)[:200]}"
-                        )
-                    else:
-                        document_text = vector_id
-
-                    all_ids.append(vector_id)
-                    all_documents.append(document_text)
-                    all_metadatas.append(vector_metadata)
+            # List the index in parallel segments
+            segment_count = max(1, min(VECTOR_DB_QUERY_CONCURRENCY, 16))
+            segments = self._map_concurrently(
+                lambda segment_index: self._list_vectors_segment(
+                    collection_name, segment_index, segment_count
+                ),
+                list(range(segment_count)),
+            )
 
-                # Check if there are more pages
-                next_token = response.get("nextToken")
-                if not next_token:
-                    break
+            all_ids = [id for segment in segments for id in segment[0]]
+            all_documents = [doc for segment in segments for doc in segment[1]]
+            all_metadatas = [meta for segment in segments for meta in segment[2]]
 
             log.info(
                 f"Retrieved {len(all_ids)} vectors from collection '{collection_name}'"
@@ -683,6 +733,8 @@ class S3VectorClient(VectorDBBase):
                 "Reset called - this will delete all vector indexes in the S3 bucket"
             )
 
+            self._invalidate_cached_collection()
+
             # List all indexes
             response = self.client.list_indexes(vectorBucketName=self.bucket_name)
             indexes = response.get("indexes", [])
@@ -167,14 +167,7 @@ class WeaviateClient(VectorDBBase):
 
         collection = self.client.collections.get(sane_collection_name)
 
-        result_ids, result_documents, result_metadatas, result_distances = (
-            [],
-            [],
-            [],
-            [],
-        )
-
-        for vector_embedding in vectors:
+        def search_vector(vector_embedding):
             try:
                 response = collection.query.near_vector(
                     near_vector=vector_embedding,
@@ -185,7 +178,6 @@ class WeaviateClient(VectorDBBase):
                 ids = [str(obj.uuid) for obj in response.objects]
                 documents = []
                 metadatas = []
-                distances = []
 
                 for obj in response.objects:
                     properties = dict(obj.properties) if obj.properties else {}
@@ -203,15 +195,16 @@ class WeaviateClient(VectorDBBase):
                 ]
                 distances = [(2 - dist) / 2 for dist in raw_distances]
 
-                result_ids.append(ids)
-                result_documents.append(documents)
-                result_metadatas.append(metadatas)
-                result_distances.append(distances)
+                return ids, documents, metadatas, distances
             except Exception:
-                result_ids.append([])
-                result_documents.append([])
-                result_metadatas.append([])
-                result_distances.append([])
+                return [], [], [], []
+
+        # One request per query vector, sent concurrently
+        results = self._map_concurrently(search_vector, vectors)
+        result_ids = [result[0] for result in results]
+        result_documents = [result[1] for result in results]
+        result_metadatas = [result[2] for result in results]
+        result_distances = [result[3] for result in results]
 
         return SearchResult(
             **{
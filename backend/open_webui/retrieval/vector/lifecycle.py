@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from open_webui.env import (
+    EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE,
+    EPHEMERAL_COLLECTION_REAPER_INTERVAL,
+    EPHEMERAL_COLLECTION_REAPER_RATE,
+    SRC_LOG_LEVELS,
+)
+from open_webui.models.ephemeral_collections import EphemeralCollections
+from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+# Seconds to wait for a reaper deleting a collection before registering it anyway
+CLAIM_WAIT_TIMEOUT = 30
+
+
+def register_ephemeral_collection(
+    collection_name: str, type: str, ttl: int, user_id: Optional[str] = None
+):
+    """
+    Schedule a collection for deletion `ttl` seconds from now, pushing back
+    any earlier schedule. A `ttl` of 0 or less keeps the collection.
+
+    Call before writing the collection: if a reaper is deleting it, this waits
+    until it is done, so the new documents are not deleted with it.
+    """
+    if ttl <= 0:
+        return
+
+    deadline = time.monotonic() + CLAIM_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        if EphemeralCollections.touch(collection_name, type, ttl, user_id=user_id):
+            return
+        time.sleep(0.5)
+
+    log.warning(f"Collection {collection_name} is still claimed, registering anyway")
+    EphemeralCollections.touch(collection_name, type, ttl, user_id=user_id, force=True)
+
+
+def delete_ephemeral_collection(collection_name: str, claimed_until: int) -> bool:
+    """
+    Delete a collection claimed until `claimed_until`. Returns whether it was
+    deleted, i.e. the claim still held.
+    """
+    if not EphemeralCollections.is_claimed(collection_name, claimed_until):
+        return False
+
+    if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+        VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+    EphemeralCollections.delete_by_name(collection_name, claimed_until=claimed_until)
+    return True
+
+
+async def reap_expired_collections(
+    batch_size: int = EPHEMERAL_COLLECTION_REAPER_BATCH_SIZE,
+    rate: float = EPHEMERAL_COLLECTION_REAPER_RATE,
+) -> int:
+    """
+    Delete expired ephemeral collections, at most `rate` per second, until
+    none are left. Returns the number of collections deleted.
+    """
+    interval = 1.0 / rate if rate > 0 else 0
+    deleted = 0
+
+    while True:
+        expired = await asyncio.to_thread(EphemeralCollections.get_expired, batch_size)
+        if not expired:
+            break
+
+        for collection in expired:
+            # Another instance may be reaping concurrently, or a new search
+            # may have just refreshed the collection
+            claimed_until = await asyncio.to_thread(
+                EphemeralCollections.claim,
+                collection.name,
+                collection.expires_at,
+                EPHEMERAL_COLLECTION_REAPER_INTERVAL,
+            )
+            if claimed_until is None:
+                continue
+
+            try:
+                if await asyncio.to_thread(
+                    delete_ephemeral_collection, collection.name, claimed_until
+                ):
+                    deleted += 1
+            except Exception as e:
+                # Retried once the claim lapses
+                log.warning(f"Failed to delete collection {collection.name}: {e}")
+
+            if interval:
+                await asyncio.sleep(interval)
+
+        if len(expired) < batch_size:
+            break
+
+    return deleted
+
+
+async def periodic_collection_reaper():
+    if EPHEMERAL_COLLECTION_REAPER_INTERVAL <= 0:
+        return
+
+    while True:
+        try:
+            deleted = await reap_expired_collections()
+            if deleted:
+                log.info(f"Deleted {deleted} expired ephemeral collections")
+        except Exception as e:
+            log.exception(f"Error reaping expired collections: {e}")
+
+        await asyncio.sleep(EPHEMERAL_COLLECTION_REAPER_INTERVAL)
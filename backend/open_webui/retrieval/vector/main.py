@@ -1,6 +1,16 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from open_webui.config import (
+    VECTOR_DB_COLLECTION_CACHE_TTL,
+    VECTOR_DB_QUERY_CONCURRENCY,
+)
+
+# Shared by all clients, bounds the number of in-flight per-vector requests
+_query_executor: Optional[ThreadPoolExecutor] = None
 
 
 class VectorItem(BaseModel):
@@ -31,6 +41,87 @@ class VectorDBBase(ABC):
     implement all abstract methods.
     """
 
+    collection_cache_ttl: int = VECTOR_DB_COLLECTION_CACHE_TTL
+
+    @property
+    def _collection_cache(self) -> Dict[str, tuple]:
+        # collection name -> (expires_at, exists, handle)
+        if "_collection_cache_entries" not in self.__dict__:
+            self.__dict__["_collection_cache_entries"] = {}
+        return self.__dict__["_collection_cache_entries"]
+
+    def _get_cached_collection(self, collection_name: str) -> Optional[tuple]:
+        """Return the cached (exists, handle) of a collection, if still fresh."""
+        entry = self._collection_cache.get(collection_name)
+        if entry is None:
+            return None
+
+        expires_at, exists, handle = entry
+        if expires_at < time.monotonic():
+            self._collection_cache.pop(collection_name, None)
+            return None
+        return exists, handle
+
+    def _set_cached_collection(
+        self, collection_name: str, exists: bool = True, handle: Any = None
+    ) -> None:
+        """
+        Record that a collection exists, e.g. after creating it. Deletions
+        invalidate the entry rather than caching its absence, so a collection
+        recreated by another instance is seen straight away.
+        """
+        if self.collection_cache_ttl <= 0:
+            return
+        self._collection_cache[collection_name] = (
+            time.monotonic() + self.collection_cache_ttl,
+            exists,
+            handle,
+        )
+
+    def _invalidate_cached_collection(
+        self, collection_name: Optional[str] = None
+    ) -> None:
+        """Forget a collection, or every collection when no name is given."""
+        if collection_name is None:
+            self._collection_cache.clear()
+        else:
+            self._collection_cache.pop(collection_name, None)
+
+    def _has_collection_cached(
+        self, collection_name: str, lookup: Callable[[], bool]
+    ) -> bool:
+        """
+        Existence check through the cache. Only positive lookups are cached,
+        so neither a transient lookup error nor a deletion hides a collection
+        for the whole TTL.
+        """
+        cached = self._get_cached_collection(collection_name)
+        if cached is not None:
+            return cached[0]
+
+        exists = lookup()
+        if exists:
+            self._set_cached_collection(collection_name, True)
+        return exists
+
+    def _map_concurrently(self, func: Callable, items: List[Any]) -> List[Any]:
+        """
+        Call `func` for each item (e.g. each query vector) on a bounded thread
+        pool, for backends that only accept one query per request. Results keep
+        the order of `items`.
+        """
+        global _query_executor
+
+        if len(items) <= 1 or VECTOR_DB_QUERY_CONCURRENCY <= 1:
+            return [func(item) for item in items]
+
+        if _query_executor is None:
+            _query_executor = ThreadPoolExecutor(
+                max_workers=VECTOR_DB_QUERY_CONCURRENCY,
+                thread_name_prefix="vector-db-query",
+            )
+        return list(_query_executor.map(func, items))
+
     @abstractmethod
     def has_collection(self, collection_name: str) -> bool:
         """Check if the collection exists in the vector DB."""
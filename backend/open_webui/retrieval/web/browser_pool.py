@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Optional
+
+from open_webui.env import (
+    PLAYWRIGHT_BLOCK_RESOURCE_TYPES,
+    PLAYWRIGHT_MAX_CONCURRENT_PAGES,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+class PooledBrowser:
+    """A browser for one (ws_url, headless, proxy)."""
+
+    def __init__(self, browser):
+        self.browser = browser
+
+    def is_connected(self) -> bool:
+        return self.browser.is_connected()
+
+    async def close(self):
+        try:
+            await self.browser.close()
+        except Exception as e:
+            log.debug(f"Error closing Playwright browser: {e}")
+
+
+class PlaywrightBrowserPool:
+    """
+    Long-lived Chromium instances shared by all Playwright web loads, instead
+    of a browser launch (or remote connection) per web search.
+
+    Each load runs in a fresh context, so cookies, storage and cache never
+    carry over between users' fetches. Contexts abort requests for resource
+    types not needed for text extraction (images, fonts and media by
+    default). At most `max_concurrent_pages` loads run at once across all
+    browsers. Playwright objects are bound to the event loop the pool was
+    bound to, so loads from other threads are submitted to that loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_pages: int = PLAYWRIGHT_MAX_CONCURRENT_PAGES,
+        block_resource_types: list[str] = PLAYWRIGHT_BLOCK_RESOURCE_TYPES,
+    ):
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self.block_resource_types = set(block_resource_types)
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.lock: Optional[asyncio.Lock] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.playwright = None
+        self.browsers: dict[tuple, PooledBrowser] = {}
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        if self.loop is loop:
+            return
+        if self.loop is not None:
+            # The previous loop is gone, and the browsers started on it with it
+            log.debug("Rebinding Playwright browser pool to a new event loop")
+        self.loop = loop
+        self.lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+        self.playwright = None
+        self.browsers = {}
+
+    def is_available_from_thread(self) -> bool:
+        """Whether the current thread can `submit` loads to the pool."""
+        if self.loop is None or not self.loop.is_running():
+            return False
+        try:
+            return asyncio.get_running_loop() is not self.loop
+        except RuntimeError:
+            return True
+
+    async def _route(self, route):
+        if route.request.resource_type in self.block_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _start_browser(
+        self, ws_url: Optional[str], headless: bool, proxy: Optional[dict]
+    ) -> PooledBrowser:
+        if self.playwright is None:
+            from playwright.async_api import async_playwright
+
+            self.playwright = await async_playwright().start()
+
+        if ws_url:
+            browser = await self.playwright.chromium.connect(ws_url)
+        else:
+            browser = await self.playwright.chromium.launch(
+                headless=headless, proxy=proxy
+            )
+
+        log.info(
+            f"Started pooled Playwright browser ({'remote' if ws_url else 'local'})"
+        )
+        return PooledBrowser(browser)
+
+    async def _get_browser(
+        self, ws_url: Optional[str], headless: bool, proxy: Optional[dict]
+    ) -> PooledBrowser:
+        key = (ws_url or "", headless, json.dumps(proxy, sort_keys=True))
+
+        async with self.lock:
+            pooled_browser = self.browsers.get(key)
+            if pooled_browser is None or not pooled_browser.is_connected():
+                if pooled_browser is not None:
+                    log.warning("Pooled Playwright browser disconnected, restarting")
+                pooled_browser = await self._start_browser(ws_url, headless, proxy)
+                self.browsers[key] = pooled_browser
+            return pooled_browser
+
+    async def _load(
+        self,
+        url: str,
+        evaluate: Callable[..., Awaitable],
+        timeout: Optional[int],
+        ws_url: Optional[str],
+        headless: bool,
+        proxy: Optional[dict],
+    ):
+        async with self.semaphore:
+            pooled_browser = await self._get_browser(ws_url, headless, proxy)
+
+            context = await pooled_browser.browser.new_context()
+            try:
+                if self.block_resource_types:
+                    await context.route("**/*", self._route)
+
+                page = await context.new_page()
+                response = await page.goto(url, timeout=timeout)
+                if response is None:
+                    raise ValueError(f"page.goto() returned None for url {url}")
+
+                return await evaluate(page, pooled_browser.browser, response)
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    log.debug(f"Error closing Playwright context: {e}")
+
+    async def load(
+        self,
+        url: str,
+        evaluate: Callable[..., Awaitable],
+        timeout: Optional[int] = None,
+        ws_url: Optional[str] = None,
+        headless: bool = True,
+        proxy: Optional[dict] = None,
+    ):
+        """
+        Load `url` in a pooled page and return `evaluate(page, browser, response)`.
+        """
+        loop = asyncio.get_running_loop()
+        if self.loop is None or not self.loop.is_running():
+            self.bind(loop)
+
+        coroutine = self._load(url, evaluate, timeout, ws_url, headless, proxy)
+        if loop is self.loop:
+            return await coroutine
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        )
+
+    def submit(
+        self, url: str, evaluate: Callable[..., Awaitable], **kwargs
+    ) -> Future:
+        """`load` from a thread without a running loop."""
+        return asyncio.run_coroutine_threadsafe(
+            self.load(url, evaluate, **kwargs), self.loop
+        )
+
+    async def close(self):
+        if self.loop is None:
+            return
+
+        browsers = list(self.browsers.values())
+        self.browsers = {}
+        for pooled_browser in browsers:
+            await pooled_browser.close()
+
+        if self.playwright is not None:
+            try:
+                await self.playwright.stop()
+            except Exception as e:
+                log.debug(f"Error stopping Playwright: {e}")
+            self.playwright = None
+
+
+PLAYWRIGHT_BROWSER_POOL = PlaywrightBrowserPool()
+
+
+async def close_playwright_browser_pool():
+    await PLAYWRIGHT_BROWSER_POOL.close()
@@ -0,0 +1,348 @@
+import array
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+from langchain_core.documents import Document
+from opentelemetry import metrics
+
+from open_webui.env import (
+    ENABLE_WEB_SEARCH_CACHE,
+    WEB_EMBEDDING_CACHE_MAX_SIZE,
+    WEB_PAGE_CACHE_MAX_SIZE,
+    WEB_PAGE_CACHE_TTL,
+    WEB_SEARCH_CACHE_MAX_SIZE,
+    WEB_SEARCH_CACHE_TTL,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+# Search engines that receive the user, so their results are cached per user
+USER_SCOPED_SEARCH_ENGINES = ("perplexity_search", "external")
+
+meter = metrics.get_meter(__name__)
+cache_lookups = meter.create_counter(
+    name="webui.web_search.cache.lookups",
+    description="Web search cache lookups, by tier and result",
+    unit="1",
+)
+
+
+class CacheTier:
+    """
+    Thread-safe TTL/LRU cache bounded by the total size of its entries (as
+    measured by `sizeof`), with hit/miss counters.
+
+    With `keep_stale`, expired entries stay until evicted so callers can
+    revalidate them instead of refetching.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: Optional[int] = None,
+        sizeof: Callable[[Any], int] = lambda value: 1,
+        keep_stale: bool = False,
+    ):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.keep_stale = keep_stale
+
+        # key -> (expires_at, size, value)
+        self.entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return ENABLE_WEB_SEARCH_CACHE and self.max_size > 0 and self.ttl != 0
+
+    def record(self, hit: bool):
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        cache_lookups.add(
+            1, {"cache.tier": self.name, "cache.result": "hit" if hit else "miss"}
+        )
+
+    def _pop(self, key: str):
+        _, size, _ = self.entries.pop(key)
+        self.size -= size
+
+    def get(self, key: str, stale: bool = False) -> Optional[Any]:
+        """
+        Return the cached value, or None. With `stale`, expired values are
+        returned too and the lookup is not counted.
+        """
+        if not self.enabled:
+            return None
+
+        value = None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, _, value = entry
+                if expires_at >= time.monotonic() or stale:
+                    self.entries.move_to_end(key)
+                else:
+                    if not self.keep_stale:
+                        self._pop(key)
+                    value = None
+
+        if not stale:
+            self.record(value is not None)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        if not self.enabled:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        size = self.sizeof(value)
+        if size > self.max_size:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self._pop(key)
+
+            expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+            self.entries[key] = (expires_at, size, value)
+            self.size += size
+
+            while self.size > self.max_size:
+                self._pop(next(iter(self.entries)))
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+WEB_SEARCH_RESULTS_CACHE = CacheTier(
+    "search", WEB_SEARCH_CACHE_MAX_SIZE, WEB_SEARCH_CACHE_TTL
+)
+WEB_PAGE_CACHE = CacheTier(
+    "page",
+    WEB_PAGE_CACHE_MAX_SIZE,
+    WEB_PAGE_CACHE_TTL,
+    sizeof=lambda page: sum(len(doc.page_content) for doc in page["docs"]),
+    keep_stale=True,
+)
+# Embeddings are stored as float32 arrays, a fraction of the size of float lists
+WEB_EMBEDDING_CACHE = CacheTier(
+    "embedding",
+    WEB_EMBEDDING_CACHE_MAX_SIZE,
+    sizeof=lambda embedding: embedding.itemsize * len(embedding),
+)
+
+
+def get_cache_stats() -> dict:
+    return {
+        tier.name: tier.stats()
+        for tier in (WEB_SEARCH_RESULTS_CACHE, WEB_PAGE_CACHE, WEB_EMBEDDING_CACHE)
+    }
+
+
+def get_hash(*parts) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+####################
+# Search results
+####################
+
+
+def get_search_cache_key(engine: str, query: str, params: dict) -> str:
+    return get_hash(engine, " ".join(query.lower().split()), params)
+
+
+####################
+# Pages
+####################
+
+
+def get_page_cache_key(engine: str, url: str) -> str:
+    return get_hash(engine or "safe_web", url)
+
+
+def get_page_cache_policy(headers) -> dict:
+    """
+    Derive how long a fetched page may be reused from its response headers
+    (Cache-Control, Expires) and the validators to revalidate it with.
+
+    The page cache is shared by all users, so private responses and ones
+    that vary on request headers (other than Accept-Encoding) are not stored.
+    """
+    cache_control = {}
+    for directive in headers.get("Cache-Control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            cache_control[name] = value.strip('"')
+
+    vary = {
+        header.strip().lower()
+        for header in headers.get("Vary", "").split(",")
+        if header.strip()
+    }
+
+    policy = {
+        "store": "no-store" not in cache_control
+        and "private" not in cache_control
+        and not vary - {"accept-encoding"},
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "ttl": None,
+    }
+
+    if "no-cache" in cache_control:
+        policy["ttl"] = 0
+    elif "max-age" in cache_control:
+        try:
+            age = int(headers.get("Age", "0") or 0)
+            policy["ttl"] = max(0, int(cache_control["max-age"]) - age)
+        except ValueError:
+            pass
+    elif headers.get("Expires"):
+        try:
+            expires = parsedate_to_datetime(headers["Expires"])
+            if headers.get("Date"):
+                now = parsedate_to_datetime(headers["Date"]).timestamp()
+            else:
+                now = time.time()
+            policy["ttl"] = max(0, int(expires.timestamp() - now))
+        except (TypeError, ValueError):
+            # Invalid dates (e.g. "0") mean already expired
+            policy["ttl"] = 0
+
+    if policy["ttl"] is not None:
+        policy["ttl"] = min(policy["ttl"], WEB_PAGE_CACHE_TTL)
+    return policy
+
+
+def copy_docs(docs: list[Document]) -> list[Document]:
+    return [
+        Document(page_content=doc.page_content, metadata=dict(doc.metadata))
+        for doc in docs
+    ]
+
+
+def get_cached_pages(engine: str, urls: list[str]) -> tuple[list[Document], list[str]]:
+    """Return the documents of fresh cached pages and the URLs still to load."""
+    docs = []
+    missing_urls = []
+    for url in urls:
+        page = WEB_PAGE_CACHE.get(get_page_cache_key(engine, url))
+        if page is not None:
+            docs.extend(copy_docs(page["docs"]))
+        else:
+            missing_urls.append(url)
+    return docs, missing_urls
+
+
+def get_stale_page(engine: str, url: str) -> Optional[dict]:
+    """A cached page, fresh or not, that can be revalidated with its validators."""
+    page = WEB_PAGE_CACHE.get(get_page_cache_key(engine, url), stale=True)
+    if page is not None and (page.get("etag") or page.get("last_modified")):
+        return page
+    return None
+
+
+def set_cached_pages(
+    engine: str, docs: list[Document], policies: Optional[dict] = None
+):
+    """
+    Cache loaded documents by their source URL, for as long as the response
+    headers recorded by the loader in `policies` allow.
+    """
+    if not WEB_PAGE_CACHE.enabled:
+        return
+
+    pages = {}
+    for doc in docs:
+        if source := doc.metadata.get("source"):
+            pages.setdefault(source, []).append(doc)
+
+    for url, page_docs in pages.items():
+        policy = (policies or {}).get(url, {})
+        if not policy.get("store", True):
+            continue
+
+        ttl = policy.get("ttl")
+        if ttl == 0 and not (policy.get("etag") or policy.get("last_modified")):
+            # Nothing to revalidate with, so there is no point keeping it
+            continue
+
+        WEB_PAGE_CACHE.set(
+            get_page_cache_key(engine, url),
+            {
+                "docs": copy_docs(page_docs),
+                "etag": policy.get("etag"),
+                "last_modified": policy.get("last_modified"),
+            },
+            ttl=ttl,
+        )
+
+
+####################
+# Embeddings
+####################
+
+
+async def embed_with_cache(
+    texts: list[str],
+    embedding_function: Callable,
+    engine: str,
+    model: str,
+    prefix: Optional[str] = None,
+    **kwargs,
+) -> list:
+    """
+    Embed `texts`, reusing cached embeddings of identical chunks (e.g. the same
+    page fetched by several web searches) and caching new ones.
+    """
+    if not WEB_EMBEDDING_CACHE.enabled:
+        return await embedding_function(texts, prefix=prefix, **kwargs)
+
+    keys = [get_hash(engine, model, prefix, text) for text in texts]
+    embeddings = []
+    for key in keys:
+        embedding = WEB_EMBEDDING_CACHE.get(key)
+        embeddings.append(embedding.tolist() if embedding is not None else None)
+
+    missing = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+
+    if missing:
+        new_embeddings = await embedding_function(
+            [texts[idx] for idx in missing], prefix=prefix, **kwargs
+        )
+        for idx, embedding in zip(missing, new_embeddings):
+            embeddings[idx] = embedding
+            WEB_EMBEDDING_CACHE.set(keys[idx], array.array("f", embedding))
+
+    log.debug(
+        f"Reused {len(texts) - len(missing)}/{len(texts)} cached chunk embeddings"
+    )
+    return embeddings
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
+
+from open_webui.env import WEB_LOADER_PARSER_WORKERS, SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def extract_html(
+    html: str,
+    url: str,
+    parser: str,
+    bs_kwargs: Optional[dict] = None,
+    bs_get_text_kwargs: Optional[dict] = None,
+) -> tuple[str, dict]:
+    """Parse a fetched page and return its text and metadata."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, parser, **(bs_kwargs or {}))
+    text = soup.get_text(**(bs_get_text_kwargs or {}))
+
+    metadata = {"source": url}
+    if title := soup.find("title"):
+        metadata["title"] = title.get_text()
+    if description := soup.find("meta", attrs={"name": "description"}):
+        metadata["description"] = description.get("content", "No description found.")
+    if html_tag := soup.find("html"):
+        metadata["language"] = html_tag.get("lang", "No language found.")
+    return text, metadata
+
+
+def get_parser_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=WEB_LOADER_PARSER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_parser_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def aextract_html(
+    html: str,
+    url: str,
+    parser: str,
+    bs_kwargs: Optional[dict] = None,
+    bs_get_text_kwargs: Optional[dict] = None,
+) -> tuple[str, dict]:
+    """
+    `extract_html` off the event loop, in a worker process so large pages do
+    not hold the GIL, or in a thread if `WEB_LOADER_PARSER_WORKERS` is 0.
+    """
+    func = partial(extract_html, html, url, parser, bs_kwargs, bs_get_text_kwargs)
+    if WEB_LOADER_PARSER_WORKERS <= 0:
+        return await asyncio.to_thread(func)
+    return await asyncio.get_running_loop().run_in_executor(get_parser_pool(), func)
@@ -2,9 +2,11 @@ import asyncio
 import logging
 import socket
 import ssl
+import threading
 import urllib.parse
 import urllib.request
 from datetime import datetime, time, timedelta
+from time import monotonic
 from typing import (
     Any,
     AsyncIterator,
@@ -19,6 +21,7 @@ from typing import (
 
 from fastapi.concurrency import run_in_threadpool
 import aiohttp
+from aiohttp.abc import AbstractResolver
 import certifi
 import validators
 from langchain_community.document_loaders import PlaywrightURLLoader, WebBaseLoader
@@ -41,57 +44,123 @@ from open_webui.config import (
     EXTERNAL_WEB_LOADER_API_KEY,
     WEB_FETCH_FILTER_LIST,
 )
-from open_webui.env import SRC_LOG_LEVELS
+from open_webui.env import (
+    ENABLE_PLAYWRIGHT_BROWSER_POOL,
+    SRC_LOG_LEVELS,
+    WEB_LOADER_DNS_CACHE_TTL,
+    WEB_LOADER_MAX_RESPONSE_SIZE,
+)
+from open_webui.retrieval.web.browser_pool import PLAYWRIGHT_BROWSER_POOL
+from open_webui.retrieval.web.cache import (
+    copy_docs,
+    get_page_cache_policy,
+    get_stale_page,
+)
+from open_webui.retrieval.web.parser import aextract_html
 from open_webui.utils.misc import is_string_allowed
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["RAG"])
 
 
+# hostname -> (expiry, IPv4 addresses, IPv6 addresses)
+DNS_CACHE: Dict[str, tuple] = {}
+DNS_CACHE_MAX_SIZE = 4096
+DNS_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_hostname(hostname: str) -> Optional[tuple[List[str], List[str]]]:
+    with DNS_CACHE_LOCK:
+        entry = DNS_CACHE.get(hostname)
+        if entry is None:
+            return None
+        if entry[0] < monotonic():
+            del DNS_CACHE[hostname]
+            return None
+        return entry[1], entry[2]
+
+
+def set_cached_hostname(hostname: str, addr_info) -> tuple[List[str], List[str]]:
+    # Extract IP addresses from address information
+    ipv4_addresses = list(
+        dict.fromkeys(info[4][0] for info in addr_info if info[0] == socket.AF_INET)
+    )
+    ipv6_addresses = list(
+        dict.fromkeys(info[4][0] for info in addr_info if info[0] == socket.AF_INET6)
+    )
+
+    if WEB_LOADER_DNS_CACHE_TTL > 0:
+        with DNS_CACHE_LOCK:
+            if len(DNS_CACHE) >= DNS_CACHE_MAX_SIZE:
+                DNS_CACHE.clear()
+            DNS_CACHE[hostname] = (
+                monotonic() + WEB_LOADER_DNS_CACHE_TTL,
+                ipv4_addresses,
+                ipv6_addresses,
+            )
+    return ipv4_addresses, ipv6_addresses
+
+
 def resolve_hostname(hostname):
+    cached = get_cached_hostname(hostname)
+    if cached is not None:
+        return cached
+
     # Get address information
     addr_info = socket.getaddrinfo(hostname, None)
+    return set_cached_hostname(hostname, addr_info)
 
-    # Extract IP addresses from address information
-    ipv4_addresses = [info[4][0] for info in addr_info if info[0] == socket.AF_INET]
-    ipv6_addresses = [info[4][0] for info in addr_info if info[0] == socket.AF_INET6]
 
-    return ipv4_addresses, ipv6_addresses
+async def aresolve_hostname(hostname):
+    """Non-blocking `resolve_hostname`, sharing its cache."""
+    cached = get_cached_hostname(hostname)
+    if cached is not None:
+        return cached
 
+    addr_info = await asyncio.get_running_loop().getaddrinfo(hostname, None)
+    return set_cached_hostname(hostname, addr_info)
 
-def validate_url(url: Union[str, Sequence[str]]):
-    if isinstance(url, str):
-        if isinstance(validators.url(url), validators.ValidationError):
+
+def check_url(url: str) -> urllib.parse.ParseResult:
+    """Run the checks of `validate_url` that do not need DNS resolution."""
+    if isinstance(validators.url(url), validators.ValidationError):
+        raise ValueError(ERROR_MESSAGES.INVALID_URL)
+
+    parsed_url = urllib.parse.urlparse(url)
+
+    # Protocol validation - only allow http/https
+    if parsed_url.scheme not in ["http", "https"]:
+        log.warning(f"Blocked non-HTTP(S) protocol: {parsed_url.scheme} in URL: {url}")
+        raise ValueError(ERROR_MESSAGES.INVALID_URL)
+
+    # Blocklist check using unified filtering logic
+    if WEB_FETCH_FILTER_LIST:
+        if not is_string_allowed(url, WEB_FETCH_FILTER_LIST):
+            log.warning(f"URL blocked by filter list: {url}")
             raise ValueError(ERROR_MESSAGES.INVALID_URL)
 
-        parsed_url = urllib.parse.urlparse(url)
+    return parsed_url
 
-        # Protocol validation - only allow http/https
-        if parsed_url.scheme not in ["http", "https"]:
-            log.warning(
-                f"Blocked non-HTTP(S) protocol: {parsed_url.scheme} in URL: {url}"
-            )
+
+def check_resolved_addresses(ipv4_addresses: List[str], ipv6_addresses: List[str]):
+    # Check if any of the resolved addresses are private
+    for ip in ipv4_addresses:
+        if validators.ipv4(ip, private=True):
             raise ValueError(ERROR_MESSAGES.INVALID_URL)
+    for ip in ipv6_addresses:
+        if validators.ipv6(ip, private=True):
+            raise ValueError(ERROR_MESSAGES.INVALID_URL)
+
 
-        # Blocklist check using unified filtering logic
-        if WEB_FETCH_FILTER_LIST:
-            if not is_string_allowed(url, WEB_FETCH_FILTER_LIST):
-                log.warning(f"URL blocked by filter list: {url}")
-                raise ValueError(ERROR_MESSAGES.INVALID_URL)
+def validate_url(url: Union[str, Sequence[str]]):
+    if isinstance(url, str):
+        parsed_url = check_url(url)
 
         if not ENABLE_RAG_LOCAL_WEB_FETCH:
             # Local web fetch is disabled, filter out any URLs that resolve to private IP addresses
-            parsed_url = urllib.parse.urlparse(url)
             # Get IPv4 and IPv6 addresses
             ipv4_addresses, ipv6_addresses = resolve_hostname(parsed_url.hostname)
-            # Check if any of the resolved addresses are private
-            # This is technically still vulnerable to DNS rebinding attacks, as we don't control WebBaseLoader
-            for ip in ipv4_addresses:
-                if validators.ipv4(ip, private=True):
-                    raise ValueError(ERROR_MESSAGES.INVALID_URL)
-            for ip in ipv6_addresses:
-                if validators.ipv6(ip, private=True):
-                    raise ValueError(ERROR_MESSAGES.INVALID_URL)
+            check_resolved_addresses(ipv4_addresses, ipv6_addresses)
         return True
     elif isinstance(url, Sequence):
         return all(validate_url(u) for u in url)
@@ -99,6 +168,16 @@ def validate_url(url: Union[str, Sequence[str]]):
         return False
 
 
+async def avalidate_url(url: str) -> bool:
+    """Non-blocking `validate_url` for a single URL."""
+    parsed_url = check_url(url)
+
+    if not ENABLE_RAG_LOCAL_WEB_FETCH:
+        ipv4_addresses, ipv6_addresses = await aresolve_hostname(parsed_url.hostname)
+        check_resolved_addresses(ipv4_addresses, ipv6_addresses)
+    return True
+
+
 def safe_validate_urls(url: Sequence[str]) -> Sequence[str]:
     valid_urls = []
     for u in url:
@@ -111,6 +190,101 @@ def safe_validate_urls(url: Sequence[str]) -> Sequence[str]:
     return valid_urls
 
 
+async def asafe_validate_urls(url: Sequence[str]) -> Sequence[str]:
+    """Validate URLs concurrently, resolving their hostnames off the event loop."""
+    results = await asyncio.gather(
+        *[avalidate_url(u) for u in url], return_exceptions=True
+    )
+
+    valid_urls = []
+    for u, result in zip(url, results):
+        if isinstance(result, Exception):
+            log.debug(f"Invalid URL {u}: {str(result)}")
+            continue
+        if result:
+            valid_urls.append(u)
+    return valid_urls
+
+
+class CachedResolver(AbstractResolver):
+    """aiohttp resolver sharing the DNS cache used to validate URLs."""
+
+    async def resolve(self, host: str, port: int = 0, family=socket.AF_INET):
+        try:
+            ipv4_addresses, ipv6_addresses = await aresolve_hostname(host)
+        except socket.gaierror as e:
+            raise OSError(f"Could not resolve {host}: {e}") from e
+
+        addresses = []
+        if family in (socket.AF_INET, socket.AF_UNSPEC):
+            addresses.extend((socket.AF_INET, ip) for ip in ipv4_addresses)
+        if family in (socket.AF_INET6, socket.AF_UNSPEC):
+            addresses.extend((socket.AF_INET6, ip) for ip in ipv6_addresses)
+        if not addresses:
+            raise OSError(f"No addresses found for {host}")
+
+        return [
+            {
+                "hostname": host,
+                "host": ip,
+                "port": port,
+                "family": address_family,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+            }
+            for address_family, ip in addresses
+        ]
+
+    async def close(self):
+        pass
+
+
+# Shared, pooled HTTP sessions for web page fetches, keyed by trust_env.
+# Created lazily on the running event loop.
+WEB_LOADER_SESSIONS: Dict[bool, aiohttp.ClientSession] = {}
+
+
+def get_web_loader_session(trust_env: bool = False) -> aiohttp.ClientSession:
+    session = WEB_LOADER_SESSIONS.get(trust_env)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, use_dns_cache=False, resolver=CachedResolver()
+            ),
+            # Cookies must not leak between users' fetches
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trust_env=trust_env,
+        )
+        WEB_LOADER_SESSIONS[trust_env] = session
+    return session
+
+
+async def close_web_loader_sessions():
+    for session in list(WEB_LOADER_SESSIONS.values()):
+        if not session.closed:
+            await session.close()
+    WEB_LOADER_SESSIONS.clear()
+
+
+async def read_response_text(response: aiohttp.ClientResponse, url: str) -> str:
+    """Read a response body, truncated to `WEB_LOADER_MAX_RESPONSE_SIZE` bytes."""
+    if WEB_LOADER_MAX_RESPONSE_SIZE <= 0:
+        return await response.text(errors="replace")
+
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        body.extend(chunk)
+        if len(body) >= WEB_LOADER_MAX_RESPONSE_SIZE:
+            log.warning(f"Truncating {url} to {WEB_LOADER_MAX_RESPONSE_SIZE} bytes")
+            del body[WEB_LOADER_MAX_RESPONSE_SIZE:]
+            break
+
+    try:
+        return body.decode(response.charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
 def extract_metadata(soup, url):
     metadata = {"source": url}
     if title := soup.find("title"):
@@ -485,8 +659,23 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
         self.trust_env = trust_env
         self.playwright_timeout = playwright_timeout
 
+    def _get_pool_kwargs(self) -> dict:
+        return {
+            "timeout": self.playwright_timeout,
+            "ws_url": self.playwright_ws_url,
+            "headless": self.headless,
+            "proxy": self.proxy,
+        }
+
     def lazy_load(self) -> Iterator[Document]:
         """Safely load URLs synchronously with support for remote browser."""
+        if (
+            ENABLE_PLAYWRIGHT_BROWSER_POOL
+            and PLAYWRIGHT_BROWSER_POOL.is_available_from_thread()
+        ):
+            yield from self._lazy_load_pooled()
+            return
+
         from playwright.sync_api import sync_playwright
 
         with sync_playwright() as p:
@@ -514,8 +703,90 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
                     raise e
             browser.close()
 
+    def _lazy_load_pooled(self) -> Iterator[Document]:
+        """Load URLs concurrently in the shared browser from a worker thread."""
+        futures = []
+        try:
+            for url in self.urls:
+                try:
+                    self._safe_process_url_sync(url)
+                except Exception as e:
+                    if self.continue_on_failure:
+                        log.exception(f"Error loading {url}: {e}")
+                        continue
+                    raise e
+
+                futures.append(
+                    (
+                        url,
+                        PLAYWRIGHT_BROWSER_POOL.submit(
+                            url,
+                            self.evaluator.evaluate_async,
+                            **self._get_pool_kwargs(),
+                        ),
+                    )
+                )
+
+            for url, future in futures:
+                try:
+                    text = future.result()
+                    yield Document(page_content=text, metadata={"source": url})
+                except Exception as e:
+                    if self.continue_on_failure:
+                        log.exception(f"Error loading {url}: {e}")
+                        continue
+                    raise e
+        finally:
+            for _, future in futures:
+                future.cancel()
+
     async def alazy_load(self) -> AsyncIterator[Document]:
         """Safely load URLs asynchronously with support for remote browser."""
+        if not ENABLE_PLAYWRIGHT_BROWSER_POOL:
+            async for document in self._alazy_load_unpooled():
+                yield document
+            return
+
+        # Safety checks and rate limiting run in order, page loads concurrently
+        tasks = []
+        try:
+            for url in self.urls:
+                try:
+                    await self._safe_process_url(url)
+                except Exception as e:
+                    if self.continue_on_failure:
+                        log.exception(f"Error loading {url}: {e}")
+                        continue
+                    raise e
+
+                tasks.append(
+                    (
+                        url,
+                        asyncio.create_task(
+                            PLAYWRIGHT_BROWSER_POOL.load(
+                                url,
+                                self.evaluator.evaluate_async,
+                                **self._get_pool_kwargs(),
+                            )
+                        ),
+                    )
+                )
+
+            for url, task in tasks:
+                try:
+                    text = await task
+                    yield Document(page_content=text, metadata={"source": url})
+                except Exception as e:
+                    if self.continue_on_failure:
+                        log.exception(f"Error loading {url}: {e}")
+                        continue
+                    raise e
+        finally:
+            for _, task in tasks:
+                task.cancel()
+
+    async def _alazy_load_unpooled(self) -> AsyncIterator[Document]:
+        """Load URLs one at a time in a browser started for this loader."""
         from playwright.async_api import async_playwright
 
         async with async_playwright() as p:
@@ -557,39 +828,71 @@ class SafeWebBaseLoader(WebBaseLoader):
         """
         super().__init__(*args, **kwargs)
         self.trust_env = trust_env
+        # url -> caching policy of its response, for the web page cache
+        self.cache_policies: Dict[str, dict] = {}
+        # url -> cached page confirmed unchanged by a conditional request
+        self.not_modified: Dict[str, dict] = {}
 
     async def _fetch(
         self, url: str, retries: int = 3, cooldown: int = 2, backoff: float = 1.5
     ) -> str:
-        async with aiohttp.ClientSession(trust_env=self.trust_env) as session:
-            for i in range(retries):
-                try:
-                    kwargs: Dict = dict(
-                        headers=self.session.headers,
-                        cookies=self.session.cookies.get_dict(),
+        session = get_web_loader_session(self.trust_env)
+
+        # Revalidate an expired cached copy instead of downloading it again
+        headers = dict(self.session.headers)
+        stale_page = get_stale_page("safe_web", url)
+        if stale_page is not None:
+            if stale_page.get("etag"):
+                headers["If-None-Match"] = stale_page["etag"]
+            if stale_page.get("last_modified"):
+                headers["If-Modified-Since"] = stale_page["last_modified"]
+
+        for i in range(retries):
+            try:
+                kwargs: Dict = dict(
+                    headers=headers,
+                    cookies=self.session.cookies.get_dict(),
+                )
+                if not self.session.verify:
+                    kwargs["ssl"] = False
+
+                async with session.get(
+                    url,
+                    **(self.requests_kwargs | kwargs),
+                    allow_redirects=False,
+                ) as response:
+                    if self.raise_for_status:
+                        response.raise_for_status()
+
+                    policy = get_page_cache_policy(response.headers)
+                    if stale_page is not None and response.status == 304:
+                        self.not_modified[url] = stale_page
+                        self.cache_policies[url] = {
+                            **policy,
+                            "etag": policy["etag"] or stale_page.get("etag"),
+                            "last_modified": policy["last_modified"]
+                            or stale_page.get("last_modified"),
+                        }
+                        return ""
+
+                    self.cache_policies[url] = policy
+                    return await read_response_text(response, url)
+            except aiohttp.ClientConnectionError as e:
+                if i == retries - 1:
+                    raise
+                else:
+                    log.warning(
+                        f"Error fetching {url} with attempt "
+                        f"{i + 1}/{retries}: {e}. Retrying..."
                     )
-                    if not self.session.verify:
-                        kwargs["ssl"] = False
-
-                    async with session.get(
-                        url,
-                        **(self.requests_kwargs | kwargs),
-                        allow_redirects=False,
-                    ) as response:
-                        if self.raise_for_status:
-                            response.raise_for_status()
-                        return await response.text()
-                except aiohttp.ClientConnectionError as e:
-                    if i == retries - 1:
-                        raise
-                    else:
-                        log.warning(
-                            f"Error fetching {url} with attempt "
-                            f"{i + 1}/{retries}: {e}. Retrying..."
-                        )
-                        await asyncio.sleep(cooldown * backoff**i)
+                    await asyncio.sleep(cooldown * backoff**i)
         raise ValueError("retry count exceeded")
 
+    def _get_parser(self, url: str) -> str:
+        parser = "xml" if url.endswith(".xml") else self.default_parser
+        self._check_parser(parser)
+        return parser
+
     def _unpack_fetch_results(
         self, results: Any, urls: List[str], parser: Union[str, None] = None
     ) -> List[Any]:
@@ -600,11 +903,7 @@ class SafeWebBaseLoader(WebBaseLoader):
         for i, result in enumerate(results):
             url = urls[i]
             if parser is None:
-                if url.endswith(".xml"):
-                    parser = "xml"
-                else:
-                    parser = self.default_parser
-                self._check_parser(parser)
+                parser = self._get_parser(url)
             final_results.append(BeautifulSoup(result, parser, **self.bs_kwargs))
         return final_results
 
@@ -632,19 +931,31 @@ class SafeWebBaseLoader(WebBaseLoader):
 
     async def alazy_load(self) -> AsyncIterator[Document]:
         """Async lazy load text from the url(s) in web_path."""
-        results = await self.ascrape_all(self.web_paths)
-        for path, soup in zip(self.web_paths, results):
-            text = soup.get_text(**self.bs_get_text_kwargs)
-            metadata = {"source": path}
-            if title := soup.find("title"):
-                metadata["title"] = title.get_text()
-            if description := soup.find("meta", attrs={"name": "description"}):
-                metadata["description"] = description.get(
-                    "content", "No description found."
+        results = await self.fetch_all(self.web_paths)
+        paths = [path for path in self.web_paths if path not in self.not_modified]
+        # Parsing large pages is CPU-bound, keep it off the event loop
+        extracted = await asyncio.gather(
+            *[
+                aextract_html(
+                    result,
+                    path,
+                    self._get_parser(path),
+                    self.bs_kwargs,
+                    self.bs_get_text_kwargs,
                 )
-            if html := soup.find("html"):
-                metadata["language"] = html.get("lang", "No language found.")
-            yield Document(page_content=text, metadata=metadata)
+                for path, result in zip(self.web_paths, results)
+                if path not in self.not_modified
+            ]
+        )
+        extracted = dict(zip(paths, extracted))
+
+        for path in self.web_paths:
+            if path in self.not_modified:
+                for document in copy_docs(self.not_modified[path]["docs"]):
+                    yield document
+            else:
+                text, metadata = extracted[path]
+                yield Document(page_content=text, metadata=metadata)
 
     async def aload(self) -> list[Document]:
         """Load data into Document objects."""
@@ -664,6 +975,31 @@ def get_web_loader(
         log.warning(f"All provided URLs were blocked or invalid: {urls}")
         raise ValueError(ERROR_MESSAGES.INVALID_URL)
 
+    return create_web_loader(safe_urls, verify_ssl, requests_per_second, trust_env)
+
+
+async def aget_web_loader(
+    urls: Union[str, Sequence[str]],
+    verify_ssl: bool = True,
+    requests_per_second: int = 2,
+    trust_env: bool = False,
+):
+    """`get_web_loader` resolving the URLs' hostnames off the event loop."""
+    safe_urls = await asafe_validate_urls([urls] if isinstance(urls, str) else urls)
+
+    if not safe_urls:
+        log.warning(f"All provided URLs were blocked or invalid: {urls}")
+        raise ValueError(ERROR_MESSAGES.INVALID_URL)
+
+    return create_web_loader(safe_urls, verify_ssl, requests_per_second, trust_env)
+
+
+def create_web_loader(
+    safe_urls: Sequence[str],
+    verify_ssl: bool = True,
+    requests_per_second: int = 2,
+    trust_env: bool = False,
+):
     web_loader_args = {
         "web_paths": safe_urls,
         "verify_ssl": verify_ssl,
@@ -7,7 +7,7 @@ import html
 import base64
 from functools import lru_cache
 from pydub import AudioSegment
-from pydub.silence import split_on_silence
+from pydub.silence import split_on_silence, detect_silence
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
@@ -29,7 +29,7 @@ from fastapi import (
     APIRouter,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 
 
@@ -40,6 +40,7 @@ from open_webui.config import (
     WHISPER_MODEL_DIR,
     CACHE_DIR,
     WHISPER_LANGUAGE,
+    WHISPER_BATCH_SIZE,
     ELEVENLABS_API_BASE_URL,
 )
 
@@ -62,6 +63,10 @@ MAX_FILE_SIZE = MAX_FILE_SIZE_MB * 1024 * 1024  # Convert MB to bytes
 AZURE_MAX_FILE_SIZE_MB = 200
 AZURE_MAX_FILE_SIZE = AZURE_MAX_FILE_SIZE_MB * 1024 * 1024  # Convert MB to bytes
 
+# Chunk boundaries are moved to the nearest pause within this window
+SILENCE_SEARCH_WINDOW_MS = 10000
+SILENCE_MIN_LEN_MS = 300
+
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["AUDIO"])
 
@@ -146,6 +151,56 @@ def set_faster_whisper_model(model: str, auto_update: bool = False):
     return whisper_model
 
 
+def get_faster_whisper_model(request):
+    if request.app.state.faster_whisper_model is None:
+        request.app.state.faster_whisper_model = set_faster_whisper_model(
+            request.app.state.config.WHISPER_MODEL
+        )
+    return request.app.state.faster_whisper_model
+
+
+def transcribe_local_segments(request, file_path, language=None):
+    """
+    Transcribe a file with the local faster-whisper model, yielding segments as
+    they are decoded.
+
+    When WHISPER_BATCH_SIZE is set, the audio is segmented on speech activity (VAD)
+    and the segments are decoded in batches, so the file never needs to be split
+    or re-encoded beforehand.
+    """
+    model = get_faster_whisper_model(request)
+
+    if WHISPER_BATCH_SIZE > 0:
+        from faster_whisper import BatchedInferencePipeline
+
+        segments, info = BatchedInferencePipeline(model=model).transcribe(
+            file_path,
+            beam_size=5,
+            language=language,
+            vad_filter=True,
+            batch_size=WHISPER_BATCH_SIZE,
+        )
+    else:
+        segments, info = model.transcribe(
+            file_path,
+            beam_size=5,
+            vad_filter=request.app.state.config.WHISPER_VAD_FILTER,
+            language=language,
+        )
+
+    log.info(
+        "Detected language '%s' with probability %f"
+        % (info.language, info.language_probability)
+    )
+
+    for segment in segments:
+        yield {
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+        }
+
+
 ##########################################
 #
 # Audio API
@@ -577,24 +632,9 @@ def transcription_handler(request, file_path, metadata, user=None):
     ]
 
     if request.app.state.config.STT_ENGINE == "":
-        if request.app.state.faster_whisper_model is None:
-            request.app.state.faster_whisper_model = set_faster_whisper_model(
-                request.app.state.config.WHISPER_MODEL
-            )
-
-        model = request.app.state.faster_whisper_model
-        segments, info = model.transcribe(
-            file_path,
-            beam_size=5,
-            vad_filter=request.app.state.config.WHISPER_VAD_FILTER,
-            language=languages[0],
-        )
-        log.info(
-            "Detected language '%s' with probability %f"
-            % (info.language, info.language_probability)
-        )
+        segments = transcribe_local_segments(request, file_path, languages[0])
 
-        transcript = "".join([segment.text for segment in list(segments)])
+        transcript = "".join([segment["text"] for segment in segments])
         data = {"text": transcript.strip()}
 
         # save the transcript to a json file
@@ -1025,11 +1065,13 @@ def transcription_handler(request, file_path, metadata, user=None):
             )
 
 
-def transcribe(
-    request: Request, file_path: str, metadata: Optional[dict] = None, user=None
-):
-    log.info(f"transcribe: {file_path} {metadata}")
-
+def get_transcription_chunks(
+    request: Request, file_path: str
+) -> tuple[str, list[str]]:
+    """
+    Prepare an uploaded file for a remote STT engine: convert it if needed,
+    compress it and split it into chunks that fit the engine's upload limit.
+    """
     if is_audio_conversion_required(file_path):
         file_path = convert_audio_to_mp3(file_path)
 
@@ -1041,7 +1083,7 @@ def transcribe(
     # Always produce a list of chunk paths (could be one entry if small)
     try:
         chunk_paths = split_audio(file_path, MAX_FILE_SIZE)
-        print(f"Chunk paths: {chunk_paths}")
+        log.debug(f"Chunk paths: {chunk_paths}")
     except Exception as e:
         log.exception(e)
         raise HTTPException(
@@ -1049,6 +1091,31 @@ def transcribe(
             detail=ERROR_MESSAGES.DEFAULT(e),
         )
 
+    return file_path, chunk_paths
+
+
+def cleanup_transcription_chunks(file_path: str, chunk_paths: list[str]):
+    # Clean up only the temporary chunks, never the original file
+    for chunk_path in chunk_paths:
+        if chunk_path != file_path and os.path.isfile(chunk_path):
+            try:
+                os.remove(chunk_path)
+            except Exception:
+                pass
+
+
+def transcribe(
+    request: Request, file_path: str, metadata: Optional[dict] = None, user=None
+):
+    log.info(f"transcribe: {file_path} {metadata}")
+
+    if request.app.state.config.STT_ENGINE == "":
+        # The local model decodes any ffmpeg-readable input and segments it on
+        # speech activity itself, so conversion, compression and splitting are skipped.
+        return transcription_handler(request, file_path, metadata, user)
+
+    file_path, chunk_paths = get_transcription_chunks(request, file_path)
+
     results = []
     try:
         with ThreadPoolExecutor() as executor:
@@ -1069,19 +1136,58 @@ def transcribe(
                         detail=f"Error transcribing chunk: {transcribe_exc}",
                     )
     finally:
-        # Clean up only the temporary chunks, never the original file
-        for chunk_path in chunk_paths:
-            if chunk_path != file_path and os.path.isfile(chunk_path):
-                try:
-                    os.remove(chunk_path)
-                except Exception:
-                    pass
+        cleanup_transcription_chunks(file_path, chunk_paths)
 
     return {
         "text": " ".join([result["text"] for result in results]),
     }
 
 
+def transcribe_stream(
+    request: Request, file_path: str, metadata: Optional[dict] = None, user=None
+):
+    """
+    Same as `transcribe`, but yields partial transcripts as soon as they are
+    available: one event per decoded segment for the local engine, one event per
+    chunk (in order) for remote engines, followed by a final event with the full text.
+    """
+    log.info(f"transcribe_stream: {file_path} {metadata}")
+    metadata = metadata or {}
+
+    texts = []
+    if request.app.state.config.STT_ENGINE == "":
+        language = (
+            WHISPER_LANGUAGE if WHISPER_LANGUAGE else metadata.get("language", None)
+        )
+        for idx, segment in enumerate(
+            transcribe_local_segments(request, file_path, language)
+        ):
+            texts.append(segment["text"])
+            yield {"type": "segment", "index": idx, **segment}
+
+        yield {"type": "done", "text": "".join(texts).strip()}
+        return
+
+    file_path, chunk_paths = get_transcription_chunks(request, file_path)
+    try:
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    transcription_handler, request, chunk_path, metadata, user
+                )
+                for chunk_path in chunk_paths
+            ]
+            # Chunks are transcribed concurrently but delivered in order
+            for idx, future in enumerate(futures):
+                text = future.result().get("text", "")
+                texts.append(text)
+                yield {"type": "segment", "index": idx, "text": text}
+    finally:
+        cleanup_transcription_chunks(file_path, chunk_paths)
+
+    yield {"type": "done", "text": " ".join(texts)}
+
+
 def compress_audio(file_path):
     if os.path.getsize(file_path) > MAX_FILE_SIZE:
         id = os.path.splitext(os.path.basename(file_path))[
@@ -1101,9 +1207,33 @@ def compress_audio(file_path):
         return file_path
 
 
+def find_silence_split_point(audio, start_ms, end_ms):
+    """
+    Return a split position close to end_ms that falls inside a pause, so chunks
+    do not cut words in half. Falls back to end_ms when no pause is found.
+    """
+    window_start = max(start_ms, end_ms - SILENCE_SEARCH_WINDOW_MS)
+    window = audio[window_start:end_ms]
+    if len(window) < SILENCE_MIN_LEN_MS:
+        return end_ms
+
+    silences = detect_silence(
+        window,
+        min_silence_len=SILENCE_MIN_LEN_MS,
+        silence_thresh=audio.dBFS - 16,
+    )
+    if not silences:
+        return end_ms
+
+    # Use the middle of the last pause in the window
+    silence_start, silence_end = silences[-1]
+    split_point = window_start + (silence_start + silence_end) // 2
+    return split_point if split_point > start_ms else end_ms
+
+
 def split_audio(file_path, max_bytes, format="mp3", bitrate="32k"):
     """
-    Splits audio into chunks not exceeding max_bytes.
+    Splits audio into chunks not exceeding max_bytes, cutting at pauses where possible.
     Returns a list of chunk file paths. If audio fits, returns list with original path.
     """
     file_size = os.path.getsize(file_path)
@@ -1123,6 +1253,9 @@ def split_audio(file_path, max_bytes, format="mp3", bitrate="32k"):
 
     while start < duration_ms:
         end = min(start + approx_chunk_ms, duration_ms)
+        if end < duration_ms:
+            end = find_silence_split_point(audio, start, end)
+
         chunk = audio[start:end]
         chunk_path = f"{base}_chunk_{i}.{format}"
         chunk.export(chunk_path, format=format, bitrate=bitrate)
@@ -1149,6 +1282,7 @@ def transcription(
     request: Request,
     file: UploadFile = File(...),
     language: Optional[str] = Form(None),
+    stream: bool = Form(False),
     user=Depends(get_verified_user),
 ):
     log.info(f"file.content_type: {file.content_type}")
@@ -1191,6 +1325,24 @@ def transcription(
             if language:
                 metadata = {"language": language}
 
+            if stream:
+
+                def event_stream():
+                    try:
+                        for event in transcribe_stream(
+                            request, file_path, metadata, user
+                        ):
+                            if event["type"] == "done":
+                                event["filename"] = os.path.basename(file_path)
+                            yield f"data: {json.dumps(event)}\n\n"
+                    except Exception as e:
+                        log.exception(e)
+                        yield f"data: {json.dumps({'type': 'error', 'detail': str(e)})}\n\n"
+
+                return StreamingResponse(
+                    event_stream(), media_type="text/event-stream"
+                )
+
             result = transcribe(request, file_path, metadata, user)
 
             return {
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import quote
 import asyncio
+import anyio.from_thread
 
 from fastapi import (
     BackgroundTasks,
@@ -16,11 +17,13 @@ from fastapi import (
     Form,
     HTTPException,
     Request,
+    Response,
     UploadFile,
     status,
     Query,
 )
 
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, StreamingResponse
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
@@ -85,7 +88,9 @@ def has_access_to_file(
 ############################
 
 
-def process_uploaded_file(request, file, file_path, file_item, file_metadata, user):
+async def process_uploaded_file(
+    request, file, file_path, file_item, file_metadata, user
+):
     try:
         if file.content_type:
             stt_supported_content_types = getattr(
@@ -101,10 +106,12 @@ def process_uploaded_file(request, file, file_path, file_item, file_metadata, us
                     else ["audio/*", "video/webm"]
                 )
             ):
-                file_path = Storage.get_file(file_path)
-                result = transcribe(request, file_path, file_metadata, user)
+                file_path = await run_in_threadpool(Storage.get_file, file_path)
+                result = await run_in_threadpool(
+                    transcribe, request, file_path, file_metadata, user
+                )
 
-                process_file(
+                await process_file(
                     request,
                     ProcessFileForm(
                         file_id=file_item.id, content=result.get("text", "")
@@ -114,7 +121,9 @@ def process_uploaded_file(request, file, file_path, file_item, file_metadata, us
             elif (not file.content_type.startswith(("image/", "video/"))) or (
                 request.app.state.config.CONTENT_EXTRACTION_ENGINE == "external"
             ):
-                process_file(request, ProcessFileForm(file_id=file_item.id), user=user)
+                await process_file(
+                    request, ProcessFileForm(file_id=file_item.id), user=user
+                )
             else:
                 raise Exception(
                     f"File type {file.content_type} is not supported for processing"
@@ -123,7 +132,9 @@ def process_uploaded_file(request, file, file_path, file_item, file_metadata, us
             log.info(
                 f"File type {file.content_type} is not provided, but trying to process anyway"
             )
-            process_file(request, ProcessFileForm(file_id=file_item.id), user=user)
+            await process_file(
+                request, ProcessFileForm(file_id=file_item.id), user=user
+            )
     except Exception as e:
         log.error(f"Error processing file: {file_item.id}")
         Files.update_file_data_by_id(
@@ -246,7 +257,9 @@ def upload_file_handler(
                 )
                 return {"status": True, **file_item.model_dump()}
             else:
-                process_uploaded_file(
+                # Called from the threadpool, so the event loop is free to run it
+                anyio.from_thread.run(
+                    process_uploaded_file,
                     request,
                     file,
                     file_path,
@@ -278,16 +291,32 @@ def upload_file_handler(
 
 
 @router.get("/", response_model=list[FileModelResponse])
-async def list_files(user=Depends(get_verified_user), content: bool = Query(True)):
-    if user.role == "admin":
-        files = Files.get_files()
-    else:
-        files = Files.get_files_by_user_id(user.id)
+async def list_files(
+    response: Response,
+    user=Depends(get_verified_user),
+    content: bool = Query(True),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+):
+    """
+    List files, newest first. When `limit` is set, the cursor for the next
+    page is returned in the `X-Next-Cursor` response header.
+    """
+    try:
+        files, next_cursor = Files.get_files_page(
+            user_id=None if user.role == "admin" else user.id,
+            include_content=content,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(e),
+        )
 
-    if not content:
-        for file in files:
-            if "content" in file.data:
-                del file.data["content"]
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return files
 
@@ -299,37 +328,47 @@ async def list_files(user=Depends(get_verified_user), content: bool = Query(True
 
 @router.get("/search", response_model=list[FileModelResponse])
 async def search_files(
+    response: Response,
     filename: str = Query(
         ...,
         description="Filename pattern to search for. Supports wildcards such as '*.txt'",
     ),
     content: bool = Query(True),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
     user=Depends(get_verified_user),
 ):
     """
     Search for files by filename with support for wildcard patterns.
     """
-    # Get files according to user role
-    if user.role == "admin":
-        files = Files.get_files()
-    else:
-        files = Files.get_files_by_user_id(user.id)
-
-    # Get matching files
-    matching_files = [
-        file for file in files if fnmatch(file.filename.lower(), filename.lower())
-    ]
+    try:
+        # Patterns SQL LIKE cannot express exactly are rechecked per row, which
+        # can empty a page, so keep reading until a match or the last page
+        next_cursor = cursor
+        while True:
+            matching_files, next_cursor = Files.get_files_page(
+                user_id=None if user.role == "admin" else user.id,
+                filename=filename,
+                include_content=content,
+                cursor=next_cursor,
+                limit=limit,
+            )
+            if matching_files or not next_cursor:
+                break
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(e),
+        )
 
-    if not matching_files:
+    if not matching_files and not cursor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No files found matching the pattern.",
         )
 
-    if not content:
-        for file in matching_files:
-            if "content" in file.data:
-                del file.data["content"]
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return matching_files
 
@@ -501,7 +540,7 @@ async def update_file_data_content_by_id(
         or has_access_to_file(id, "write", user)
     ):
         try:
-            process_file(
+            await process_file(
                 request,
                 ProcessFileForm(file_id=id, content=form_data.content),
                 user=user,
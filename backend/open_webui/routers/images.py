@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional
 
 from urllib.parse import quote
+import aiohttp
 import requests
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse
@@ -20,6 +21,10 @@ from open_webui.env import ENABLE_FORWARD_USER_INFO_HEADERS, SRC_LOG_LEVELS
 from open_webui.routers.files import upload_file_handler, get_file_content_by_id
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.images.client import (
+    request as image_backend_request,
+    fetch_image_data,
+)
 from open_webui.utils.images.comfyui import (
     ComfyUICreateImageForm,
     ComfyUIEditImageForm,
@@ -494,6 +499,20 @@ def get_image_data(data: str, headers=None):
         return None, None
 
 
+async def load_image_data(data: str, headers=None):
+    """
+    Same as `get_image_data`, but URLs are fetched over the shared image-backend
+    session instead of blocking the event loop.
+    """
+    if data.startswith("http://") or data.startswith("https://"):
+        try:
+            return await fetch_image_data(data, headers)
+        except Exception as e:
+            log.exception(f"Error loading image data: {e}")
+            return None, None
+    return get_image_data(data)
+
+
 def upload_image(request, image_data, content_type, metadata, user):
     image_format = mimetypes.guess_extension(content_type)
     file = UploadFile(
@@ -519,6 +538,15 @@ async def image_generations(
     request: Request,
     form_data: CreateImageForm,
     user=Depends(get_verified_user),
+):
+    return await generate_images(request, form_data, user)
+
+
+async def generate_images(
+    request: Request,
+    form_data: CreateImageForm,
+    user,
+    event_emitter=None,
 ):
     # if IMAGE_SIZE = 'auto', default WidthxHeight to the 512x512 default
     # This is only relevant when the user has set IMAGE_SIZE to 'auto' with an
@@ -574,10 +602,9 @@ async def image_generations(
                 ),
             }
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=url,
+            r = await image_backend_request(
+                "POST",
+                url,
                 json=data,
                 headers=headers,
             )
@@ -589,7 +616,9 @@ async def image_generations(
 
             for image in res["data"]:
                 if image_url := image.get("url", None):
-                    image_data, content_type = get_image_data(image_url, headers)
+                    image_data, content_type = await load_image_data(
+                        image_url, headers
+                    )
                 else:
                     image_data, content_type = get_image_data(image["b64_json"])
 
@@ -625,10 +654,9 @@ async def image_generations(
                 model = f"{model}:generateContent"
                 data = {"contents": [{"parts": [{"text": form_data.prompt}]}]}
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.IMAGES_GEMINI_API_BASE_URL}/models/{model}",
+            r = await image_backend_request(
+                "POST",
+                f"{request.app.state.config.IMAGES_GEMINI_API_BASE_URL}/models/{model}",
                 json=data,
                 headers=headers,
             )
@@ -687,9 +715,9 @@ async def image_generations(
             res = await comfyui_create_image(
                 model,
                 form_data,
-                user.id,
                 request.app.state.config.COMFYUI_BASE_URL,
                 request.app.state.config.COMFYUI_API_KEY,
+                event_emitter,
             )
             log.debug(f"res: {res}")
 
@@ -702,7 +730,9 @@ async def image_generations(
                         "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
                     }
 
-                image_data, content_type = get_image_data(image["url"], headers)
+                image_data, content_type = await load_image_data(
+                    image["url"], headers
+                )
                 url = upload_image(
                     request,
                     image_data,
@@ -735,10 +765,9 @@ async def image_generations(
             if request.app.state.config.AUTOMATIC1111_PARAMS:
                 data = {**data, **request.app.state.config.AUTOMATIC1111_PARAMS}
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/txt2img",
+            r = await image_backend_request(
+                "POST",
+                f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/txt2img",
                 json=data,
                 headers={"authorization": get_automatic1111_api_auth(request)},
             )
@@ -782,6 +811,15 @@ async def image_edits(
     request: Request,
     form_data: EditImageForm,
     user=Depends(get_verified_user),
+):
+    return await edit_images(request, form_data, user)
+
+
+async def edit_images(
+    request: Request,
+    form_data: EditImageForm,
+    user,
+    event_emitter=None,
 ):
     size = None
     width, height = None, None
@@ -806,7 +844,7 @@ async def image_edits(
 
         async def load_url_image(data):
             if data.startswith("http://") or data.startswith("https://"):
-                r = await asyncio.to_thread(requests.get, data)
+                r = await image_backend_request("GET", data)
                 r.raise_for_status()
 
                 image_data = base64.b64encode(r.content).decode("utf-8")
@@ -883,13 +921,19 @@ async def image_edits(
             if request.app.state.config.IMAGES_EDIT_OPENAI_API_VERSION:
                 url_search_params += f"?api-version={request.app.state.config.IMAGES_EDIT_OPENAI_API_VERSION}"
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.IMAGES_EDIT_OPENAI_API_BASE_URL}/images/edits{url_search_params}",
+            form = aiohttp.FormData()
+            for key, value in data.items():
+                form.add_field(key, str(value))
+            for param_name, (filename, file_bytes, mime_type) in files:
+                form.add_field(
+                    param_name, file_bytes, filename=filename, content_type=mime_type
+                )
+
+            r = await image_backend_request(
+                "POST",
+                f"{request.app.state.config.IMAGES_EDIT_OPENAI_API_BASE_URL}/images/edits{url_search_params}",
                 headers=headers,
-                files=files,
-                data=data,
+                data=form,
             )
 
             r.raise_for_status()
@@ -898,7 +942,9 @@ async def image_edits(
             images = []
             for image in res["data"]:
                 if image_url := image.get("url", None):
-                    image_data, content_type = get_image_data(image_url, headers)
+                    image_data, content_type = await load_image_data(
+                        image_url, headers
+                    )
                 else:
                     image_data, content_type = get_image_data(image["b64_json"])
 
@@ -937,10 +983,9 @@ async def image_edits(
                     ]
                 )
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.IMAGES_EDIT_GEMINI_API_BASE_URL}/models/{model}",
+            r = await image_backend_request(
+                "POST",
+                f"{request.app.state.config.IMAGES_EDIT_GEMINI_API_BASE_URL}/models/{model}",
                 json=data,
                 headers=headers,
             )
@@ -1006,9 +1051,9 @@ async def image_edits(
             res = await comfyui_edit_image(
                 model,
                 form_data,
-                user.id,
                 request.app.state.config.IMAGES_EDIT_COMFYUI_BASE_URL,
                 request.app.state.config.IMAGES_EDIT_COMFYUI_API_KEY,
+                event_emitter,
             )
             log.debug(f"res: {res}")
 
@@ -1032,7 +1077,7 @@ async def image_edits(
                         "Authorization": f"Bearer {request.app.state.config.IMAGES_EDIT_COMFYUI_API_KEY}"
                     }
 
-                image_data, content_type = get_image_data(image_url, headers)
+                image_data, content_type = await load_image_data(image_url, headers)
                 url = upload_image(
                     request,
                     image_data,
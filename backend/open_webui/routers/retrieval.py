@@ -4,6 +4,7 @@ import mimetypes
 import os
 import shutil
 import asyncio
+import itertools
 
 import re
 import uuid
@@ -28,8 +29,6 @@ from pydantic import BaseModel
 import tiktoken
 
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter, TokenTextSplitter
-from langchain_text_splitters import MarkdownHeaderTextSplitter
 from langchain_core.documents import Document
 
 from open_webui.models.files import FileModel, FileUpdateForm, Files
@@ -42,10 +41,21 @@ from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
 # Document loaders
 from open_webui.retrieval.loaders.main import Loader
 from open_webui.retrieval.loaders.youtube import YoutubeLoader
+from open_webui.retrieval.text_splitter import TEXT_SPLITTERS, iter_split_documents
 
 # Web search engines
 from open_webui.retrieval.web.main import SearchResult
-from open_webui.retrieval.web.utils import get_web_loader
+from open_webui.retrieval.vector.lifecycle import register_ephemeral_collection
+from open_webui.retrieval.web.cache import (
+    USER_SCOPED_SEARCH_ENGINES,
+    WEB_SEARCH_RESULTS_CACHE,
+    embed_with_cache,
+    get_cache_stats,
+    get_cached_pages,
+    get_search_cache_key,
+    set_cached_pages,
+)
+from open_webui.retrieval.web.utils import aget_web_loader
 from open_webui.retrieval.web.ollama import search_ollama_cloud
 from open_webui.retrieval.web.perplexity_search import search_perplexity_search
 from open_webui.retrieval.web.brave import search_brave
@@ -106,6 +116,8 @@ from open_webui.env import (
     SENTENCE_TRANSFORMERS_MODEL_KWARGS,
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_BACKEND,
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_MODEL_KWARGS,
+    SENTENCE_TRANSFORMERS_EXECUTION_MODE,
+    WEB_SEARCH_COLLECTION_TTL,
 )
 
 from open_webui.constants import ERROR_MESSAGES
@@ -127,16 +139,25 @@ def get_ef(
 ):
     ef = None
     if embedding_model and engine == "":
-        from sentence_transformers import SentenceTransformer
+        model_kwargs = {
+            "model_name_or_path": get_model_path(embedding_model, auto_update),
+            "device": DEVICE_TYPE,
+            "trust_remote_code": RAG_EMBEDDING_MODEL_TRUST_REMOTE_CODE,
+            "backend": SENTENCE_TRANSFORMERS_BACKEND,
+            "model_kwargs": SENTENCE_TRANSFORMERS_MODEL_KWARGS,
+        }
 
         try:
-            ef = SentenceTransformer(
-                get_model_path(embedding_model, auto_update),
-                device=DEVICE_TYPE,
-                trust_remote_code=RAG_EMBEDDING_MODEL_TRUST_REMOTE_CODE,
-                backend=SENTENCE_TRANSFORMERS_BACKEND,
-                model_kwargs=SENTENCE_TRANSFORMERS_MODEL_KWARGS,
-            )
+            if SENTENCE_TRANSFORMERS_EXECUTION_MODE == "process":
+                from open_webui.retrieval.models.embedding_batcher import (
+                    SentenceTransformerProcess,
+                )
+
+                ef = SentenceTransformerProcess(**model_kwargs)
+            else:
+                from sentence_transformers import SentenceTransformer
+
+                ef = SentenceTransformer(**model_kwargs)
         except Exception as e:
             log.debug(f"Error loading SentenceTransformer: {e}")
 
@@ -305,6 +326,11 @@ class EmbeddingModelUpdateForm(BaseModel):
 def unload_embedding_model(request: Request):
     if request.app.state.config.RAG_EMBEDDING_ENGINE == "":
         # unloads current internal embedding model and clears VRAM cache
+        from open_webui.retrieval.models.embedding_batcher import (
+            close_embedding_model,
+        )
+
+        close_embedding_model(request.app.state.ef)
         request.app.state.ef = None
         request.app.state.EMBEDDING_FUNCTION = None
         import gc
@@ -686,419 +712,428 @@ class ConfigForm(BaseModel):
 async def update_rag_config(
     request: Request, form_data: ConfigForm, user=Depends(get_admin_user)
 ):
-    # RAG settings
-    request.app.state.config.RAG_TEMPLATE = (
-        form_data.RAG_TEMPLATE
-        if form_data.RAG_TEMPLATE is not None
-        else request.app.state.config.RAG_TEMPLATE
-    )
-    request.app.state.config.TOP_K = (
-        form_data.TOP_K
-        if form_data.TOP_K is not None
-        else request.app.state.config.TOP_K
-    )
-    request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL = (
-        form_data.BYPASS_EMBEDDING_AND_RETRIEVAL
-        if form_data.BYPASS_EMBEDDING_AND_RETRIEVAL is not None
-        else request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
-    )
-    request.app.state.config.RAG_FULL_CONTEXT = (
-        form_data.RAG_FULL_CONTEXT
-        if form_data.RAG_FULL_CONTEXT is not None
-        else request.app.state.config.RAG_FULL_CONTEXT
-    )
-
-    # Hybrid search settings
-    request.app.state.config.ENABLE_RAG_HYBRID_SEARCH = (
-        form_data.ENABLE_RAG_HYBRID_SEARCH
-        if form_data.ENABLE_RAG_HYBRID_SEARCH is not None
-        else request.app.state.config.ENABLE_RAG_HYBRID_SEARCH
-    )
-    request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS = (
-        form_data.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
-        if form_data.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS is not None
-        else request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
-    )
-
-    request.app.state.config.TOP_K_RERANKER = (
-        form_data.TOP_K_RERANKER
-        if form_data.TOP_K_RERANKER is not None
-        else request.app.state.config.TOP_K_RERANKER
-    )
-    request.app.state.config.RELEVANCE_THRESHOLD = (
-        form_data.RELEVANCE_THRESHOLD
-        if form_data.RELEVANCE_THRESHOLD is not None
-        else request.app.state.config.RELEVANCE_THRESHOLD
-    )
-    request.app.state.config.HYBRID_BM25_WEIGHT = (
-        form_data.HYBRID_BM25_WEIGHT
-        if form_data.HYBRID_BM25_WEIGHT is not None
-        else request.app.state.config.HYBRID_BM25_WEIGHT
-    )
-
-    # Content extraction settings
-    request.app.state.config.CONTENT_EXTRACTION_ENGINE = (
-        form_data.CONTENT_EXTRACTION_ENGINE
-        if form_data.CONTENT_EXTRACTION_ENGINE is not None
-        else request.app.state.config.CONTENT_EXTRACTION_ENGINE
-    )
-    request.app.state.config.PDF_EXTRACT_IMAGES = (
-        form_data.PDF_EXTRACT_IMAGES
-        if form_data.PDF_EXTRACT_IMAGES is not None
-        else request.app.state.config.PDF_EXTRACT_IMAGES
-    )
-    request.app.state.config.DATALAB_MARKER_API_KEY = (
-        form_data.DATALAB_MARKER_API_KEY
-        if form_data.DATALAB_MARKER_API_KEY is not None
-        else request.app.state.config.DATALAB_MARKER_API_KEY
-    )
-    request.app.state.config.DATALAB_MARKER_API_BASE_URL = (
-        form_data.DATALAB_MARKER_API_BASE_URL
-        if form_data.DATALAB_MARKER_API_BASE_URL is not None
-        else request.app.state.config.DATALAB_MARKER_API_BASE_URL
-    )
-    request.app.state.config.DATALAB_MARKER_ADDITIONAL_CONFIG = (
-        form_data.DATALAB_MARKER_ADDITIONAL_CONFIG
-        if form_data.DATALAB_MARKER_ADDITIONAL_CONFIG is not None
-        else request.app.state.config.DATALAB_MARKER_ADDITIONAL_CONFIG
-    )
-    request.app.state.config.DATALAB_MARKER_SKIP_CACHE = (
-        form_data.DATALAB_MARKER_SKIP_CACHE
-        if form_data.DATALAB_MARKER_SKIP_CACHE is not None
-        else request.app.state.config.DATALAB_MARKER_SKIP_CACHE
-    )
-    request.app.state.config.DATALAB_MARKER_FORCE_OCR = (
-        form_data.DATALAB_MARKER_FORCE_OCR
-        if form_data.DATALAB_MARKER_FORCE_OCR is not None
-        else request.app.state.config.DATALAB_MARKER_FORCE_OCR
-    )
-    request.app.state.config.DATALAB_MARKER_PAGINATE = (
-        form_data.DATALAB_MARKER_PAGINATE
-        if form_data.DATALAB_MARKER_PAGINATE is not None
-        else request.app.state.config.DATALAB_MARKER_PAGINATE
-    )
-    request.app.state.config.DATALAB_MARKER_STRIP_EXISTING_OCR = (
-        form_data.DATALAB_MARKER_STRIP_EXISTING_OCR
-        if form_data.DATALAB_MARKER_STRIP_EXISTING_OCR is not None
-        else request.app.state.config.DATALAB_MARKER_STRIP_EXISTING_OCR
-    )
-    request.app.state.config.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION = (
-        form_data.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION
-        if form_data.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION is not None
-        else request.app.state.config.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION
-    )
-    request.app.state.config.DATALAB_MARKER_FORMAT_LINES = (
-        form_data.DATALAB_MARKER_FORMAT_LINES
-        if form_data.DATALAB_MARKER_FORMAT_LINES is not None
-        else request.app.state.config.DATALAB_MARKER_FORMAT_LINES
-    )
-    request.app.state.config.DATALAB_MARKER_OUTPUT_FORMAT = (
-        form_data.DATALAB_MARKER_OUTPUT_FORMAT
-        if form_data.DATALAB_MARKER_OUTPUT_FORMAT is not None
-        else request.app.state.config.DATALAB_MARKER_OUTPUT_FORMAT
-    )
-    request.app.state.config.DATALAB_MARKER_USE_LLM = (
-        form_data.DATALAB_MARKER_USE_LLM
-        if form_data.DATALAB_MARKER_USE_LLM is not None
-        else request.app.state.config.DATALAB_MARKER_USE_LLM
-    )
-    request.app.state.config.EXTERNAL_DOCUMENT_LOADER_URL = (
-        form_data.EXTERNAL_DOCUMENT_LOADER_URL
-        if form_data.EXTERNAL_DOCUMENT_LOADER_URL is not None
-        else request.app.state.config.EXTERNAL_DOCUMENT_LOADER_URL
-    )
-    request.app.state.config.EXTERNAL_DOCUMENT_LOADER_API_KEY = (
-        form_data.EXTERNAL_DOCUMENT_LOADER_API_KEY
-        if form_data.EXTERNAL_DOCUMENT_LOADER_API_KEY is not None
-        else request.app.state.config.EXTERNAL_DOCUMENT_LOADER_API_KEY
-    )
-    request.app.state.config.TIKA_SERVER_URL = (
-        form_data.TIKA_SERVER_URL
-        if form_data.TIKA_SERVER_URL is not None
-        else request.app.state.config.TIKA_SERVER_URL
-    )
-    request.app.state.config.DOCLING_SERVER_URL = (
-        form_data.DOCLING_SERVER_URL
-        if form_data.DOCLING_SERVER_URL is not None
-        else request.app.state.config.DOCLING_SERVER_URL
-    )
-    request.app.state.config.DOCLING_API_KEY = (
-        form_data.DOCLING_API_KEY
-        if form_data.DOCLING_API_KEY is not None
-        else request.app.state.config.DOCLING_API_KEY
-    )
-    request.app.state.config.DOCLING_PARAMS = (
-        form_data.DOCLING_PARAMS
-        if form_data.DOCLING_PARAMS is not None
-        else request.app.state.config.DOCLING_PARAMS
-    )
-    request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT = (
-        form_data.DOCUMENT_INTELLIGENCE_ENDPOINT
-        if form_data.DOCUMENT_INTELLIGENCE_ENDPOINT is not None
-        else request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT
-    )
-    request.app.state.config.DOCUMENT_INTELLIGENCE_KEY = (
-        form_data.DOCUMENT_INTELLIGENCE_KEY
-        if form_data.DOCUMENT_INTELLIGENCE_KEY is not None
-        else request.app.state.config.DOCUMENT_INTELLIGENCE_KEY
-    )
-
-    request.app.state.config.MISTRAL_OCR_API_BASE_URL = (
-        form_data.MISTRAL_OCR_API_BASE_URL
-        if form_data.MISTRAL_OCR_API_BASE_URL is not None
-        else request.app.state.config.MISTRAL_OCR_API_BASE_URL
-    )
-    request.app.state.config.MISTRAL_OCR_API_KEY = (
-        form_data.MISTRAL_OCR_API_KEY
-        if form_data.MISTRAL_OCR_API_KEY is not None
-        else request.app.state.config.MISTRAL_OCR_API_KEY
-    )
-
-    # MinerU settings
-    request.app.state.config.MINERU_API_MODE = (
-        form_data.MINERU_API_MODE
-        if form_data.MINERU_API_MODE is not None
-        else request.app.state.config.MINERU_API_MODE
-    )
-    request.app.state.config.MINERU_API_URL = (
-        form_data.MINERU_API_URL
-        if form_data.MINERU_API_URL is not None
-        else request.app.state.config.MINERU_API_URL
-    )
-    request.app.state.config.MINERU_API_KEY = (
-        form_data.MINERU_API_KEY
-        if form_data.MINERU_API_KEY is not None
-        else request.app.state.config.MINERU_API_KEY
-    )
-    request.app.state.config.MINERU_PARAMS = (
-        form_data.MINERU_PARAMS
-        if form_data.MINERU_PARAMS is not None
-        else request.app.state.config.MINERU_PARAMS
-    )
-
-    # Reranking settings
-    if request.app.state.config.RAG_RERANKING_ENGINE == "":
-        # Unloading the internal reranker and clear VRAM memory
-        request.app.state.rf = None
-        request.app.state.RERANKING_FUNCTION = None
-        import gc
-
-        gc.collect()
-        if DEVICE_TYPE == "cuda":
-            import torch
-
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-    request.app.state.config.RAG_RERANKING_ENGINE = (
-        form_data.RAG_RERANKING_ENGINE
-        if form_data.RAG_RERANKING_ENGINE is not None
-        else request.app.state.config.RAG_RERANKING_ENGINE
-    )
-
-    request.app.state.config.RAG_EXTERNAL_RERANKER_URL = (
-        form_data.RAG_EXTERNAL_RERANKER_URL
-        if form_data.RAG_EXTERNAL_RERANKER_URL is not None
-        else request.app.state.config.RAG_EXTERNAL_RERANKER_URL
-    )
-
-    request.app.state.config.RAG_EXTERNAL_RERANKER_API_KEY = (
-        form_data.RAG_EXTERNAL_RERANKER_API_KEY
-        if form_data.RAG_EXTERNAL_RERANKER_API_KEY is not None
-        else request.app.state.config.RAG_EXTERNAL_RERANKER_API_KEY
-    )
-
-    log.info(
-        f"Updating reranking model: {request.app.state.config.RAG_RERANKING_MODEL} to {form_data.RAG_RERANKING_MODEL}"
-    )
-    try:
-        request.app.state.config.RAG_RERANKING_MODEL = (
-            form_data.RAG_RERANKING_MODEL
-            if form_data.RAG_RERANKING_MODEL is not None
-            else request.app.state.config.RAG_RERANKING_MODEL
+    with request.app.state.config.batch():
+        # RAG settings
+        request.app.state.config.RAG_TEMPLATE = (
+            form_data.RAG_TEMPLATE
+            if form_data.RAG_TEMPLATE is not None
+            else request.app.state.config.RAG_TEMPLATE
         )
-
-        try:
-            if (
-                request.app.state.config.ENABLE_RAG_HYBRID_SEARCH
-                and not request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
-            ):
-                request.app.state.rf = get_rf(
-                    request.app.state.config.RAG_RERANKING_ENGINE,
-                    request.app.state.config.RAG_RERANKING_MODEL,
-                    request.app.state.config.RAG_EXTERNAL_RERANKER_URL,
-                    request.app.state.config.RAG_EXTERNAL_RERANKER_API_KEY,
-                    True,
-                )
-
-                request.app.state.RERANKING_FUNCTION = get_reranking_function(
-                    request.app.state.config.RAG_RERANKING_ENGINE,
-                    request.app.state.config.RAG_RERANKING_MODEL,
-                    request.app.state.rf,
-                )
-        except Exception as e:
-            log.error(f"Error loading reranking model: {e}")
-            request.app.state.config.ENABLE_RAG_HYBRID_SEARCH = False
-    except Exception as e:
-        log.exception(f"Problem updating reranking model: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ERROR_MESSAGES.DEFAULT(e),
+        request.app.state.config.TOP_K = (
+            form_data.TOP_K
+            if form_data.TOP_K is not None
+            else request.app.state.config.TOP_K
+        )
+        request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL = (
+            form_data.BYPASS_EMBEDDING_AND_RETRIEVAL
+            if form_data.BYPASS_EMBEDDING_AND_RETRIEVAL is not None
+            else request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+        )
+        request.app.state.config.RAG_FULL_CONTEXT = (
+            form_data.RAG_FULL_CONTEXT
+            if form_data.RAG_FULL_CONTEXT is not None
+            else request.app.state.config.RAG_FULL_CONTEXT
         )
 
-    # Chunking settings
-    request.app.state.config.TEXT_SPLITTER = (
-        form_data.TEXT_SPLITTER
-        if form_data.TEXT_SPLITTER is not None
-        else request.app.state.config.TEXT_SPLITTER
-    )
-    request.app.state.config.CHUNK_SIZE = (
-        form_data.CHUNK_SIZE
-        if form_data.CHUNK_SIZE is not None
-        else request.app.state.config.CHUNK_SIZE
-    )
-    request.app.state.config.CHUNK_OVERLAP = (
-        form_data.CHUNK_OVERLAP
-        if form_data.CHUNK_OVERLAP is not None
-        else request.app.state.config.CHUNK_OVERLAP
-    )
-
-    # File upload settings
-    request.app.state.config.FILE_MAX_SIZE = form_data.FILE_MAX_SIZE
-    request.app.state.config.FILE_MAX_COUNT = form_data.FILE_MAX_COUNT
-    request.app.state.config.FILE_IMAGE_COMPRESSION_WIDTH = (
-        form_data.FILE_IMAGE_COMPRESSION_WIDTH
-    )
-    request.app.state.config.FILE_IMAGE_COMPRESSION_HEIGHT = (
-        form_data.FILE_IMAGE_COMPRESSION_HEIGHT
-    )
-    request.app.state.config.ALLOWED_FILE_EXTENSIONS = (
-        form_data.ALLOWED_FILE_EXTENSIONS
-        if form_data.ALLOWED_FILE_EXTENSIONS is not None
-        else request.app.state.config.ALLOWED_FILE_EXTENSIONS
-    )
+        # Hybrid search settings
+        request.app.state.config.ENABLE_RAG_HYBRID_SEARCH = (
+            form_data.ENABLE_RAG_HYBRID_SEARCH
+            if form_data.ENABLE_RAG_HYBRID_SEARCH is not None
+            else request.app.state.config.ENABLE_RAG_HYBRID_SEARCH
+        )
+        request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS = (
+            form_data.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
+            if form_data.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS is not None
+            else request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
+        )
 
-    # Integration settings
-    request.app.state.config.ENABLE_GOOGLE_DRIVE_INTEGRATION = (
-        form_data.ENABLE_GOOGLE_DRIVE_INTEGRATION
-        if form_data.ENABLE_GOOGLE_DRIVE_INTEGRATION is not None
-        else request.app.state.config.ENABLE_GOOGLE_DRIVE_INTEGRATION
-    )
-    request.app.state.config.ENABLE_ONEDRIVE_INTEGRATION = (
-        form_data.ENABLE_ONEDRIVE_INTEGRATION
-        if form_data.ENABLE_ONEDRIVE_INTEGRATION is not None
-        else request.app.state.config.ENABLE_ONEDRIVE_INTEGRATION
-    )
+        request.app.state.config.TOP_K_RERANKER = (
+            form_data.TOP_K_RERANKER
+            if form_data.TOP_K_RERANKER is not None
+            else request.app.state.config.TOP_K_RERANKER
+        )
+        request.app.state.config.RELEVANCE_THRESHOLD = (
+            form_data.RELEVANCE_THRESHOLD
+            if form_data.RELEVANCE_THRESHOLD is not None
+            else request.app.state.config.RELEVANCE_THRESHOLD
+        )
+        request.app.state.config.HYBRID_BM25_WEIGHT = (
+            form_data.HYBRID_BM25_WEIGHT
+            if form_data.HYBRID_BM25_WEIGHT is not None
+            else request.app.state.config.HYBRID_BM25_WEIGHT
+        )
 
-    if form_data.web is not None:
-        # Web search settings
-        request.app.state.config.ENABLE_WEB_SEARCH = form_data.web.ENABLE_WEB_SEARCH
-        request.app.state.config.WEB_SEARCH_ENGINE = form_data.web.WEB_SEARCH_ENGINE
-        request.app.state.config.WEB_SEARCH_TRUST_ENV = (
-            form_data.web.WEB_SEARCH_TRUST_ENV
+        # Content extraction settings
+        request.app.state.config.CONTENT_EXTRACTION_ENGINE = (
+            form_data.CONTENT_EXTRACTION_ENGINE
+            if form_data.CONTENT_EXTRACTION_ENGINE is not None
+            else request.app.state.config.CONTENT_EXTRACTION_ENGINE
+        )
+        request.app.state.config.PDF_EXTRACT_IMAGES = (
+            form_data.PDF_EXTRACT_IMAGES
+            if form_data.PDF_EXTRACT_IMAGES is not None
+            else request.app.state.config.PDF_EXTRACT_IMAGES
+        )
+        request.app.state.config.DATALAB_MARKER_API_KEY = (
+            form_data.DATALAB_MARKER_API_KEY
+            if form_data.DATALAB_MARKER_API_KEY is not None
+            else request.app.state.config.DATALAB_MARKER_API_KEY
+        )
+        request.app.state.config.DATALAB_MARKER_API_BASE_URL = (
+            form_data.DATALAB_MARKER_API_BASE_URL
+            if form_data.DATALAB_MARKER_API_BASE_URL is not None
+            else request.app.state.config.DATALAB_MARKER_API_BASE_URL
         )
-        request.app.state.config.WEB_SEARCH_RESULT_COUNT = (
-            form_data.web.WEB_SEARCH_RESULT_COUNT
+        request.app.state.config.DATALAB_MARKER_ADDITIONAL_CONFIG = (
+            form_data.DATALAB_MARKER_ADDITIONAL_CONFIG
+            if form_data.DATALAB_MARKER_ADDITIONAL_CONFIG is not None
+            else request.app.state.config.DATALAB_MARKER_ADDITIONAL_CONFIG
         )
-        request.app.state.config.WEB_SEARCH_CONCURRENT_REQUESTS = (
-            form_data.web.WEB_SEARCH_CONCURRENT_REQUESTS
+        request.app.state.config.DATALAB_MARKER_SKIP_CACHE = (
+            form_data.DATALAB_MARKER_SKIP_CACHE
+            if form_data.DATALAB_MARKER_SKIP_CACHE is not None
+            else request.app.state.config.DATALAB_MARKER_SKIP_CACHE
         )
-        request.app.state.config.WEB_LOADER_CONCURRENT_REQUESTS = (
-            form_data.web.WEB_LOADER_CONCURRENT_REQUESTS
+        request.app.state.config.DATALAB_MARKER_FORCE_OCR = (
+            form_data.DATALAB_MARKER_FORCE_OCR
+            if form_data.DATALAB_MARKER_FORCE_OCR is not None
+            else request.app.state.config.DATALAB_MARKER_FORCE_OCR
         )
-        request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST = (
-            form_data.web.WEB_SEARCH_DOMAIN_FILTER_LIST
+        request.app.state.config.DATALAB_MARKER_PAGINATE = (
+            form_data.DATALAB_MARKER_PAGINATE
+            if form_data.DATALAB_MARKER_PAGINATE is not None
+            else request.app.state.config.DATALAB_MARKER_PAGINATE
         )
-        request.app.state.config.BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL = (
-            form_data.web.BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL
+        request.app.state.config.DATALAB_MARKER_STRIP_EXISTING_OCR = (
+            form_data.DATALAB_MARKER_STRIP_EXISTING_OCR
+            if form_data.DATALAB_MARKER_STRIP_EXISTING_OCR is not None
+            else request.app.state.config.DATALAB_MARKER_STRIP_EXISTING_OCR
         )
-        request.app.state.config.BYPASS_WEB_SEARCH_WEB_LOADER = (
-            form_data.web.BYPASS_WEB_SEARCH_WEB_LOADER
+        request.app.state.config.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION = (
+            form_data.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION
+            if form_data.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION is not None
+            else request.app.state.config.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION
         )
-        request.app.state.config.OLLAMA_CLOUD_WEB_SEARCH_API_KEY = (
-            form_data.web.OLLAMA_CLOUD_WEB_SEARCH_API_KEY
+        request.app.state.config.DATALAB_MARKER_FORMAT_LINES = (
+            form_data.DATALAB_MARKER_FORMAT_LINES
+            if form_data.DATALAB_MARKER_FORMAT_LINES is not None
+            else request.app.state.config.DATALAB_MARKER_FORMAT_LINES
         )
-        request.app.state.config.SEARXNG_QUERY_URL = form_data.web.SEARXNG_QUERY_URL
-        request.app.state.config.YACY_QUERY_URL = form_data.web.YACY_QUERY_URL
-        request.app.state.config.YACY_USERNAME = form_data.web.YACY_USERNAME
-        request.app.state.config.YACY_PASSWORD = form_data.web.YACY_PASSWORD
-        request.app.state.config.GOOGLE_PSE_API_KEY = form_data.web.GOOGLE_PSE_API_KEY
-        request.app.state.config.GOOGLE_PSE_ENGINE_ID = (
-            form_data.web.GOOGLE_PSE_ENGINE_ID
+        request.app.state.config.DATALAB_MARKER_OUTPUT_FORMAT = (
+            form_data.DATALAB_MARKER_OUTPUT_FORMAT
+            if form_data.DATALAB_MARKER_OUTPUT_FORMAT is not None
+            else request.app.state.config.DATALAB_MARKER_OUTPUT_FORMAT
         )
-        request.app.state.config.BRAVE_SEARCH_API_KEY = (
-            form_data.web.BRAVE_SEARCH_API_KEY
+        request.app.state.config.DATALAB_MARKER_USE_LLM = (
+            form_data.DATALAB_MARKER_USE_LLM
+            if form_data.DATALAB_MARKER_USE_LLM is not None
+            else request.app.state.config.DATALAB_MARKER_USE_LLM
         )
-        request.app.state.config.KAGI_SEARCH_API_KEY = form_data.web.KAGI_SEARCH_API_KEY
-        request.app.state.config.MOJEEK_SEARCH_API_KEY = (
-            form_data.web.MOJEEK_SEARCH_API_KEY
+        request.app.state.config.EXTERNAL_DOCUMENT_LOADER_URL = (
+            form_data.EXTERNAL_DOCUMENT_LOADER_URL
+            if form_data.EXTERNAL_DOCUMENT_LOADER_URL is not None
+            else request.app.state.config.EXTERNAL_DOCUMENT_LOADER_URL
         )
-        request.app.state.config.BOCHA_SEARCH_API_KEY = (
-            form_data.web.BOCHA_SEARCH_API_KEY
+        request.app.state.config.EXTERNAL_DOCUMENT_LOADER_API_KEY = (
+            form_data.EXTERNAL_DOCUMENT_LOADER_API_KEY
+            if form_data.EXTERNAL_DOCUMENT_LOADER_API_KEY is not None
+            else request.app.state.config.EXTERNAL_DOCUMENT_LOADER_API_KEY
         )
-        request.app.state.config.SERPSTACK_API_KEY = form_data.web.SERPSTACK_API_KEY
-        request.app.state.config.SERPSTACK_HTTPS = form_data.web.SERPSTACK_HTTPS
-        request.app.state.config.SERPER_API_KEY = form_data.web.SERPER_API_KEY
-        request.app.state.config.SERPLY_API_KEY = form_data.web.SERPLY_API_KEY
-        request.app.state.config.TAVILY_API_KEY = form_data.web.TAVILY_API_KEY
-        request.app.state.config.SEARCHAPI_API_KEY = form_data.web.SEARCHAPI_API_KEY
-        request.app.state.config.SEARCHAPI_ENGINE = form_data.web.SEARCHAPI_ENGINE
-        request.app.state.config.SERPAPI_API_KEY = form_data.web.SERPAPI_API_KEY
-        request.app.state.config.SERPAPI_ENGINE = form_data.web.SERPAPI_ENGINE
-        request.app.state.config.JINA_API_KEY = form_data.web.JINA_API_KEY
-        request.app.state.config.BING_SEARCH_V7_ENDPOINT = (
-            form_data.web.BING_SEARCH_V7_ENDPOINT
+        request.app.state.config.TIKA_SERVER_URL = (
+            form_data.TIKA_SERVER_URL
+            if form_data.TIKA_SERVER_URL is not None
+            else request.app.state.config.TIKA_SERVER_URL
         )
-        request.app.state.config.BING_SEARCH_V7_SUBSCRIPTION_KEY = (
-            form_data.web.BING_SEARCH_V7_SUBSCRIPTION_KEY
+        request.app.state.config.DOCLING_SERVER_URL = (
+            form_data.DOCLING_SERVER_URL
+            if form_data.DOCLING_SERVER_URL is not None
+            else request.app.state.config.DOCLING_SERVER_URL
         )
-        request.app.state.config.EXA_API_KEY = form_data.web.EXA_API_KEY
-        request.app.state.config.PERPLEXITY_API_KEY = form_data.web.PERPLEXITY_API_KEY
-        request.app.state.config.PERPLEXITY_MODEL = form_data.web.PERPLEXITY_MODEL
-        request.app.state.config.PERPLEXITY_SEARCH_CONTEXT_USAGE = (
-            form_data.web.PERPLEXITY_SEARCH_CONTEXT_USAGE
+        request.app.state.config.DOCLING_API_KEY = (
+            form_data.DOCLING_API_KEY
+            if form_data.DOCLING_API_KEY is not None
+            else request.app.state.config.DOCLING_API_KEY
         )
-        request.app.state.config.PERPLEXITY_SEARCH_API_URL = (
-            form_data.web.PERPLEXITY_SEARCH_API_URL
+        request.app.state.config.DOCLING_PARAMS = (
+            form_data.DOCLING_PARAMS
+            if form_data.DOCLING_PARAMS is not None
+            else request.app.state.config.DOCLING_PARAMS
+        )
+        request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT = (
+            form_data.DOCUMENT_INTELLIGENCE_ENDPOINT
+            if form_data.DOCUMENT_INTELLIGENCE_ENDPOINT is not None
+            else request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT
+        )
+        request.app.state.config.DOCUMENT_INTELLIGENCE_KEY = (
+            form_data.DOCUMENT_INTELLIGENCE_KEY
+            if form_data.DOCUMENT_INTELLIGENCE_KEY is not None
+            else request.app.state.config.DOCUMENT_INTELLIGENCE_KEY
         )
-        request.app.state.config.SOUGOU_API_SID = form_data.web.SOUGOU_API_SID
-        request.app.state.config.SOUGOU_API_SK = form_data.web.SOUGOU_API_SK
 
-        # Web loader settings
-        request.app.state.config.WEB_LOADER_ENGINE = form_data.web.WEB_LOADER_ENGINE
-        request.app.state.config.ENABLE_WEB_LOADER_SSL_VERIFICATION = (
-            form_data.web.ENABLE_WEB_LOADER_SSL_VERIFICATION
+        request.app.state.config.MISTRAL_OCR_API_BASE_URL = (
+            form_data.MISTRAL_OCR_API_BASE_URL
+            if form_data.MISTRAL_OCR_API_BASE_URL is not None
+            else request.app.state.config.MISTRAL_OCR_API_BASE_URL
         )
-        request.app.state.config.PLAYWRIGHT_WS_URL = form_data.web.PLAYWRIGHT_WS_URL
-        request.app.state.config.PLAYWRIGHT_TIMEOUT = form_data.web.PLAYWRIGHT_TIMEOUT
-        request.app.state.config.FIRECRAWL_API_KEY = form_data.web.FIRECRAWL_API_KEY
-        request.app.state.config.FIRECRAWL_API_BASE_URL = (
-            form_data.web.FIRECRAWL_API_BASE_URL
+        request.app.state.config.MISTRAL_OCR_API_KEY = (
+            form_data.MISTRAL_OCR_API_KEY
+            if form_data.MISTRAL_OCR_API_KEY is not None
+            else request.app.state.config.MISTRAL_OCR_API_KEY
         )
-        request.app.state.config.EXTERNAL_WEB_SEARCH_URL = (
-            form_data.web.EXTERNAL_WEB_SEARCH_URL
+
+        # MinerU settings
+        request.app.state.config.MINERU_API_MODE = (
+            form_data.MINERU_API_MODE
+            if form_data.MINERU_API_MODE is not None
+            else request.app.state.config.MINERU_API_MODE
+        )
+        request.app.state.config.MINERU_API_URL = (
+            form_data.MINERU_API_URL
+            if form_data.MINERU_API_URL is not None
+            else request.app.state.config.MINERU_API_URL
+        )
+        request.app.state.config.MINERU_API_KEY = (
+            form_data.MINERU_API_KEY
+            if form_data.MINERU_API_KEY is not None
+            else request.app.state.config.MINERU_API_KEY
+        )
+        request.app.state.config.MINERU_PARAMS = (
+            form_data.MINERU_PARAMS
+            if form_data.MINERU_PARAMS is not None
+            else request.app.state.config.MINERU_PARAMS
+        )
+
+        # Reranking settings
+        if request.app.state.config.RAG_RERANKING_ENGINE == "":
+            # Unloading the internal reranker and clear VRAM memory
+            request.app.state.rf = None
+            request.app.state.RERANKING_FUNCTION = None
+            import gc
+
+            gc.collect()
+            if DEVICE_TYPE == "cuda":
+                import torch
+
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+        request.app.state.config.RAG_RERANKING_ENGINE = (
+            form_data.RAG_RERANKING_ENGINE
+            if form_data.RAG_RERANKING_ENGINE is not None
+            else request.app.state.config.RAG_RERANKING_ENGINE
+        )
+
+        request.app.state.config.RAG_EXTERNAL_RERANKER_URL = (
+            form_data.RAG_EXTERNAL_RERANKER_URL
+            if form_data.RAG_EXTERNAL_RERANKER_URL is not None
+            else request.app.state.config.RAG_EXTERNAL_RERANKER_URL
+        )
+
+        request.app.state.config.RAG_EXTERNAL_RERANKER_API_KEY = (
+            form_data.RAG_EXTERNAL_RERANKER_API_KEY
+            if form_data.RAG_EXTERNAL_RERANKER_API_KEY is not None
+            else request.app.state.config.RAG_EXTERNAL_RERANKER_API_KEY
+        )
+
+        log.info(
+            f"Updating reranking model: {request.app.state.config.RAG_RERANKING_MODEL} to {form_data.RAG_RERANKING_MODEL}"
+        )
+        try:
+            request.app.state.config.RAG_RERANKING_MODEL = (
+                form_data.RAG_RERANKING_MODEL
+                if form_data.RAG_RERANKING_MODEL is not None
+                else request.app.state.config.RAG_RERANKING_MODEL
+            )
+
+            try:
+                if (
+                    request.app.state.config.ENABLE_RAG_HYBRID_SEARCH
+                    and not request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+                ):
+                    request.app.state.rf = get_rf(
+                        request.app.state.config.RAG_RERANKING_ENGINE,
+                        request.app.state.config.RAG_RERANKING_MODEL,
+                        request.app.state.config.RAG_EXTERNAL_RERANKER_URL,
+                        request.app.state.config.RAG_EXTERNAL_RERANKER_API_KEY,
+                        True,
+                    )
+
+                    request.app.state.RERANKING_FUNCTION = get_reranking_function(
+                        request.app.state.config.RAG_RERANKING_ENGINE,
+                        request.app.state.config.RAG_RERANKING_MODEL,
+                        request.app.state.rf,
+                    )
+            except Exception as e:
+                log.error(f"Error loading reranking model: {e}")
+                request.app.state.config.ENABLE_RAG_HYBRID_SEARCH = False
+        except Exception as e:
+            log.exception(f"Problem updating reranking model: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ERROR_MESSAGES.DEFAULT(e),
+            )
+
+        # Chunking settings
+        request.app.state.config.TEXT_SPLITTER = (
+            form_data.TEXT_SPLITTER
+            if form_data.TEXT_SPLITTER is not None
+            else request.app.state.config.TEXT_SPLITTER
         )
-        request.app.state.config.EXTERNAL_WEB_SEARCH_API_KEY = (
-            form_data.web.EXTERNAL_WEB_SEARCH_API_KEY
+        request.app.state.config.CHUNK_SIZE = (
+            form_data.CHUNK_SIZE
+            if form_data.CHUNK_SIZE is not None
+            else request.app.state.config.CHUNK_SIZE
         )
-        request.app.state.config.EXTERNAL_WEB_LOADER_URL = (
-            form_data.web.EXTERNAL_WEB_LOADER_URL
+        request.app.state.config.CHUNK_OVERLAP = (
+            form_data.CHUNK_OVERLAP
+            if form_data.CHUNK_OVERLAP is not None
+            else request.app.state.config.CHUNK_OVERLAP
         )
-        request.app.state.config.EXTERNAL_WEB_LOADER_API_KEY = (
-            form_data.web.EXTERNAL_WEB_LOADER_API_KEY
+
+        # File upload settings
+        request.app.state.config.FILE_MAX_SIZE = form_data.FILE_MAX_SIZE
+        request.app.state.config.FILE_MAX_COUNT = form_data.FILE_MAX_COUNT
+        request.app.state.config.FILE_IMAGE_COMPRESSION_WIDTH = (
+            form_data.FILE_IMAGE_COMPRESSION_WIDTH
         )
-        request.app.state.config.TAVILY_EXTRACT_DEPTH = (
-            form_data.web.TAVILY_EXTRACT_DEPTH
+        request.app.state.config.FILE_IMAGE_COMPRESSION_HEIGHT = (
+            form_data.FILE_IMAGE_COMPRESSION_HEIGHT
         )
-        request.app.state.config.YOUTUBE_LOADER_LANGUAGE = (
-            form_data.web.YOUTUBE_LOADER_LANGUAGE
+        request.app.state.config.ALLOWED_FILE_EXTENSIONS = (
+            form_data.ALLOWED_FILE_EXTENSIONS
+            if form_data.ALLOWED_FILE_EXTENSIONS is not None
+            else request.app.state.config.ALLOWED_FILE_EXTENSIONS
         )
-        request.app.state.config.YOUTUBE_LOADER_PROXY_URL = (
-            form_data.web.YOUTUBE_LOADER_PROXY_URL
+
+        # Integration settings
+        request.app.state.config.ENABLE_GOOGLE_DRIVE_INTEGRATION = (
+            form_data.ENABLE_GOOGLE_DRIVE_INTEGRATION
+            if form_data.ENABLE_GOOGLE_DRIVE_INTEGRATION is not None
+            else request.app.state.config.ENABLE_GOOGLE_DRIVE_INTEGRATION
         )
-        request.app.state.YOUTUBE_LOADER_TRANSLATION = (
-            form_data.web.YOUTUBE_LOADER_TRANSLATION
+        request.app.state.config.ENABLE_ONEDRIVE_INTEGRATION = (
+            form_data.ENABLE_ONEDRIVE_INTEGRATION
+            if form_data.ENABLE_ONEDRIVE_INTEGRATION is not None
+            else request.app.state.config.ENABLE_ONEDRIVE_INTEGRATION
         )
 
+        if form_data.web is not None:
+            # Web search settings
+            request.app.state.config.ENABLE_WEB_SEARCH = form_data.web.ENABLE_WEB_SEARCH
+            request.app.state.config.WEB_SEARCH_ENGINE = form_data.web.WEB_SEARCH_ENGINE
+            request.app.state.config.WEB_SEARCH_TRUST_ENV = (
+                form_data.web.WEB_SEARCH_TRUST_ENV
+            )
+            request.app.state.config.WEB_SEARCH_RESULT_COUNT = (
+                form_data.web.WEB_SEARCH_RESULT_COUNT
+            )
+            request.app.state.config.WEB_SEARCH_CONCURRENT_REQUESTS = (
+                form_data.web.WEB_SEARCH_CONCURRENT_REQUESTS
+            )
+            request.app.state.config.WEB_LOADER_CONCURRENT_REQUESTS = (
+                form_data.web.WEB_LOADER_CONCURRENT_REQUESTS
+            )
+            request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST = (
+                form_data.web.WEB_SEARCH_DOMAIN_FILTER_LIST
+            )
+            request.app.state.config.BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL = (
+                form_data.web.BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL
+            )
+            request.app.state.config.BYPASS_WEB_SEARCH_WEB_LOADER = (
+                form_data.web.BYPASS_WEB_SEARCH_WEB_LOADER
+            )
+            request.app.state.config.OLLAMA_CLOUD_WEB_SEARCH_API_KEY = (
+                form_data.web.OLLAMA_CLOUD_WEB_SEARCH_API_KEY
+            )
+            request.app.state.config.SEARXNG_QUERY_URL = form_data.web.SEARXNG_QUERY_URL
+            request.app.state.config.YACY_QUERY_URL = form_data.web.YACY_QUERY_URL
+            request.app.state.config.YACY_USERNAME = form_data.web.YACY_USERNAME
+            request.app.state.config.YACY_PASSWORD = form_data.web.YACY_PASSWORD
+            request.app.state.config.GOOGLE_PSE_API_KEY = (
+                form_data.web.GOOGLE_PSE_API_KEY
+            )
+            request.app.state.config.GOOGLE_PSE_ENGINE_ID = (
+                form_data.web.GOOGLE_PSE_ENGINE_ID
+            )
+            request.app.state.config.BRAVE_SEARCH_API_KEY = (
+                form_data.web.BRAVE_SEARCH_API_KEY
+            )
+            request.app.state.config.KAGI_SEARCH_API_KEY = (
+                form_data.web.KAGI_SEARCH_API_KEY
+            )
+            request.app.state.config.MOJEEK_SEARCH_API_KEY = (
+                form_data.web.MOJEEK_SEARCH_API_KEY
+            )
+            request.app.state.config.BOCHA_SEARCH_API_KEY = (
+                form_data.web.BOCHA_SEARCH_API_KEY
+            )
+            request.app.state.config.SERPSTACK_API_KEY = form_data.web.SERPSTACK_API_KEY
+            request.app.state.config.SERPSTACK_HTTPS = form_data.web.SERPSTACK_HTTPS
+            request.app.state.config.SERPER_API_KEY = form_data.web.SERPER_API_KEY
+            request.app.state.config.SERPLY_API_KEY = form_data.web.SERPLY_API_KEY
+            request.app.state.config.TAVILY_API_KEY = form_data.web.TAVILY_API_KEY
+            request.app.state.config.SEARCHAPI_API_KEY = form_data.web.SEARCHAPI_API_KEY
+            request.app.state.config.SEARCHAPI_ENGINE = form_data.web.SEARCHAPI_ENGINE
+            request.app.state.config.SERPAPI_API_KEY = form_data.web.SERPAPI_API_KEY
+            request.app.state.config.SERPAPI_ENGINE = form_data.web.SERPAPI_ENGINE
+            request.app.state.config.JINA_API_KEY = form_data.web.JINA_API_KEY
+            request.app.state.config.BING_SEARCH_V7_ENDPOINT = (
+                form_data.web.BING_SEARCH_V7_ENDPOINT
+            )
+            request.app.state.config.BING_SEARCH_V7_SUBSCRIPTION_KEY = (
+                form_data.web.BING_SEARCH_V7_SUBSCRIPTION_KEY
+            )
+            request.app.state.config.EXA_API_KEY = form_data.web.EXA_API_KEY
+            request.app.state.config.PERPLEXITY_API_KEY = (
+                form_data.web.PERPLEXITY_API_KEY
+            )
+            request.app.state.config.PERPLEXITY_MODEL = form_data.web.PERPLEXITY_MODEL
+            request.app.state.config.PERPLEXITY_SEARCH_CONTEXT_USAGE = (
+                form_data.web.PERPLEXITY_SEARCH_CONTEXT_USAGE
+            )
+            request.app.state.config.PERPLEXITY_SEARCH_API_URL = (
+                form_data.web.PERPLEXITY_SEARCH_API_URL
+            )
+            request.app.state.config.SOUGOU_API_SID = form_data.web.SOUGOU_API_SID
+            request.app.state.config.SOUGOU_API_SK = form_data.web.SOUGOU_API_SK
+
+            # Web loader settings
+            request.app.state.config.WEB_LOADER_ENGINE = form_data.web.WEB_LOADER_ENGINE
+            request.app.state.config.ENABLE_WEB_LOADER_SSL_VERIFICATION = (
+                form_data.web.ENABLE_WEB_LOADER_SSL_VERIFICATION
+            )
+            request.app.state.config.PLAYWRIGHT_WS_URL = form_data.web.PLAYWRIGHT_WS_URL
+            request.app.state.config.PLAYWRIGHT_TIMEOUT = (
+                form_data.web.PLAYWRIGHT_TIMEOUT
+            )
+            request.app.state.config.FIRECRAWL_API_KEY = form_data.web.FIRECRAWL_API_KEY
+            request.app.state.config.FIRECRAWL_API_BASE_URL = (
+                form_data.web.FIRECRAWL_API_BASE_URL
+            )
+            request.app.state.config.EXTERNAL_WEB_SEARCH_URL = (
+                form_data.web.EXTERNAL_WEB_SEARCH_URL
+            )
+            request.app.state.config.EXTERNAL_WEB_SEARCH_API_KEY = (
+                form_data.web.EXTERNAL_WEB_SEARCH_API_KEY
+            )
+            request.app.state.config.EXTERNAL_WEB_LOADER_URL = (
+                form_data.web.EXTERNAL_WEB_LOADER_URL
+            )
+            request.app.state.config.EXTERNAL_WEB_LOADER_API_KEY = (
+                form_data.web.EXTERNAL_WEB_LOADER_API_KEY
+            )
+            request.app.state.config.TAVILY_EXTRACT_DEPTH = (
+                form_data.web.TAVILY_EXTRACT_DEPTH
+            )
+            request.app.state.config.YOUTUBE_LOADER_LANGUAGE = (
+                form_data.web.YOUTUBE_LOADER_LANGUAGE
+            )
+            request.app.state.config.YOUTUBE_LOADER_PROXY_URL = (
+                form_data.web.YOUTUBE_LOADER_PROXY_URL
+            )
+            request.app.state.YOUTUBE_LOADER_TRANSLATION = (
+                form_data.web.YOUTUBE_LOADER_TRANSLATION
+            )
+
     return {
         "status": True,
         # RAG settings
@@ -1231,6 +1266,7 @@ def save_docs_to_vector_db(
     overwrite: bool = False,
     split: bool = True,
     add: bool = False,
+    reuse_embeddings: bool = False,
     user=None,
 ) -> bool:
     def _get_docs_info(docs: list[Document]) -> str:
@@ -1267,90 +1303,33 @@ def save_docs_to_vector_db(
                 raise ValueError(ERROR_MESSAGES.DUPLICATE_CONTENT)
 
     if split:
-        if request.app.state.config.TEXT_SPLITTER in ["", "character"]:
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=request.app.state.config.CHUNK_SIZE,
-                chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
-                add_start_index=True,
-            )
-            docs = text_splitter.split_documents(docs)
-        elif request.app.state.config.TEXT_SPLITTER == "token":
+        splitter = request.app.state.config.TEXT_SPLITTER
+        if splitter not in TEXT_SPLITTERS:
+            raise ValueError(ERROR_MESSAGES.DEFAULT("Invalid text splitter"))
+
+        if splitter == "token":
             log.info(
                 f"Using token text splitter: {request.app.state.config.TIKTOKEN_ENCODING_NAME}"
             )
-
             tiktoken.get_encoding(str(request.app.state.config.TIKTOKEN_ENCODING_NAME))
-            text_splitter = TokenTextSplitter(
-                encoding_name=str(request.app.state.config.TIKTOKEN_ENCODING_NAME),
-                chunk_size=request.app.state.config.CHUNK_SIZE,
-                chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
-                add_start_index=True,
-            )
-            docs = text_splitter.split_documents(docs)
-        elif request.app.state.config.TEXT_SPLITTER == "markdown_header":
+        elif splitter == "markdown_header":
             log.info("Using markdown header text splitter")
 
-            # Define headers to split on - covering most common markdown header levels
-            headers_to_split_on = [
-                ("#", "Header 1"),
-                ("##", "Header 2"),
-                ("###", "Header 3"),
-                ("####", "Header 4"),
-                ("#####", "Header 5"),
-                ("######", "Header 6"),
-            ]
-
-            markdown_splitter = MarkdownHeaderTextSplitter(
-                headers_to_split_on=headers_to_split_on,
-                strip_headers=False,  # Keep headers in content for context
-            )
-
-            md_split_docs = []
-            for doc in docs:
-                md_header_splits = markdown_splitter.split_text(doc.page_content)
-                text_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=request.app.state.config.CHUNK_SIZE,
-                    chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
-                    add_start_index=True,
-                )
-                md_header_splits = text_splitter.split_documents(md_header_splits)
-
-                # Convert back to Document objects, preserving original metadata
-                for split_chunk in md_header_splits:
-                    headings_list = []
-                    # Extract header values in order based on headers_to_split_on
-                    for _, header_meta_key_name in headers_to_split_on:
-                        if header_meta_key_name in split_chunk.metadata:
-                            headings_list.append(
-                                split_chunk.metadata[header_meta_key_name]
-                            )
-
-                    md_split_docs.append(
-                        Document(
-                            page_content=split_chunk.page_content,
-                            metadata={**doc.metadata, "headings": headings_list},
-                        )
-                    )
-
-            docs = md_split_docs
-        else:
-            raise ValueError(ERROR_MESSAGES.DEFAULT("Invalid text splitter"))
+        # Chunks are produced batch by batch, and embedded as they come
+        doc_batches = iter_split_documents(
+            docs,
+            splitter=splitter,
+            chunk_size=request.app.state.config.CHUNK_SIZE,
+            chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
+            encoding_name=str(request.app.state.config.TIKTOKEN_ENCODING_NAME),
+        )
+    else:
+        doc_batches = iter([docs])
 
-    if len(docs) == 0:
+    first_batch = next((batch for batch in doc_batches if batch), None)
+    if first_batch is None:
         raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
-
-    texts = [doc.page_content for doc in docs]
-    metadatas = [
-        {
-            **doc.metadata,
-            **(metadata if metadata else {}),
-            "embedding_config": {
-                "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
-                "model": request.app.state.config.RAG_EMBEDDING_MODEL,
-            },
-        }
-        for doc in docs
-    ]
+    doc_batches = itertools.chain([first_batch], doc_batches)
 
     try:
         if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
@@ -1396,25 +1375,53 @@ def save_docs_to_vector_db(
             ),
         )
 
-        # Run async embedding in sync context
-        embeddings = asyncio.run(
-            embedding_function(
-                list(map(lambda x: x.replace("\n", " "), texts)),
-                prefix=RAG_EMBEDDING_CONTENT_PREFIX,
-                user=user,
+        def embed(texts: list[str]) -> list:
+            texts = list(map(lambda x: x.replace("\n", " "), texts))
+            # Run async embedding in sync context
+            if reuse_embeddings:
+                return asyncio.run(
+                    embed_with_cache(
+                        texts,
+                        embedding_function,
+                        request.app.state.config.RAG_EMBEDDING_ENGINE,
+                        request.app.state.config.RAG_EMBEDDING_MODEL,
+                        prefix=RAG_EMBEDDING_CONTENT_PREFIX,
+                        user=user,
+                    )
+                )
+            return asyncio.run(
+                embedding_function(
+                    texts,
+                    prefix=RAG_EMBEDDING_CONTENT_PREFIX,
+                    user=user,
+                )
             )
-        )
-        log.info(f"embeddings generated {len(embeddings)} for {len(texts)} items")
 
-        items = [
-            {
-                "id": str(uuid.uuid4()),
-                "text": text,
-                "vector": embeddings[idx],
-                "metadata": metadatas[idx],
-            }
-            for idx, text in enumerate(texts)
-        ]
+        items = []
+        for batch in doc_batches:
+            if not batch:
+                continue
+
+            texts = [doc.page_content for doc in batch]
+            embeddings = embed(texts)
+            log.info(f"embeddings generated {len(embeddings)} for {len(texts)} items")
+
+            items.extend(
+                {
+                    "id": str(uuid.uuid4()),
+                    "text": doc.page_content,
+                    "vector": embeddings[idx],
+                    "metadata": {
+                        **doc.metadata,
+                        **(metadata if metadata else {}),
+                        "embedding_config": {
+                            "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
+                            "model": request.app.state.config.RAG_EMBEDDING_MODEL,
+                        },
+                    },
+                }
+                for idx, doc in enumerate(batch)
+            )
 
         log.info(f"adding to collection {collection_name}")
         VECTOR_DB_CLIENT.insert(
@@ -1436,13 +1443,16 @@ class ProcessFileForm(BaseModel):
 
 
 @router.post("/process/file")
-def process_file(
+async def process_file(
     request: Request,
     form_data: ProcessFileForm,
     user=Depends(get_verified_user),
 ):
     """
     Process a file and save its content to the vector database.
+
+    Remote content extraction is awaited rather than run in the threadpool, so
+    slow extraction engines (e.g. OCR) do not hold a thread for the duration.
     """
     if user.role == "admin":
         file = Files.get_file_by_id(form_data.file_id)
@@ -1463,8 +1473,9 @@ def process_file(
 
                 try:
                     # /files/{file_id}/data/content/update
-                    VECTOR_DB_CLIENT.delete_collection(
-                        collection_name=f"file-{file.id}"
+                    await run_in_threadpool(
+                        VECTOR_DB_CLIENT.delete_collection,
+                        collection_name=f"file-{file.id}",
                     )
                 except:
                     # Audio file upload pipeline
@@ -1488,8 +1499,10 @@ def process_file(
                 # Check if the file has already been processed and save the content
                 # Usage: /knowledge/{id}/file/add, /knowledge/{id}/file/update
 
-                result = VECTOR_DB_CLIENT.query(
-                    collection_name=f"file-{file.id}", filter={"file_id": file.id}
+                result = await run_in_threadpool(
+                    VECTOR_DB_CLIENT.query,
+                    collection_name=f"file-{file.id}",
+                    filter={"file_id": file.id},
                 )
 
                 if result is not None and len(result.ids[0]) > 0:
@@ -1520,7 +1533,7 @@ def process_file(
                 # Usage: /files/
                 file_path = file.path
                 if file_path:
-                    file_path = Storage.get_file(file_path)
+                    file_path = await run_in_threadpool(Storage.get_file, file_path)
                     loader = Loader(
                         engine=request.app.state.config.CONTENT_EXTRACTION_ENGINE,
                         user=user,
@@ -1551,7 +1564,7 @@ def process_file(
                         MINERU_API_KEY=request.app.state.config.MINERU_API_KEY,
                         MINERU_PARAMS=request.app.state.config.MINERU_PARAMS,
                     )
-                    docs = loader.load(
+                    docs = await loader.aload(
                         file.filename, file.meta.get("content_type"), file_path
                     )
 
@@ -1601,7 +1614,8 @@ def process_file(
                 }
             else:
                 try:
-                    result = save_docs_to_vector_db(
+                    result = await run_in_threadpool(
+                        save_docs_to_vector_db,
                         request,
                         docs=docs,
                         collection_name=collection_name,
@@ -2040,6 +2054,28 @@ def search_web(
         raise Exception("No search engine API key found in environment variables")
 
 
+async def search_web_with_cache(
+    request: Request, engine: str, query: str, user=None
+) -> list[SearchResult]:
+    params = {
+        "count": request.app.state.config.WEB_SEARCH_RESULT_COUNT,
+        "filter_list": request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
+    }
+    if engine in USER_SCOPED_SEARCH_ENGINES and user:
+        params["user_id"] = user.id
+
+    key = get_search_cache_key(engine, query, params)
+    # Copied in and out, so callers cannot modify the cached results
+    results = WEB_SEARCH_RESULTS_CACHE.get(key)
+    if results is not None:
+        return [result.model_copy() for result in results]
+
+    results = await run_in_threadpool(search_web, request, engine, query, user)
+    if results:
+        WEB_SEARCH_RESULTS_CACHE.set(key, [result.model_copy() for result in results])
+    return results
+
+
 @router.post("/process/web/search")
 async def process_web_search(
     request: Request, form_data: SearchForm, user=Depends(get_verified_user)
@@ -2054,8 +2090,7 @@ async def process_web_search(
         )
 
         search_tasks = [
-            run_in_threadpool(
-                search_web,
+            search_web_with_cache(
                 request,
                 request.app.state.config.WEB_SEARCH_ENGINE,
                 query,
@@ -2110,13 +2145,30 @@ async def process_web_search(
                 if hasattr(result, "snippet") and result.snippet is not None
             ]
         else:
-            loader = get_web_loader(
-                urls,
-                verify_ssl=request.app.state.config.ENABLE_WEB_LOADER_SSL_VERIFICATION,
-                requests_per_second=request.app.state.config.WEB_LOADER_CONCURRENT_REQUESTS,
-                trust_env=request.app.state.config.WEB_SEARCH_TRUST_ENV,
-            )
-            docs = await loader.aload()
+            loader_engine = request.app.state.config.WEB_LOADER_ENGINE
+            docs, missing_urls = get_cached_pages(loader_engine, urls)
+
+            if missing_urls:
+                loader = await aget_web_loader(
+                    missing_urls,
+                    verify_ssl=request.app.state.config.ENABLE_WEB_LOADER_SSL_VERIFICATION,
+                    requests_per_second=request.app.state.config.WEB_LOADER_CONCURRENT_REQUESTS,
+                    trust_env=request.app.state.config.WEB_SEARCH_TRUST_ENV,
+                )
+                loaded_docs = await loader.aload()
+                set_cached_pages(
+                    loader_engine,
+                    loaded_docs,
+                    getattr(loader, "cache_policies", None),
+                )
+                docs.extend(loaded_docs)
+
+                # Keep the search result order
+                url_order = {url: idx for idx, url in enumerate(urls)}
+                docs.sort(
+                    key=lambda doc: url_order.get(doc.metadata.get("source"), len(urls))
+                )
+            log.debug(f"web search cache: {get_cache_stats()}")
 
         urls = [
             doc.metadata.get("source") for doc in docs if doc.metadata.get("source")
@@ -2149,12 +2201,21 @@ async def process_web_search(
             )
 
             try:
+                # Registered first, so a concurrent reaper skips the collection
+                await run_in_threadpool(
+                    register_ephemeral_collection,
+                    collection_name,
+                    "web_search",
+                    WEB_SEARCH_COLLECTION_TTL,
+                    user.id,
+                )
                 await run_in_threadpool(
                     save_docs_to_vector_db,
                     request,
                     docs,
                     collection_name,
                     overwrite=True,
+                    reuse_embeddings=True,
                     user=user,
                 )
             except Exception as e:
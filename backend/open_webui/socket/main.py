@@ -37,9 +37,17 @@ from open_webui.env import (
     WEBSOCKET_SERVER_PING_INTERVAL,
     WEBSOCKET_SERVER_LOGGING,
     WEBSOCKET_SERVER_ENGINEIO_LOGGING,
+    ENABLE_STREAM_JOURNAL,
+    STREAM_JOURNAL_MAX_LEN,
+    STREAM_JOURNAL_TTL,
 )
 from open_webui.utils.auth import decode_token
-from open_webui.socket.utils import RedisDict, RedisLock, YdocManager
+from open_webui.socket.utils import (
+    RedisDict,
+    RedisLock,
+    StreamJournal,
+    YdocManager,
+)
 from open_webui.tasks import create_task, stop_item_tasks
 from open_webui.utils.redis import get_redis_connection
 from open_webui.utils.access_control import has_access, get_users_with_access
@@ -160,6 +168,13 @@ YDOC_MANAGER = YdocManager(
     redis_key_prefix=f"{REDIS_KEY_PREFIX}:ydoc:documents",
 )
 
+STREAM_JOURNAL = StreamJournal(
+    redis=REDIS,
+    redis_key_prefix=f"{REDIS_KEY_PREFIX}:stream:journal",
+    max_len=STREAM_JOURNAL_MAX_LEN,
+    ttl=STREAM_JOURNAL_TTL,
+)
+
 
 async def periodic_usage_pool_cleanup():
     max_retries = 2
@@ -411,6 +426,29 @@ async def channel_events(sid, data):
         )
 
 
+@sio.on("events:resume")
+async def resume_events(sid, data):
+    """
+    Replay the events of a chat message emitted after `offset`, for clients
+    that reconnect (possibly to another replica) while it is still generating.
+    """
+    user = SESSION_POOL.get(sid)
+    if not user or not ENABLE_STREAM_JOURNAL:
+        return None
+
+    chat_id = data.get("chat_id")
+    message_id = data.get("message_id")
+    if not chat_id or not message_id:
+        return None
+
+    try:
+        offset = int(data.get("offset") or 0)
+    except (TypeError, ValueError):
+        offset = 0
+
+    return await STREAM_JOURNAL.read(user["id"], chat_id, message_id, offset)
+
+
 @sio.on("ydoc:document:join")
 async def ydoc_document_join(sid, data):
     """Handle user joining a document"""
@@ -671,12 +709,22 @@ def get_event_emitter(request_info, update_db=True):
         chat_id = request_info["chat_id"]
         message_id = request_info["message_id"]
 
+        seq = None
+        if ENABLE_STREAM_JOURNAL and chat_id and message_id:
+            try:
+                seq = await STREAM_JOURNAL.append(
+                    user_id, chat_id, message_id, event_data
+                )
+            except Exception as e:
+                log.debug(f"Failed to journal event for {message_id}: {e}")
+
         await sio.emit(
             "events",
             {
                 "chat_id": chat_id,
                 "message_id": message_id,
                 "data": event_data,
+                **({"seq": seq} if seq is not None else {}),
             },
             room=f"user:{user_id}",
         )
@@ -1,5 +1,8 @@
+import asyncio
 import json
+import time
 import uuid
+from collections import deque
 from open_webui.utils.redis import get_redis_connection
 from open_webui.env import REDIS_KEY_PREFIX
 from typing import Optional, List, Tuple
@@ -212,3 +215,224 @@ class YdocManager:
                 del self._updates[document_id]
             if document_id in self._users:
                 del self._users[document_id]
+
+
+class StreamJournal:
+    """
+    Per-message journal of emitted chat events with sequence numbers, so a
+    client that reconnects (possibly to another replica) can replay what it
+    missed. Backed by a Redis stream when available, in memory otherwise.
+
+    Streamed `chat:completion` events carrying only `content` hold the full
+    content so far, so only the latest one is kept per message, unnumbered
+    (replaying it is idempotent). In Redis it is written at most every
+    `snapshot_interval` seconds, or before the next numbered event.
+    """
+
+    def __init__(
+        self,
+        redis=None,
+        redis_key_prefix: str = f"{REDIS_KEY_PREFIX}:stream:journal",
+        max_len: int = 1000,
+        ttl: int = 3600,
+        snapshot_interval: float = 0.5,
+    ):
+        self._redis = redis
+        self._redis_key_prefix = redis_key_prefix
+        self._max_len = max_len
+        self._ttl = ttl
+        self._snapshot_interval = snapshot_interval
+
+        # In-memory fallback: key -> (last sequence number, last touched). Kept
+        # until the journal expires, since events for a message can still come
+        # after it is done (follow-ups, title, tags, continued responses)
+        self._sequences = {}
+        # key -> lock, so concurrent events of a message are added in order
+        self._locks = {}
+        # In-memory fallback: key -> {"events", "snapshot", "done", "expires_at"}
+        self._journals = {}
+        # Redis: key -> latest content snapshot not written yet, and the task
+        # writing it
+        self._snapshots = {}
+        self._snapshot_tasks = {}
+        self._last_sweep = time.monotonic()
+
+    def _get_key(self, user_id: str, chat_id: str, message_id: str) -> str:
+        return f"{self._redis_key_prefix}:{user_id}:{chat_id}:{message_id}"
+
+    def _is_snapshot(self, event_data: dict) -> bool:
+        data = event_data.get("data")
+        return (
+            event_data.get("type") == "chat:completion"
+            and isinstance(data, dict)
+            and data.keys() == {"content"}
+        )
+
+    def _sweep(self):
+        now = time.monotonic()
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+
+        for key, (_, touched_at) in list(self._sequences.items()):
+            if now - touched_at > self._ttl:
+                del self._sequences[key]
+                self._locks.pop(key, None)
+
+        for key, journal in list(self._journals.items()):
+            if journal["expires_at"] < now:
+                del self._journals[key]
+
+    async def _write_snapshot(self, key: str):
+        try:
+            await asyncio.sleep(self._snapshot_interval)
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                snapshot = self._snapshots.pop(key, None)
+                if snapshot is not None:
+                    await self._redis.set(
+                        f"{key}:snapshot",
+                        json.dumps(snapshot, default=str),
+                        ex=self._ttl,
+                    )
+        finally:
+            self._snapshot_tasks.pop(key, None)
+
+    async def append(
+        self, user_id: str, chat_id: str, message_id: str, event_data: dict
+    ) -> Optional[int]:
+        """
+        Journal an event, returning its sequence number, or None for content
+        snapshots, which are not numbered.
+        """
+        self._sweep()
+
+        key = self._get_key(user_id, chat_id, message_id)
+
+        if self._is_snapshot(event_data):
+            # Replayed after the numbered events that preceded it
+            snapshot = {
+                "after": self._sequences.get(key, (0, 0))[0],
+                "data": event_data,
+            }
+            if self._redis:
+                self._snapshots[key] = snapshot
+                if key not in self._snapshot_tasks:
+                    self._snapshot_tasks[key] = asyncio.create_task(
+                        self._write_snapshot(key)
+                    )
+            else:
+                journal = self._journals.setdefault(
+                    key,
+                    {"events": deque(maxlen=self._max_len), "done": False},
+                )
+                journal["snapshot"] = snapshot
+                journal["expires_at"] = time.monotonic() + self._ttl
+            return None
+
+        done = bool(
+            event_data.get("type") == "chat:completion"
+            and (event_data.get("data") or {}).get("done")
+        )
+
+        if self._redis:
+            # Numbered in Redis, so sequence numbers keep increasing whichever
+            # replica emits the message's events. Entries must be added in
+            # increasing order, hence the lock between numbering and adding.
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                seq = await self._redis.incr(f"{key}:seq")
+                self._sequences[key] = (seq, time.monotonic())
+
+                pipe = self._redis.pipeline()
+                # Write out the pending snapshot first, it precedes this event
+                snapshot = self._snapshots.pop(key, None)
+                if snapshot is not None:
+                    pipe.set(
+                        f"{key}:snapshot",
+                        json.dumps(snapshot, default=str),
+                        ex=self._ttl,
+                    )
+                pipe.xadd(
+                    key,
+                    {"data": json.dumps(event_data, default=str), "done": int(done)},
+                    id=f"{seq}-1",
+                    maxlen=self._max_len,
+                    approximate=True,
+                )
+                pipe.expire(key, self._ttl)
+                pipe.expire(f"{key}:seq", self._ttl)
+                await pipe.execute()
+        else:
+            seq = self._sequences.get(key, (0, 0))[0] + 1
+            self._sequences[key] = (seq, time.monotonic())
+
+            journal = self._journals.setdefault(
+                key,
+                {"events": deque(maxlen=self._max_len), "done": False},
+            )
+            journal["events"].append((seq, event_data))
+            journal["done"] = journal["done"] or done
+            journal["expires_at"] = time.monotonic() + self._ttl
+
+        return seq
+
+    async def read(
+        self, user_id: str, chat_id: str, message_id: str, offset: int = 0
+    ) -> dict:
+        """
+        Return the events after `offset`, with the latest content snapshot
+        (unnumbered) in place. `truncated` is set when some events after the
+        offset were already trimmed from the journal.
+        """
+        key = self._get_key(user_id, chat_id, message_id)
+
+        events = []
+        snapshot = None
+        done = False
+        if self._redis:
+            entries = await self._redis.xrange(key, min=f"{offset + 1}-0")
+            for entry_id, fields in entries:
+                events.append(
+                    {
+                        "seq": int(entry_id.split("-")[0]),
+                        "data": json.loads(fields.get("data", "null")),
+                    }
+                )
+                done = done or fields.get("done") == "1"
+
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                value = await self._redis.get(f"{key}:snapshot")
+                snapshot = json.loads(value) if value else None
+        else:
+            journal = self._journals.get(key)
+            if journal:
+                events = [
+                    {"seq": seq, "data": event_data}
+                    for seq, event_data in journal["events"]
+                    if seq > offset
+                ]
+                snapshot = journal.get("snapshot")
+                done = journal["done"]
+
+        last_seq = events[-1]["seq"] if events else offset
+        truncated = bool(events) and events[0]["seq"] > offset + 1
+
+        if snapshot is not None and snapshot["after"] >= offset:
+            index = next(
+                (
+                    i
+                    for i, event in enumerate(events)
+                    if event["seq"] > snapshot["after"]
+                ),
+                len(events),
+            )
+            events.insert(index, {"data": snapshot["data"]})
+
+        return {
+            "chat_id": chat_id,
+            "message_id": message_id,
+            "events": events,
+            "offset": last_seq,
+            "truncated": truncated,
+            "done": done,
+        }
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from open_webui.retrieval.models import rerank_scheduler
+from open_webui.retrieval.models.base_reranker import BaseReranker
+from open_webui.retrieval.models.rerank_scheduler import (
+    RerankScheduler,
+    RerankScoreCache,
+)
+
+
+class MockCrossEncoder:
+    """Pairwise model scoring each pair by the length of its document"""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def predict(self, pairs):
+        self.calls.append(list(pairs))
+        if self.error:
+            raise self.error
+        return [float(len(text)) for _, text in pairs]
+
+
+class MockListwiseReranker(BaseReranker):
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, sentences):
+        self.calls.append(list(sentences))
+        return [float(i) for i in range(len(sentences))]
+
+
+@pytest.fixture(autouse=True)
+def score_cache(monkeypatch):
+    cache = RerankScoreCache(100)
+    monkeypatch.setattr(rerank_scheduler, "RERANK_SCORE_CACHE", cache)
+    return cache
+
+
+class TestRerankScoreCache:
+    def test_evicts_least_recently_used(self):
+        cache = RerankScoreCache(2)
+        cache.set(("a",), 1.0)
+        cache.set(("b",), 2.0)
+        assert cache.get(("a",)) == 1.0
+
+        cache.set(("c",), 3.0)
+
+        assert cache.get(("a",)) == 1.0
+        assert cache.get(("b",)) is None
+        assert cache.get(("c",)) == 3.0
+
+    def test_disabled_when_size_is_zero(self):
+        cache = RerankScoreCache(0)
+        cache.set(("a",), 1.0)
+        assert cache.get(("a",)) is None
+
+
+class TestRerankScheduler:
+    @pytest.mark.asyncio
+    async def test_concurrent_scores_share_one_deduplicated_batch(self):
+        model = MockCrossEncoder()
+        scheduler = RerankScheduler(model, "", "cross-encoder")
+
+        first, second = await asyncio.gather(
+            scheduler.score("query", ["a", "bb", "ccc"]),
+            scheduler.score("query", ["bb", "dddd"]),
+        )
+
+        assert first == [1.0, 2.0, 3.0]
+        assert second == [2.0, 4.0]
+        assert len(model.calls) == 1
+        assert sorted(model.calls[0]) == [
+            ("query", "a"),
+            ("query", "bb"),
+            ("query", "ccc"),
+            ("query", "dddd"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_scores_are_not_predicted_again(self):
+        model = MockCrossEncoder()
+        scheduler = RerankScheduler(model, "", "cross-encoder")
+
+        await scheduler.score("query", ["a", "bb"])
+        scores = await scheduler.score("query", ["bb", "a", "ccc"])
+
+        assert scores == [2.0, 1.0, 3.0]
+        assert model.calls[1] == [("query", "ccc")]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_is_raised_to_every_waiter(self):
+        model = MockCrossEncoder(error=ValueError("model failed"))
+        scheduler = RerankScheduler(model, "", "cross-encoder")
+
+        results = await asyncio.gather(
+            scheduler.score("query", ["a"]),
+            scheduler.score("other query", ["b"]),
+            return_exceptions=True,
+        )
+
+        assert len(model.calls) == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_listwise_models_are_called_per_query_without_cache(
+        self, score_cache
+    ):
+        model = MockListwiseReranker()
+        scheduler = RerankScheduler(model, "", "colbert")
+
+        await scheduler.score("query", ["a", "b"])
+        await scheduler.score("query", ["a", "b"])
+
+        assert len(model.calls) == 2
+        assert not score_cache.entries
+
+    def test_unloaded_model_raises(self):
+        model = MockCrossEncoder()
+        scheduler = RerankScheduler(model, "", "cross-encoder")
+        del model
+
+        with pytest.raises(Exception, match="Reranking model unloaded"):
+            scheduler.predict([("query", "a")])
@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+from open_webui.retrieval import text_splitter
+from open_webui.retrieval.text_splitter import get_batches, iter_split_documents
+
+
+def get_docs():
+    return [
+        Document(
+            page_content=" ".join(f"page {page} sentence {i}." for i in range(40)),
+            metadata={"page": page},
+        )
+        for page in range(10)
+    ]
+
+
+@pytest.fixture
+def splitter_pool(monkeypatch):
+    # Threads instead of spawned processes, the batches are split the same way
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(text_splitter, "TEXT_SPLITTER_WORKERS", 4)
+    monkeypatch.setattr(text_splitter, "get_splitter_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_get_batches_groups_consecutive_documents(monkeypatch):
+    monkeypatch.setattr(text_splitter, "TEXT_SPLITTER_BATCH_SIZE", 10)
+    docs = [Document(page_content=text) for text in ["aaaaaa", "aaaaaa", "a", "a"]]
+
+    batches = get_batches(docs)
+
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert [doc for batch in batches for doc in batch] == docs
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_chunks_match_splitting_all_documents_at_once(
+    monkeypatch, splitter_pool, workers
+):
+    monkeypatch.setattr(text_splitter, "TEXT_SPLITTER_BATCH_SIZE", 1000)
+    monkeypatch.setattr(text_splitter, "TEXT_SPLITTER_WORKERS", workers)
+    docs = get_docs()
+
+    batches = list(iter_split_documents(docs, "character", 200, 20))
+    expected = RecursiveCharacterTextSplitter(
+        chunk_size=200, chunk_overlap=20, add_start_index=True
+    ).split_documents(docs)
+
+    assert len(batches) > 1
+    chunks = [chunk for batch in batches for chunk in batch]
+    assert [chunk.page_content for chunk in chunks] == [
+        chunk.page_content for chunk in expected
+    ]
+    assert [chunk.metadata for chunk in chunks] == [
+        chunk.metadata for chunk in expected
+    ]
+
+
+def test_batches_are_yielded_in_document_order(monkeypatch, splitter_pool):
+    monkeypatch.setattr(text_splitter, "TEXT_SPLITTER_BATCH_SIZE", 1)
+    docs = get_docs()
+
+    pages = [
+        [chunk.metadata["page"] for chunk in batch]
+        for batch in iter_split_documents(docs, "character", 200, 20)
+    ]
+
+    assert [batch[0] for batch in pages] == list(range(10))
+    assert all(len(set(batch)) == 1 for batch in pages)
+
+
+def test_invalid_splitter_raises(splitter_pool):
+    with pytest.raises(ValueError, match="Invalid text splitter"):
+        list(iter_split_documents(get_docs(), "unknown", 200, 20))
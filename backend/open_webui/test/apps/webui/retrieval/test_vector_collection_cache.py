@@ -0,0 +1,92 @@
+import pytest
+
+from open_webui.retrieval.vector import main
+from test.util.mock_vector_db import MockVectorDB
+
+
+class MockClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = MockClock()
+    monkeypatch.setattr(main, "time", clock)
+    return clock
+
+
+class Lookup:
+    def __init__(self, exists):
+        self.exists = exists
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.exists
+
+
+def test_positive_lookup_is_cached_until_ttl(clock):
+    client = MockVectorDB()
+    lookup = Lookup(True)
+
+    assert client._has_collection_cached("docs", lookup)
+    assert client._has_collection_cached("docs", lookup)
+    assert lookup.calls == 1
+
+    clock.now += 61
+    assert client._has_collection_cached("docs", lookup)
+    assert lookup.calls == 2
+
+
+def test_negative_lookup_is_not_cached(clock):
+    client = MockVectorDB()
+    lookup = Lookup(False)
+
+    assert not client._has_collection_cached("docs", lookup)
+    lookup.exists = True
+    assert client._has_collection_cached("docs", lookup)
+    assert lookup.calls == 2
+
+
+def test_handle_is_cached_with_the_collection(clock):
+    client = MockVectorDB()
+    handle = object()
+
+    client._set_cached_collection("docs", handle=handle)
+
+    assert client._get_cached_collection("docs") == (True, handle)
+
+
+def test_invalidate_forgets_one_or_all_collections(clock):
+    client = MockVectorDB()
+    client._set_cached_collection("docs")
+    client._set_cached_collection("notes")
+
+    client._invalidate_cached_collection("docs")
+    assert client._get_cached_collection("docs") is None
+    assert client._get_cached_collection("notes") == (True, None)
+
+    client._invalidate_cached_collection()
+    assert client._get_cached_collection("notes") is None
+
+
+def test_cache_disabled_when_ttl_is_zero(clock):
+    client = MockVectorDB()
+    client.collection_cache_ttl = 0
+    lookup = Lookup(True)
+
+    client._has_collection_cached("docs", lookup)
+    client._has_collection_cached("docs", lookup)
+
+    assert lookup.calls == 2
+
+
+def test_clients_do_not_share_entries(clock):
+    client, other_client = MockVectorDB(), MockVectorDB()
+    client._set_cached_collection("docs")
+
+    assert other_client._get_cached_collection("docs") is None
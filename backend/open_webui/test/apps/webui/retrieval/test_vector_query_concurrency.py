@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+from open_webui.retrieval.vector import main
+from test.util.mock_vector_db import MockVectorDB
+
+
+@pytest.fixture
+def query_concurrency(monkeypatch):
+    def set_concurrency(concurrency):
+        monkeypatch.setattr(main, "VECTOR_DB_QUERY_CONCURRENCY", concurrency)
+        monkeypatch.setattr(main, "_query_executor", None)
+
+    return set_concurrency
+
+
+def test_results_keep_the_order_of_items(query_concurrency):
+    query_concurrency(4)
+
+    def func(item):
+        # Later items finish first
+        time.sleep(0.01 * (4 - item))
+        return item * 10
+
+    assert MockVectorDB()._map_concurrently(func, [0, 1, 2, 3]) == [0, 10, 20, 30]
+
+
+def test_items_run_concurrently(query_concurrency):
+    query_concurrency(3)
+    # Only passes once all three calls are waiting at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def func(item):
+        barrier.wait()
+        return item
+
+    assert MockVectorDB()._map_concurrently(func, [1, 2, 3]) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("concurrency, items", [(1, [1, 2, 3]), (4, [1])])
+def test_runs_inline_without_concurrency(query_concurrency, concurrency, items):
+    query_concurrency(concurrency)
+    caller = threading.get_ident()
+
+    def func(item):
+        assert threading.get_ident() == caller
+        return item
+
+    assert MockVectorDB()._map_concurrently(func, items) == items
+
+
+def test_errors_are_raised_to_the_caller(query_concurrency):
+    query_concurrency(2)
+
+    def func(item):
+        if item == 2:
+            raise ValueError("query failed")
+        return item
+
+    with pytest.raises(ValueError, match="query failed"):
+        MockVectorDB()._map_concurrently(func, [1, 2, 3])
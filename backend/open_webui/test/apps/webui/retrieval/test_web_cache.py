@@ -0,0 +1,135 @@
+import pytest
+
+from open_webui.retrieval.web import cache
+from open_webui.retrieval.web.cache import CacheTier, get_page_cache_policy
+
+
+class MockClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    clock = MockClock()
+    monkeypatch.setattr(cache, "time", clock)
+    monkeypatch.setattr(cache, "ENABLE_WEB_SEARCH_CACHE", True)
+    monkeypatch.setattr(cache, "WEB_PAGE_CACHE_TTL", 3600)
+    return clock
+
+
+class TestCacheTier:
+    def test_get_returns_value_until_ttl(self, clock):
+        tier = CacheTier("test", 10, ttl=60)
+        tier.set("a", "value")
+
+        assert tier.get("a") == "value"
+        clock.now += 61
+        assert tier.get("a") is None
+        assert tier.stats()["hits"] == 1
+        assert tier.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used_by_size(self):
+        tier = CacheTier("test", 10, ttl=60, sizeof=len)
+        tier.set("a", "aaaa")
+        tier.set("b", "bbbb")
+        tier.get("a")
+
+        tier.set("c", "cccc")
+
+        assert tier.get("a") == "aaaa"
+        assert tier.get("b") is None
+        assert tier.get("c") == "cccc"
+        assert tier.size == 8
+
+    def test_skips_values_larger_than_the_cache(self):
+        tier = CacheTier("test", 10, ttl=60, sizeof=len)
+        tier.set("a", "a" * 11)
+
+        assert tier.get("a") is None
+        assert tier.size == 0
+
+    def test_replacing_a_value_updates_the_size(self):
+        tier = CacheTier("test", 10, ttl=60, sizeof=len)
+        tier.set("a", "aaaa")
+        tier.set("a", "aa")
+
+        assert tier.size == 2
+
+    def test_keep_stale_returns_expired_values_on_request(self, clock):
+        tier = CacheTier("test", 10, ttl=60, keep_stale=True)
+        tier.set("a", "value")
+        clock.now += 61
+
+        assert tier.get("a") is None
+        assert tier.get("a", stale=True) == "value"
+
+    def test_disabled_without_size(self):
+        tier = CacheTier("test", 0, ttl=60)
+        tier.set("a", "value")
+
+        assert tier.get("a") is None
+
+
+class TestGetPageCachePolicy:
+    def test_max_age_minus_age(self):
+        policy = get_page_cache_policy(
+            {"Cache-Control": "public, max-age=600", "Age": "100", "ETag": '"v1"'}
+        )
+
+        assert policy["store"]
+        assert policy["ttl"] == 500
+        assert policy["etag"] == '"v1"'
+
+    def test_ttl_is_capped(self):
+        policy = get_page_cache_policy({"Cache-Control": "max-age=86400"})
+
+        assert policy["ttl"] == 3600
+
+    def test_no_cache_stores_for_revalidation_only(self):
+        policy = get_page_cache_policy({"Cache-Control": "no-cache"})
+
+        assert policy["store"]
+        assert policy["ttl"] == 0
+
+    def test_expires_relative_to_date(self):
+        policy = get_page_cache_policy(
+            {
+                "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+                "Expires": "Mon, 01 Jan 2024 00:05:00 GMT",
+            }
+        )
+
+        assert policy["ttl"] == 300
+
+    def test_invalid_expires_is_already_expired(self):
+        policy = get_page_cache_policy({"Expires": "0"})
+
+        assert policy["ttl"] == 0
+
+    def test_without_headers_uses_default_ttl(self):
+        policy = get_page_cache_policy({})
+
+        assert policy["store"]
+        assert policy["ttl"] is None
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Cache-Control": "no-store"},
+            {"Cache-Control": "private, max-age=600"},
+            {"Vary": "Cookie"},
+            {"Vary": "*"},
+        ],
+    )
+    def test_not_stored_in_the_shared_cache(self, headers):
+        assert not get_page_cache_policy(headers)["store"]
+
+    def test_vary_on_accept_encoding_is_stored(self):
+        assert get_page_cache_policy({"Vary": "Accept-Encoding"})["store"]
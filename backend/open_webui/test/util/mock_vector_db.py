@@ -0,0 +1,34 @@
+from open_webui.retrieval.vector.main import VectorDBBase
+
+
+class MockVectorDB(VectorDBBase):
+    """Vector DB client without a backend, for testing VectorDBBase helpers"""
+
+    collection_cache_ttl = 60
+
+    def has_collection(self, collection_name):
+        pass
+
+    def delete_collection(self, collection_name):
+        pass
+
+    def insert(self, collection_name, items):
+        pass
+
+    def upsert(self, collection_name, items):
+        pass
+
+    def search(self, collection_name, vectors, limit):
+        pass
+
+    def query(self, collection_name, filter, limit=None):
+        pass
+
+    def get(self, collection_name):
+        pass
+
+    def delete(self, collection_name, ids=None, filter=None):
+        pass
+
+    def reset(self):
+        pass
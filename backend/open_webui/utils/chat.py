@@ -45,13 +45,14 @@ from open_webui.utils.plugin import (
     get_function_module_from_cache,
 )
 from open_webui.utils.models import get_all_models, check_model_access
+from open_webui.utils.executor import run_sync_handler
 from open_webui.utils.payload import convert_payload_openai_to_ollama
 from open_webui.utils.response import (
     convert_response_ollama_to_openai,
     convert_streaming_response_ollama_to_openai,
 )
 from open_webui.utils.filter import (
-    get_sorted_filter_ids,
+    get_filter_chain,
     process_filter_functions,
 )
 
@@ -331,12 +332,12 @@ async def chat_completed(request: Request, form_data: dict, user: Any):
     }
 
     try:
-        filter_functions = [
-            Functions.get_function_by_id(filter_id)
-            for filter_id in get_sorted_filter_ids(
-                request, model, metadata.get("filter_ids", [])
-            )
-        ]
+        filter_functions = get_filter_chain(
+            request,
+            model,
+            metadata.get("filter_ids", []),
+            user=extra_params.get("__user__"),
+        )
 
         result, _ = await process_filter_functions(
             request=request,
@@ -440,7 +441,7 @@ async def chat_action(request: Request, action_id: str, form_data: dict, user: A
             if inspect.iscoroutinefunction(action):
                 data = await action(**params)
             else:
-                data = action(**params)
+                data = await run_sync_handler(action, plugin_id=action_id, **params)
 
         except Exception as e:
             return Exception(f"Error: {e}")
@@ -0,0 +1,250 @@
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import pickle
+import sys
+import time
+import types
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from opentelemetry import metrics
+
+from open_webui.env import (
+    PLUGIN_PROCESS_POOL_SIZE,
+    PLUGIN_SYNC_BLOCKING_THRESHOLD_MS,
+    PLUGIN_SYNC_EXECUTION_MODE,
+    PLUGIN_SYNC_EXECUTION_TIMEOUT,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MAIN"])
+
+EXECUTION_MODES = ("inline", "thread", "process")
+
+# Plugin instance -> (module name, source), needed to rebuild it in a worker process
+PLUGIN_SOURCES = weakref.WeakKeyDictionary()
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+meter = metrics.get_meter(__name__)
+sync_handler_duration = meter.create_histogram(
+    name="webui.plugins.sync_handler.duration",
+    description="Duration of synchronous plugin handler calls",
+    unit="ms",
+)
+sync_handler_blocking = meter.create_counter(
+    name="webui.plugins.sync_handler.blocking",
+    description="Synchronous plugin handler calls that blocked the event loop",
+    unit="1",
+)
+
+
+def register_plugin_source(instance, module_name: str, content: str):
+    try:
+        PLUGIN_SOURCES[instance] = (module_name, content)
+    except TypeError:
+        # Not weak-referenceable, process execution will not be available
+        pass
+
+
+def get_plugin_source(instance) -> Optional[tuple[str, str]]:
+    try:
+        return PLUGIN_SOURCES.get(instance)
+    except TypeError:
+        return None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=PLUGIN_PROCESS_POOL_SIZE,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def get_execution_policy(instance) -> tuple[str, Optional[float]]:
+    """
+    Resolve how a plugin's sync handlers run. Plugins opt in by setting
+    `self.execution = "inline" | "thread" | "process"` and optionally
+    `self.execution_timeout` (seconds), like `file_handler` or `citation`.
+    """
+    mode = getattr(instance, "execution", None) or PLUGIN_SYNC_EXECUTION_MODE
+    if mode not in EXECUTION_MODES:
+        log.warning(f"Unknown execution mode '{mode}', using inline")
+        mode = "inline"
+
+    timeout = getattr(instance, "execution_timeout", None)
+    if timeout is None:
+        timeout = PLUGIN_SYNC_EXECUTION_TIMEOUT
+
+    return mode, timeout
+
+
+####################
+# Worker process
+####################
+
+_WORKER_PLUGINS = {}
+
+
+def _call_plugin_in_process(
+    module_name: str,
+    content: str,
+    class_name: str,
+    method_name: str,
+    valves: Optional[dict],
+    kwargs: dict,
+):
+    key = (module_name, hashlib.sha256(content.encode("utf-8")).hexdigest())
+
+    instance = _WORKER_PLUGINS.get(key)
+    if instance is None:
+        module = types.ModuleType(module_name)
+        sys.modules[module_name] = module
+        exec(content, module.__dict__)
+
+        instance = getattr(module, class_name)()
+        _WORKER_PLUGINS[key] = instance
+
+    if valves is not None and hasattr(instance, "Valves"):
+        instance.valves = instance.Valves(**valves)
+
+    user = kwargs.get("__user__")
+    if (
+        isinstance(user, dict)
+        and isinstance(user.get("valves"), dict)
+        and hasattr(instance, "UserValves")
+    ):
+        kwargs["__user__"] = {**user, "valves": instance.UserValves(**user["valves"])}
+
+    return getattr(instance, method_name)(**kwargs)
+
+
+def get_picklable_kwargs(kwargs: dict) -> dict:
+    picklable = {}
+    for key, value in kwargs.items():
+        if (
+            key == "__user__"
+            and isinstance(value, dict)
+            and hasattr(value.get("valves"), "model_dump")
+        ):
+            # UserValves is a class of the plugin module, which the worker only
+            # has once it rebuilt the plugin, so it is passed as a dict
+            value = {**value, "valves": value["valves"].model_dump()}
+
+        try:
+            pickle.dumps(value)
+            picklable[key] = value
+        except Exception:
+            # e.g. __event_emitter__, __request__
+            log.debug(f"Dropping non-picklable argument for process execution: {key}")
+    return picklable
+
+
+####################
+# Execution
+####################
+
+
+def unwrap_handler(handler: Callable) -> tuple[Callable, dict]:
+    kwargs = {}
+    while isinstance(handler, partial):
+        kwargs = {**handler.keywords, **kwargs}
+        handler = handler.func
+    return handler, kwargs
+
+
+def record_sync_call(
+    plugin_id: Optional[str], handler_name: str, mode: str, elapsed_ms: float
+):
+    attributes = {
+        "plugin.id": plugin_id or "",
+        "plugin.handler": handler_name,
+        "plugin.execution": mode,
+    }
+    sync_handler_duration.record(elapsed_ms, attributes)
+
+    if mode == "inline" and elapsed_ms > PLUGIN_SYNC_BLOCKING_THRESHOLD_MS:
+        sync_handler_blocking.add(1, attributes)
+        log.warning(
+            f"Sync handler {plugin_id}.{handler_name} blocked the event loop for "
+            f"{elapsed_ms:.0f}ms, consider making it async or setting execution = 'thread'"
+        )
+
+
+async def run_sync_handler(
+    handler: Callable, plugin_id: Optional[str] = None, **kwargs
+):
+    """
+    Run a synchronous plugin handler according to its plugin's execution
+    policy: inline on the event loop, in the thread pool, or in a worker
+    process. Process execution rebuilds the plugin from source in the worker,
+    so only picklable arguments are passed and the result must be picklable.
+    """
+    function, partial_kwargs = unwrap_handler(handler)
+    kwargs = {**partial_kwargs, **kwargs}
+
+    instance = getattr(function, "__self__", None)
+    handler_name = getattr(function, "__name__", "handler")
+    mode, timeout = get_execution_policy(instance)
+
+    # Per-chunk stream filters run inline unless the plugin itself asks
+    # otherwise, a thread or process hop per token costs more than they do
+    if handler_name == "stream" and getattr(instance, "execution", None) is None:
+        mode = "inline"
+
+    if mode == "process" and get_plugin_source(instance) is None:
+        log.debug(f"No source registered for {plugin_id}, using thread execution")
+        mode = "thread"
+
+    start_time = time.perf_counter()
+    try:
+        if mode == "inline":
+            return function(**kwargs)
+
+        if mode == "thread":
+            future = run_in_threadpool(function, **kwargs)
+        else:
+            module_name, content = get_plugin_source(instance)
+            valves = getattr(instance, "valves", None)
+            future = asyncio.get_running_loop().run_in_executor(
+                get_process_pool(),
+                partial(
+                    _call_plugin_in_process,
+                    module_name,
+                    content,
+                    type(instance).__name__,
+                    handler_name,
+                    valves.model_dump() if hasattr(valves, "model_dump") else None,
+                    get_picklable_kwargs(kwargs),
+                ),
+            )
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"{plugin_id or handler_name} did not finish within {timeout} seconds"
+            )
+    finally:
+        record_sync_call(
+            plugin_id,
+            handler_name,
+            mode,
+            (time.perf_counter() - start_time) * 1000.0,
+        )
@@ -1,17 +1,28 @@
 import inspect
+import json
 import logging
+from collections import OrderedDict
+from typing import Optional
 
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
 )
 from open_webui.models.functions import Functions
+from open_webui.utils.executor import run_sync_handler
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
 
+FILTER_TYPES = ("inlet", "stream", "outlet")
+
+# Compiled filter chains keyed by (model, user, enabled toggles)
+FILTER_CHAIN_CACHE: OrderedDict = OrderedDict()
+FILTER_CHAIN_CACHE_MAX_SIZE = 1024
+
+
 def get_function_module(request, function_id, load_from_db=True):
     """
     Get the function module by its ID.
@@ -22,39 +33,146 @@ def get_function_module(request, function_id, load_from_db=True):
     return function_module
 
 
-def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None):
-    def get_priority(function_id):
-        function = Functions.get_function_by_id(function_id)
-        if function is not None:
-            valves = Functions.get_function_valves_by_id(function_id)
-            return valves.get("priority", 0) if valves else 0
-        return 0
-
-    filter_ids = [function.id for function in Functions.get_global_filter_functions()]
+class CompiledFilter:
+    """
+    A filter function with its valves applied and handler signatures resolved,
+    so running it does not touch the database.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        module,
+        priority: int = 0,
+        user_valves=None,
+    ):
+        self.id = id
+        self.module = module
+        self.priority = priority
+        self.user_valves = user_valves
+
+        self.has_file_handler = hasattr(module, "file_handler")
+
+        # filter_type -> (handler, parameter names, is_coroutine)
+        self.handlers = {}
+        for filter_type in FILTER_TYPES:
+            handler = getattr(module, filter_type, None)
+            if handler:
+                self.handlers[filter_type] = (
+                    handler,
+                    frozenset(inspect.signature(handler).parameters),
+                    inspect.iscoroutinefunction(handler),
+                )
+
+
+def get_user_valves_from_user(function_id: str, user: Optional[dict]) -> dict:
+    if not user or not user.get("id"):
+        return {}
+
+    if "settings" not in user:
+        return (
+            Functions.get_user_valves_by_id_and_user_id(function_id, user["id"]) or {}
+        )
+
+    settings = user.get("settings") or {}
+    return ((settings.get("functions") or {}).get("valves") or {}).get(
+        function_id, {}
+    ) or {}
+
+
+def compile_filter(request, function_id: str, valves: Optional[dict], user: dict):
+    function_module = get_function_module(request, function_id)
+
+    # Apply valves to the function
+    if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
+        function_module.valves = function_module.Valves(**(valves if valves else {}))
+
+    user_valves = None
+    if hasattr(function_module, "UserValves") and user:
+        try:
+            user_valves = function_module.UserValves(
+                **get_user_valves_from_user(function_id, user)
+            )
+        except Exception as e:
+            log.exception(f"Failed to get user values: {e}")
+
+    return CompiledFilter(
+        id=function_id,
+        module=function_module,
+        priority=(valves or {}).get("priority", 0),
+        user_valves=user_valves,
+    )
+
+
+def get_filter_chain(
+    request, model: dict, enabled_filter_ids: list = None, user: dict = None
+) -> list[CompiledFilter]:
+    """
+    Return the sorted, compiled filter chain for a model and user.
+
+    Only a lightweight version query runs per call; the chain is recompiled
+    when a filter function, its valves or the user's valves change.
+    """
+    user = user or {}
+
+    functions = {
+        function_id: (is_global, updated_at, valves)
+        for (
+            function_id,
+            is_global,
+            updated_at,
+            valves,
+        ) in Functions.get_function_versions_by_type("filter", active_only=True)
+    }
+
+    filter_ids = [
+        function_id for function_id, (is_global, _, _) in functions.items() if is_global
+    ]
     if "info" in model and "meta" in model["info"]:
         filter_ids.extend(model["info"]["meta"].get("filterIds", []))
-        filter_ids = list(set(filter_ids))
-    active_filter_ids = [
-        function.id
-        for function in Functions.get_functions_by_type("filter", active_only=True)
-    ]
+    filter_ids = sorted(set(fid for fid in filter_ids if fid in functions))
+
+    enabled_filter_ids = sorted(enabled_filter_ids or [])
+    user_functions = (user.get("settings") or {}).get("functions") or {}
 
-    def get_active_status(filter_id):
-        function_module = get_function_module(request, filter_id)
+    key = (model.get("id"), user.get("id"), tuple(enabled_filter_ids))
+    fingerprint = json.dumps(
+        [[fid, functions[fid][1], functions[fid][2]] for fid in filter_ids]
+        + [(user_functions.get("valves") or {}).get(fid) for fid in filter_ids],
+        sort_keys=True,
+        default=str,
+    )
 
-        if getattr(function_module, "toggle", None):
-            return filter_id in (enabled_filter_ids or [])
+    cached = FILTER_CHAIN_CACHE.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        FILTER_CHAIN_CACHE.move_to_end(key)
+        return cached[1]
 
-        return True
+    chain = []
+    for filter_id in filter_ids:
+        compiled = compile_filter(request, filter_id, functions[filter_id][2], user)
 
-    active_filter_ids = [
-        filter_id for filter_id in active_filter_ids if get_active_status(filter_id)
-    ]
+        if getattr(compiled.module, "toggle", None) and (
+            filter_id not in enabled_filter_ids
+        ):
+            continue
+
+        chain.append(compiled)
+
+    chain.sort(key=lambda compiled: compiled.priority)
 
-    filter_ids = [fid for fid in filter_ids if fid in active_filter_ids]
-    filter_ids.sort(key=get_priority)
+    FILTER_CHAIN_CACHE[key] = (fingerprint, chain)
+    FILTER_CHAIN_CACHE.move_to_end(key)
+    while len(FILTER_CHAIN_CACHE) > FILTER_CHAIN_CACHE_MAX_SIZE:
+        FILTER_CHAIN_CACHE.popitem(last=False)
 
-    return filter_ids
+    return chain
+
+
+def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None):
+    return [
+        compiled.id for compiled in get_filter_chain(request, model, enabled_filter_ids)
+    ]
 
 
 async def process_filter_functions(
@@ -62,35 +180,32 @@ async def process_filter_functions(
 ):
     skip_files = None
 
-    for function in filter_functions:
-        filter = function
-        filter_id = function.id
+    for filter in filter_functions:
         if not filter:
             continue
 
-        function_module = get_function_module(
-            request, filter_id, load_from_db=(filter_type != "stream")
-        )
+        if not isinstance(filter, CompiledFilter):
+            # Plain function models, compile on the fly
+            filter = compile_filter(
+                request,
+                filter.id,
+                Functions.get_function_valves_by_id(filter.id),
+                extra_params.get("__user__"),
+            )
+
+        filter_id = filter.id
+
         # Prepare handler function
-        handler = getattr(function_module, filter_type, None)
-        if not handler:
+        if filter_type not in filter.handlers:
             continue
+        handler, parameters, is_coroutine = filter.handlers[filter_type]
 
         # Check if the function has a file_handler variable
-        if filter_type == "inlet" and hasattr(function_module, "file_handler"):
-            skip_files = function_module.file_handler
-
-        # Apply valves to the function
-        if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
-            valves = Functions.get_function_valves_by_id(filter_id)
-            function_module.valves = function_module.Valves(
-                **(valves if valves else {})
-            )
+        if filter_type == "inlet" and filter.has_file_handler:
+            skip_files = filter.module.file_handler
 
         try:
             # Prepare parameters
-            sig = inspect.signature(handler)
-
             params = {"body": form_data}
             if filter_type == "stream":
                 params = {"event": form_data}
@@ -101,26 +216,23 @@ async def process_filter_functions(
                     **extra_params,
                     "__id__": filter_id,
                 }.items()
-                if k in sig.parameters
+                if k in parameters
             }
 
             # Handle user parameters
-            if "__user__" in sig.parameters:
-                if hasattr(function_module, "UserValves"):
-                    try:
-                        params["__user__"]["valves"] = function_module.UserValves(
-                            **Functions.get_user_valves_by_id_and_user_id(
-                                filter_id, params["__user__"]["id"]
-                            )
-                        )
-                    except Exception as e:
-                        log.exception(f"Failed to get user values: {e}")
+            if "__user__" in parameters and filter.user_valves is not None:
+                try:
+                    params["__user__"]["valves"] = filter.user_valves
+                except Exception as e:
+                    log.exception(f"Failed to get user values: {e}")
 
             # Execute handler
-            if inspect.iscoroutinefunction(handler):
+            if is_coroutine:
                 form_data = await handler(**params)
             else:
-                form_data = handler(**params)
+                form_data = await run_sync_handler(
+                    handler, plugin_id=filter_id, **params
+                )
 
         except Exception as e:
             log.debug(f"Error in {filter_type} handler {filter_id}: {e}")
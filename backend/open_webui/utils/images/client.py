@@ -0,0 +1,95 @@
+import json
+import logging
+from typing import Optional
+
+import aiohttp
+
+from open_webui.env import (
+    AIOHTTP_CLIENT_SESSION_SSL,
+    AIOHTTP_CLIENT_TIMEOUT,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["IMAGES"])
+
+# Shared, pooled HTTP session for all image backends (OpenAI, Gemini,
+# Automatic1111, ComfyUI). Created lazily on the running event loop.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            trust_env=True,
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+class ImageResponse:
+    """
+    Minimal buffered response, so callers can keep the `status_code`, `.json()`
+    and `.text` access they had with `requests`.
+    """
+
+    def __init__(self, status: int, headers, content: bytes):
+        self.status_code = status
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}: {self.text[:500]}")
+
+
+async def request(
+    method: str,
+    url: str,
+    headers: Optional[dict] = None,
+    json: Optional[dict] = None,
+    data=None,
+) -> ImageResponse:
+    session = get_session()
+    async with session.request(
+        method,
+        url,
+        headers=headers,
+        json=json,
+        data=data,
+        ssl=AIOHTTP_CLIENT_SESSION_SSL,
+    ) as r:
+        content = await r.read()
+        return ImageResponse(r.status, r.headers.copy(), content)
+
+
+async def fetch_image_data(url: str, headers: Optional[dict] = None):
+    """
+    Download an image over the shared session. Returns (bytes, mime_type), or
+    (None, None) if the URL does not point to an image.
+    """
+    r = await request("GET", url, headers=headers)
+    r.raise_for_status()
+
+    content_type = r.headers.get("content-type", "")
+    if content_type.split("/")[0] == "image":
+        return r.content, content_type
+
+    log.error("Url does not point to an image.")
+    return None, None
@@ -2,14 +2,17 @@ import asyncio
 import json
 import logging
 import random
-import requests
+import uuid
 import aiohttp
 import urllib.parse
-import urllib.request
-from typing import Optional
-
-import websocket  # NOTE: websocket-client (https://github.com/websocket-client/websocket-client)
-from open_webui.env import SRC_LOG_LEVELS
+from typing import Awaitable, Callable, Optional
+
+from open_webui.env import (
+    AIOHTTP_CLIENT_SESSION_SSL,
+    AIOHTTP_CLIENT_TIMEOUT,
+    SRC_LOG_LEVELS,
+)
+from open_webui.utils.images.client import get_session
 from pydantic import BaseModel
 
 log = logging.getLogger(__name__)
@@ -18,36 +21,31 @@ log.setLevel(SRC_LOG_LEVELS["COMFYUI"])
 default_headers = {"User-Agent": "Mozilla/5.0"}
 
 
-def queue_prompt(prompt, client_id, base_url, api_key):
+def get_headers(api_key):
+    headers = {**default_headers}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+async def queue_prompt(prompt, client_id, base_url, api_key):
     log.info("queue_prompt")
     p = {"prompt": prompt, "client_id": client_id}
-    data = json.dumps(p).encode("utf-8")
-    log.debug(f"queue_prompt data: {data}")
+    log.debug(f"queue_prompt data: {p}")
     try:
-        req = urllib.request.Request(
+        async with get_session().post(
             f"{base_url}/prompt",
-            data=data,
-            headers={**default_headers, "Authorization": f"Bearer {api_key}"},
-        )
-        response = urllib.request.urlopen(req).read()
-        return json.loads(response)
+            json=p,
+            headers=get_headers(api_key),
+            ssl=AIOHTTP_CLIENT_SESSION_SSL,
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
     except Exception as e:
         log.exception(f"Error while queuing prompt: {e}")
         raise e
 
 
-def get_image(filename, subfolder, folder_type, base_url, api_key):
-    log.info("get_image")
-    data = {"filename": filename, "subfolder": subfolder, "type": folder_type}
-    url_values = urllib.parse.urlencode(data)
-    req = urllib.request.Request(
-        f"{base_url}/view?{url_values}",
-        headers={**default_headers, "Authorization": f"Bearer {api_key}"},
-    )
-    with urllib.request.urlopen(req) as response:
-        return response.read()
-
-
 def get_image_url(filename, subfolder, folder_type, base_url):
     log.info("get_image")
     data = {"filename": filename, "subfolder": subfolder, "type": folder_type}
@@ -55,41 +53,218 @@ def get_image_url(filename, subfolder, folder_type, base_url):
     return f"{base_url}/view?{url_values}"
 
 
-def get_history(prompt_id, base_url, api_key):
+async def get_history(prompt_id, base_url, api_key):
     log.info("get_history")
 
-    req = urllib.request.Request(
+    async with get_session().get(
         f"{base_url}/history/{prompt_id}",
-        headers={**default_headers, "Authorization": f"Bearer {api_key}"},
-    )
-    with urllib.request.urlopen(req) as response:
-        return json.loads(response.read())
+        headers=get_headers(api_key),
+        ssl=AIOHTTP_CLIENT_SESSION_SSL,
+    ) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
+
+
+class ComfyUIConnection:
+    """
+    A single persistent websocket to a ComfyUI server, shared by every job sent
+    to that server. Prompts are queued under this connection's client_id and the
+    reader task routes execution/progress messages to the job waiting on each
+    prompt_id, so many generations can run concurrently over one socket.
+    """
+
+    # Prompt ids finished before their waiter registered are kept briefly
+    MAX_EARLY_RESULTS = 256
+
+    def __init__(self, base_url: str, api_key: str):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.client_id = str(uuid.uuid4())
+
+        self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self.reader_task: Optional[asyncio.Task] = None
+        self.lock = asyncio.Lock()
+
+        self.jobs: dict[str, asyncio.Future] = {}
+        self.progress_handlers: dict[str, Callable[[dict], Awaitable]] = {}
+        self.early_results: dict[str, Optional[str]] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self.ws is not None and not self.ws.closed
+
+    async def connect(self):
+        async with self.lock:
+            if self.connected:
+                return
+
+            ws_url = self.base_url.replace("http://", "ws://").replace(
+                "https://", "wss://"
+            )
+            self.ws = await get_session().ws_connect(
+                f"{ws_url}/ws?clientId={self.client_id}",
+                headers=get_headers(self.api_key),
+                heartbeat=30,
+                ssl=AIOHTTP_CLIENT_SESSION_SSL,
+            )
+            self.reader_task = asyncio.create_task(self.read_messages())
+            log.info(f"ComfyUI websocket connected: {self.base_url}")
+
+    async def close(self):
+        if self.reader_task:
+            self.reader_task.cancel()
+        if self.ws is not None and not self.ws.closed:
+            await self.ws.close()
+        self.ws = None
+
+    async def read_messages(self):
+        try:
+            async for msg in self.ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue  # previews are binary data
+
+                try:
+                    message = json.loads(msg.data)
+                except Exception:
+                    continue
+
+                await self.dispatch(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.exception(f"ComfyUI websocket reader failed: {e}")
+        finally:
+            self.fail_pending(Exception("ComfyUI websocket connection closed"))
+
+    async def dispatch(self, message: dict):
+        message_type = message.get("type")
+        data = message.get("data", {}) or {}
+        prompt_id = data.get("prompt_id")
+        if not prompt_id:
+            return
+
+        if message_type == "progress":
+            handler = self.progress_handlers.get(prompt_id)
+            if handler:
+                try:
+                    await handler(data)
+                except Exception as e:
+                    log.debug(f"Error forwarding ComfyUI progress: {e}")
+        elif message_type == "executing" and data.get("node") is None:
+            self.resolve(prompt_id, None)  # Execution is done
+        elif message_type == "execution_error":
+            self.resolve(
+                prompt_id, data.get("exception_message", "ComfyUI execution error")
+            )
+
+    def resolve(self, prompt_id: str, error: Optional[str]):
+        future = self.jobs.pop(prompt_id, None)
+        self.progress_handlers.pop(prompt_id, None)
+
+        if future is None:
+            self.early_results[prompt_id] = error
+            while len(self.early_results) > self.MAX_EARLY_RESULTS:
+                self.early_results.pop(next(iter(self.early_results)))
+            return
+
+        if not future.done():
+            if error:
+                future.set_exception(Exception(error))
+            else:
+                future.set_result(prompt_id)
+
+    def fail_pending(self, error: Exception):
+        for future in self.jobs.values():
+            if not future.done():
+                future.set_exception(error)
+        self.jobs.clear()
+        self.progress_handlers.clear()
+
+    async def run(
+        self,
+        prompt: dict,
+        progress_handler: Optional[Callable[[dict], Awaitable]] = None,
+    ) -> str:
+        """
+        Queue a workflow and wait until ComfyUI has finished executing it, for
+        at most AIOHTTP_CLIENT_TIMEOUT seconds.
+        """
+        await self.connect()
+
+        res = await queue_prompt(prompt, self.client_id, self.base_url, self.api_key)
+        prompt_id = res["prompt_id"]
+
+        if prompt_id in self.early_results:
+            error = self.early_results.pop(prompt_id)
+            if error:
+                raise Exception(error)
+            return prompt_id
+
+        future = asyncio.get_running_loop().create_future()
+        self.jobs[prompt_id] = future
+        if progress_handler:
+            self.progress_handlers[prompt_id] = progress_handler
+
+        try:
+            return await asyncio.wait_for(future, timeout=AIOHTTP_CLIENT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise Exception(f"ComfyUI timed out waiting for prompt {prompt_id}")
+        finally:
+            # Stop routing messages to a job nobody waits on anymore
+            if self.jobs.get(prompt_id) is future:
+                self.jobs.pop(prompt_id, None)
+                self.progress_handlers.pop(prompt_id, None)
+
+
+# One shared connection per (base_url, api_key)
+COMFYUI_CONNECTIONS: dict[tuple[str, str], ComfyUIConnection] = {}
+
+
+def get_comfyui_connection(base_url: str, api_key: str) -> ComfyUIConnection:
+    key = (base_url, api_key or "")
+    connection = COMFYUI_CONNECTIONS.get(key)
+    if connection is None:
+        connection = ComfyUIConnection(base_url, api_key)
+        COMFYUI_CONNECTIONS[key] = connection
+    return connection
+
+
+async def close_comfyui_connections():
+    for connection in list(COMFYUI_CONNECTIONS.values()):
+        await connection.close()
+    COMFYUI_CONNECTIONS.clear()
+
+
+async def get_images(prompt, base_url, api_key, event_emitter=None):
+    progress_handler = None
+    if event_emitter:
+
+        async def progress_handler(data):
+            value, max_value = data.get("value", 0), data.get("max", 0)
+            if max_value:
+                await event_emitter(
+                    {
+                        "type": "status",
+                        "data": {
+                            "description": f"Creating image ({int(value * 100 / max_value)}%)",
+                            "done": False,
+                        },
+                    }
+                )
 
+    connection = get_comfyui_connection(base_url, api_key)
+    prompt_id = await connection.run(prompt, progress_handler)
 
-def get_images(ws, prompt, client_id, base_url, api_key):
-    prompt_id = queue_prompt(prompt, client_id, base_url, api_key)["prompt_id"]
     output_images = []
-    while True:
-        out = ws.recv()
-        if isinstance(out, str):
-            message = json.loads(out)
-            if message["type"] == "executing":
-                data = message["data"]
-                if data["node"] is None and data["prompt_id"] == prompt_id:
-                    break  # Execution is done
-        else:
-            continue  # previews are binary data
-
-    history = get_history(prompt_id, base_url, api_key)[prompt_id]
-    for o in history["outputs"]:
-        for node_id in history["outputs"]:
-            node_output = history["outputs"][node_id]
-            if "images" in node_output:
-                for image in node_output["images"]:
-                    url = get_image_url(
-                        image["filename"], image["subfolder"], image["type"], base_url
-                    )
-                    output_images.append({"url": url})
+    history = (await get_history(prompt_id, base_url, api_key))[prompt_id]
+    for node_id in history["outputs"]:
+        node_output = history["outputs"][node_id]
+        if "images" in node_output:
+            for image in node_output["images"]:
+                url = get_image_url(
+                    image["filename"], image["subfolder"], image["type"], base_url
+                )
+                output_images.append({"url": url})
     return {"data": output_images}
 
 
@@ -106,10 +281,11 @@ async def comfyui_upload_image(image_file_item, base_url, api_key):
     form.add_field("image", file_bytes, filename=filename, content_type=mime_type)
     form.add_field("type", "input")  # required by ComfyUI
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, data=form, headers=headers) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+    async with get_session().post(
+        url, data=form, headers=headers, ssl=AIOHTTP_CLIENT_SESSION_SSL
+    ) as resp:
+        resp.raise_for_status()
+        return await resp.json()
 
 
 class ComfyUINodeInput(BaseModel):
@@ -138,9 +314,12 @@ class ComfyUICreateImageForm(BaseModel):
 
 
 async def comfyui_create_image(
-    model: str, payload: ComfyUICreateImageForm, client_id, base_url, api_key
+    model: str,
+    payload: ComfyUICreateImageForm,
+    base_url,
+    api_key,
+    event_emitter: Optional[Callable[[dict], Awaitable]] = None,
 ):
-    ws_url = base_url.replace("http://", "ws://").replace("https://", "wss://")
     workflow = json.loads(payload.workflow.workflow)
 
     for node in payload.workflow.nodes:
@@ -191,26 +370,13 @@ async def comfyui_create_image(
                 workflow[node_id]["inputs"][node.key] = node.value
 
     try:
-        ws = websocket.WebSocket()
-        headers = {"Authorization": f"Bearer {api_key}"}
-        ws.connect(f"{ws_url}/ws?clientId={client_id}", header=headers)
-        log.info("WebSocket connection established.")
-    except Exception as e:
-        log.exception(f"Failed to connect to WebSocket server: {e}")
-        return None
-
-    try:
-        log.info("Sending workflow to WebSocket server.")
+        log.info("Sending workflow to ComfyUI.")
         log.info(f"Workflow: {workflow}")
-        images = await asyncio.to_thread(
-            get_images, ws, workflow, client_id, base_url, api_key
-        )
+        images = await get_images(workflow, base_url, api_key, event_emitter)
     except Exception as e:
         log.exception(f"Error while receiving images: {e}")
         images = None
 
-    ws.close()
-
     return images
 
 
@@ -228,9 +394,12 @@ class ComfyUIEditImageForm(BaseModel):
 
 
 async def comfyui_edit_image(
-    model: str, payload: ComfyUIEditImageForm, client_id, base_url, api_key
+    model: str,
+    payload: ComfyUIEditImageForm,
+    base_url,
+    api_key,
+    event_emitter: Optional[Callable[[dict], Awaitable]] = None,
 ):
-    ws_url = base_url.replace("http://", "ws://").replace("https://", "wss://")
     workflow = json.loads(payload.workflow.workflow)
 
     for node in payload.workflow.nodes:
@@ -290,24 +459,11 @@ async def comfyui_edit_image(
                 workflow[node_id]["inputs"][node.key] = node.value
 
     try:
-        ws = websocket.WebSocket()
-        headers = {"Authorization": f"Bearer {api_key}"}
-        ws.connect(f"{ws_url}/ws?clientId={client_id}", header=headers)
-        log.info("WebSocket connection established.")
-    except Exception as e:
-        log.exception(f"Failed to connect to WebSocket server: {e}")
-        return None
-
-    try:
-        log.info("Sending workflow to WebSocket server.")
+        log.info("Sending workflow to ComfyUI.")
         log.info(f"Workflow: {workflow}")
-        images = await asyncio.to_thread(
-            get_images, ws, workflow, client_id, base_url, api_key
-        )
+        images = await get_images(workflow, base_url, api_key, event_emitter)
     except Exception as e:
         log.exception(f"Error while receiving images: {e}")
         images = None
 
-    ws.close()
-
     return images
@@ -1,14 +1,30 @@
 import asyncio
+import hashlib
+import json
+import logging
+import time
 from typing import Optional
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, contextmanager
 
 import anyio
 
-from mcp import ClientSession
+from mcp import ClientSession, types
 from mcp.client.auth import OAuthClientProvider, TokenStorage
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthToken
 
+from open_webui.env import (
+    MCP_SESSION_IDLE_TIMEOUT,
+    MCP_TOOL_SPECS_CACHE_TTL,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MAIN"])
+
+# Sessions idle for longer than this are pinged before being handed out
+MCP_SESSION_HEALTH_CHECK_INTERVAL = 30
+
 
 class MCPClient:
     def __init__(self):
@@ -113,3 +129,226 @@ class MCPClient:
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.exit_stack.__aexit__(exc_type, exc_value, traceback)
         await self.disconnect()
+
+
+class PooledMCPClient(MCPClient):
+    """
+    An MCP session kept open across requests by MCPSessionPool.
+
+    The transport and session contexts are owned by a dedicated task, as
+    anyio cancel scopes must be entered and exited from the same task.
+    Each `get_client` leases the client until the matching `disconnect`; a
+    leased client is never closed, only dropped from the pool and closed once
+    its last lease is released. Tool specs are cached for
+    MCP_TOOL_SPECS_CACHE_TTL seconds and dropped when the server sends a
+    tools/list_changed notification.
+    """
+
+    def __init__(self, key: str):
+        super().__init__()
+        self.key = key
+        self.leases = 0
+        self.evicted = False
+        self.active_calls = 0
+        self.last_used = time.monotonic()
+        self.last_checked = time.monotonic()
+
+        self.tool_specs = None
+        self.tool_specs_expires_at = 0.0
+
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+
+    @property
+    def is_leased(self) -> bool:
+        return self.leases > 0 or self.active_calls > 0
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def connect(self, url: str, headers: Optional[dict] = None):
+        self._task = asyncio.create_task(self._run(url, headers))
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self, url: str, headers: Optional[dict] = None):
+        try:
+            async with streamablehttp_client(url, headers=headers) as transport:
+                read_stream, write_stream, _ = transport
+
+                async with ClientSession(
+                    read_stream, write_stream, message_handler=self._handle_message
+                ) as session:
+                    with anyio.fail_after(10):
+                        await session.initialize()
+
+                    self.session = session
+                    self._ready.set()
+
+                    await self._closing.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                log.debug(f"MCP session {self.key[:8]} closed: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def _handle_message(self, message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            log.debug(f"MCP session {self.key[:8]} tool list changed")
+            self.tool_specs = None
+
+    @contextmanager
+    def _in_use(self):
+        self.active_calls += 1
+        try:
+            yield
+        finally:
+            self.active_calls -= 1
+            self.last_used = time.monotonic()
+
+    async def check_health(self) -> bool:
+        if not self.is_alive:
+            return False
+
+        if time.monotonic() - self.last_checked < MCP_SESSION_HEALTH_CHECK_INTERVAL:
+            return True
+
+        try:
+            with anyio.fail_after(5):
+                await self.session.send_ping()
+            self.last_checked = time.monotonic()
+            return True
+        except Exception as e:
+            log.debug(f"MCP session {self.key[:8]} failed health check: {e}")
+            return False
+
+    async def list_tool_specs(self) -> Optional[dict]:
+        if self.tool_specs is None or time.monotonic() > self.tool_specs_expires_at:
+            with self._in_use():
+                tool_specs = await super().list_tool_specs()
+
+            self.tool_specs = tool_specs
+            self.tool_specs_expires_at = time.monotonic() + MCP_TOOL_SPECS_CACHE_TTL
+
+        return self.tool_specs
+
+    async def call_tool(
+        self, function_name: str, function_args: dict
+    ) -> Optional[dict]:
+        with self._in_use():
+            return await super().call_tool(function_name, function_args)
+
+    async def list_resources(self, cursor: Optional[str] = None) -> Optional[dict]:
+        with self._in_use():
+            return await super().list_resources(cursor=cursor)
+
+    async def read_resource(self, uri: str) -> Optional[dict]:
+        with self._in_use():
+            return await super().read_resource(uri)
+
+    async def disconnect(self):
+        # Releases the lease, pooled sessions stay open until evicted
+        self.leases = max(0, self.leases - 1)
+        self.last_used = time.monotonic()
+        if self.evicted and not self.is_leased:
+            await self.close()
+
+    async def close(self):
+        self._closing.set()
+        if self._task is not None and not self._task.done():
+            try:
+                await asyncio.wait_for(self._task, timeout=5)
+            except Exception:
+                pass
+
+
+class MCPSessionPool:
+    """
+    Reuses MCP sessions across requests, keyed by server URL and request
+    headers (i.e. the auth identity). Sessions are health-checked before
+    being handed out and closed after MCP_SESSION_IDLE_TIMEOUT seconds
+    without use.
+    """
+
+    def __init__(self, idle_timeout: int = MCP_SESSION_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.clients: dict[str, PooledMCPClient] = {}
+        self.locks: dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[dict] = None) -> str:
+        return hashlib.sha256(
+            json.dumps([url, headers or {}], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    async def get_client(self, url: str, headers: Optional[dict] = None) -> MCPClient:
+        if self.idle_timeout <= 0:
+            client = MCPClient()
+            await client.connect(url=url, headers=headers)
+            return client
+
+        await self.evict_idle()
+
+        key = self.get_key(url, headers)
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            client = self.clients.get(key)
+            if client is not None and not await client.check_health():
+                await self.evict(key, client)
+                client = None
+
+            if client is None:
+                client = PooledMCPClient(key)
+                await client.connect(url=url, headers=headers)
+                self.clients[key] = client
+
+            client.leases += 1
+            client.last_used = time.monotonic()
+            return client
+
+    async def evict(self, key: str, client: PooledMCPClient):
+        """
+        Drop a client from the pool, closing it unless a request still holds
+        it, in which case it is closed when its last lease is released.
+        """
+        if self.clients.get(key) is client:
+            self.clients.pop(key, None)
+        client.evicted = True
+        if not client.is_leased:
+            await client.close()
+
+    async def evict_idle(self):
+        now = time.monotonic()
+        for key, client in list(self.clients.items()):
+            idle = not client.is_leased and (
+                now - client.last_used > self.idle_timeout
+            )
+            if idle or not client.is_alive:
+                self.locks.pop(key, None)
+                await self.evict(key, client)
+
+    async def close(self):
+        for key, client in list(self.clients.items()):
+            self.clients.pop(key, None)
+            await client.close()
+        self.locks.clear()
+
+
+MCP_SESSION_POOL = MCPSessionPool()
+
+
+async def close_mcp_sessions():
+    await MCP_SESSION_POOL.close()
@@ -40,15 +40,16 @@ from open_webui.routers.tasks import (
     generate_follow_ups,
     generate_image_prompt,
     generate_chat_tags,
+    generate_combined_tasks,
 )
 from open_webui.routers.retrieval import (
     process_web_search,
     SearchForm,
 )
 from open_webui.routers.images import (
-    image_generations,
+    generate_images,
     CreateImageForm,
-    image_edits,
+    edit_images,
     EditImageForm,
 )
 from open_webui.routers.pipelines import (
@@ -57,6 +58,10 @@ from open_webui.routers.pipelines import (
 )
 from open_webui.routers.memories import query_memory, QueryMemoryForm
 
+from open_webui.utils.queries import (
+    generate_queries_cached,
+    get_speculative_queries,
+)
 from open_webui.utils.webhook import post_webhook
 from open_webui.utils.files import (
     convert_markdown_base64_images,
@@ -77,6 +82,7 @@ from open_webui.utils.task import (
     get_task_model_id,
     rag_template,
     tools_function_calling_generation_template,
+    truncate_messages_by_tokens,
 )
 from open_webui.utils.misc import (
     deep_update,
@@ -95,12 +101,12 @@ from open_webui.utils.misc import (
 from open_webui.utils.tools import get_tools, get_updated_tool_function
 from open_webui.utils.plugin import load_function_module_by_id
 from open_webui.utils.filter import (
-    get_sorted_filter_ids,
+    get_filter_chain,
     process_filter_functions,
 )
 from open_webui.utils.code_interpreter import execute_code_jupyter
 from open_webui.utils.payload import apply_system_prompt_to_body
-from open_webui.utils.mcp.client import MCPClient
+from open_webui.utils.mcp.client import MCP_SESSION_POOL
 
 
 from open_webui.config import (
@@ -109,6 +115,7 @@ from open_webui.config import (
     DEFAULT_TOOLS_FUNCTION_CALLING_PROMPT_TEMPLATE,
     DEFAULT_CODE_INTERPRETER_PROMPT,
     CODE_INTERPRETER_BLOCKED_MODULES,
+    TASK_MESSAGES_MAX_TOKENS,
 )
 from open_webui.env import (
     SRC_LOG_LEVELS,
@@ -116,9 +123,12 @@ from open_webui.env import (
     ENABLE_CHAT_RESPONSE_BASE64_IMAGE_URL_CONVERSION,
     CHAT_RESPONSE_STREAM_DELTA_CHUNK_SIZE,
     CHAT_RESPONSE_MAX_TOOL_CALL_RETRIES,
+    CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS,
+    CHAT_RESPONSE_TOOL_CALL_TIMEOUT,
     BYPASS_MODEL_ACCESS_CONTROL,
     ENABLE_REALTIME_CHAT_SAVE,
     ENABLE_QUERIES_CACHE,
+    ENABLE_SPECULATIVE_RETRIEVAL,
 )
 from open_webui.constants import TASKS
 
@@ -586,7 +596,7 @@ async def chat_web_search_handler(
 
     queries = []
     try:
-        res = await generate_queries(
+        queries = await generate_queries_cached(
             request,
             {
                 "model": form_data["model"],
@@ -597,21 +607,6 @@ async def chat_web_search_handler(
             user,
         )
 
-        response = res["choices"][0]["message"]["content"]
-
-        try:
-            bracket_start = response.find("{")
-            bracket_end = response.rfind("}") + 1
-
-            if bracket_start == -1 or bracket_end == -1:
-                raise Exception("No JSON object found in the response")
-
-            response = response[bracket_start:bracket_end]
-            queries = json.loads(response)
-            queries = queries.get("queries", [])
-        except Exception as e:
-            queries = [response]
-
         if ENABLE_QUERIES_CACHE:
             request.state.cached_queries = queries
 
@@ -796,10 +791,11 @@ async def chat_image_generation_handler(
     if len(input_images) > 0 and request.app.state.config.ENABLE_IMAGE_EDIT:
         # Edit image(s)
         try:
-            images = await image_edits(
+            images = await edit_images(
                 request=request,
                 form_data=EditImageForm(**{"prompt": prompt, "image": input_images}),
                 user=user,
+                event_emitter=__event_emitter__,
             )
 
             await __event_emitter__(
@@ -880,10 +876,11 @@ async def chat_image_generation_handler(
                 prompt = user_message
 
         try:
-            images = await image_generations(
+            images = await generate_images(
                 request=request,
                 form_data=CreateImageForm(**{"prompt": prompt}),
                 user=user,
+                event_emitter=__event_emitter__,
             )
 
             await __event_emitter__(
@@ -949,35 +946,65 @@ async def chat_completion_files_handler(
         # Check if all files are in full context mode
         all_full_context = all(item.get("context") == "full" for item in files)
 
+        async def retrieve(queries):
+            try:
+                # Directly await async get_sources_from_items (no thread needed - fully async now)
+                return await get_sources_from_items(
+                    request=request,
+                    items=files,
+                    queries=queries,
+                    embedding_function=lambda query, prefix: request.app.state.EMBEDDING_FUNCTION(
+                        query, prefix=prefix, user=user
+                    ),
+                    k=request.app.state.config.TOP_K,
+                    reranking_function=(
+                        (
+                            lambda query, documents: request.app.state.RERANKING_FUNCTION(
+                                query, documents, user=user
+                            )
+                        )
+                        if request.app.state.RERANKING_FUNCTION
+                        else None
+                    ),
+                    k_reranker=request.app.state.config.TOP_K_RERANKER,
+                    r=request.app.state.config.RELEVANCE_THRESHOLD,
+                    hybrid_bm25_weight=request.app.state.config.HYBRID_BM25_WEIGHT,
+                    hybrid_search=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH,
+                    full_context=all_full_context
+                    or request.app.state.config.RAG_FULL_CONTEXT,
+                    user=user,
+                )
+            except Exception as e:
+                log.exception(e)
+                return []
+
+        queries_form_data = {
+            "model": body["model"],
+            "messages": body["messages"],
+            "type": "retrieval",
+        }
+
         queries = []
+        sources = None
         if not all_full_context:
-            try:
-                queries_response = await generate_queries(
+            if (
+                ENABLE_SPECULATIVE_RETRIEVAL
+                and request.app.state.config.ENABLE_RETRIEVAL_QUERY_GENERATION
+            ):
+                queries, sources = await get_speculative_queries(
                     request,
-                    {
-                        "model": body["model"],
-                        "messages": body["messages"],
-                        "type": "retrieval",
-                    },
+                    queries_form_data,
                     user,
+                    retrieve,
+                    k=request.app.state.config.TOP_K,
                 )
-                queries_response = queries_response["choices"][0]["message"]["content"]
-
+            else:
                 try:
-                    bracket_start = queries_response.find("{")
-                    bracket_end = queries_response.rfind("}") + 1
-
-                    if bracket_start == -1 or bracket_end == -1:
-                        raise Exception("No JSON object found in the response")
-
-                    queries_response = queries_response[bracket_start:bracket_end]
-                    queries_response = json.loads(queries_response)
-                except Exception as e:
-                    queries_response = {"queries": [queries_response]}
-
-                queries = queries_response.get("queries", [])
-            except:
-                pass
+                    queries = await generate_queries_cached(
+                        request, queries_form_data, user
+                    )
+                except:
+                    pass
 
             await __event_emitter__(
                 {
@@ -993,35 +1020,8 @@ async def chat_completion_files_handler(
         if len(queries) == 0:
             queries = [get_last_user_message(body["messages"])]
 
-        try:
-            # Directly await async get_sources_from_items (no thread needed - fully async now)
-            sources = await get_sources_from_items(
-                request=request,
-                items=files,
-                queries=queries,
-                embedding_function=lambda query, prefix: request.app.state.EMBEDDING_FUNCTION(
-                    query, prefix=prefix, user=user
-                ),
-                k=request.app.state.config.TOP_K,
-                reranking_function=(
-                    (
-                        lambda query, documents: request.app.state.RERANKING_FUNCTION(
-                            query, documents, user=user
-                        )
-                    )
-                    if request.app.state.RERANKING_FUNCTION
-                    else None
-                ),
-                k_reranker=request.app.state.config.TOP_K_RERANKER,
-                r=request.app.state.config.RELEVANCE_THRESHOLD,
-                hybrid_bm25_weight=request.app.state.config.HYBRID_BM25_WEIGHT,
-                hybrid_search=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH,
-                full_context=all_full_context
-                or request.app.state.config.RAG_FULL_CONTEXT,
-                user=user,
-            )
-        except Exception as e:
-            log.exception(e)
+        if sources is None:
+            sources = await retrieve(queries)
 
         log.debug(f"rag_contexts:sources: {sources}")
 
@@ -1238,12 +1238,12 @@ async def process_chat_payload(request, form_data, user, metadata, model):
         raise e
 
     try:
-        filter_functions = [
-            Functions.get_function_by_id(filter_id)
-            for filter_id in get_sorted_filter_ids(
-                request, model, metadata.get("filter_ids", [])
-            )
-        ]
+        filter_functions = get_filter_chain(
+            request,
+            model,
+            metadata.get("filter_ids", []),
+            user=extra_params.get("__user__"),
+        )
 
         form_data, flags = await process_filter_functions(
             request=request,
@@ -1403,8 +1403,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
                         for key, value in connection_headers.items():
                             headers[key] = value
 
-                    mcp_clients[server_id] = MCPClient()
-                    await mcp_clients[server_id].connect(
+                    mcp_clients[server_id] = await MCP_SESSION_POOL.get_client(
                         url=mcp_server_connection.get("url", ""),
                         headers=headers if headers else None,
                     )
@@ -1638,177 +1637,189 @@ async def process_chat_response(
 
         if message and "model" in message:
             if tasks and messages:
-                if (
-                    TASKS.FOLLOW_UP_GENERATION in tasks
-                    and tasks[TASKS.FOLLOW_UP_GENERATION]
-                ):
-                    res = await generate_follow_ups(
-                        request,
-                        {
-                            "model": message["model"],
-                            "messages": messages,
-                            "message_id": metadata["message_id"],
-                            "chat_id": metadata["chat_id"],
-                        },
-                        user,
-                    )
+                is_temp_chat = metadata.get("chat_id", "").startswith("local:")
 
-                    if res and isinstance(res, dict):
-                        if len(res.get("choices", [])) == 1:
-                            response_message = res.get("choices", [])[0].get(
-                                "message", {}
-                            )
+                # Only the most recent history within the token budget is sent
+                # to the task model
+                task_messages = truncate_messages_by_tokens(
+                    messages, TASK_MESSAGES_MAX_TOKENS
+                )
+                task_form_data = {
+                    "model": message["model"],
+                    "messages": task_messages,
+                    "message_id": metadata["message_id"],
+                    "chat_id": metadata["chat_id"],
+                }
 
-                            follow_ups_string = response_message.get(
-                                "content"
-                            ) or response_message.get("reasoning_content", "")
-                        else:
-                            follow_ups_string = ""
+                def get_response_json(res) -> Optional[dict]:
+                    if not res or not isinstance(res, dict):
+                        return None
 
-                        follow_ups_string = follow_ups_string[
-                            follow_ups_string.find("{") : follow_ups_string.rfind("}")
-                            + 1
-                        ]
+                    if len(res.get("choices", [])) == 1:
+                        response_message = res.get("choices", [])[0].get(
+                            "message", {}
+                        )
+                        response_string = response_message.get(
+                            "content"
+                        ) or response_message.get("reasoning_content", "")
+                    else:
+                        response_string = ""
 
-                        try:
-                            follow_ups = json.loads(follow_ups_string).get(
-                                "follow_ups", []
-                            )
-                            await event_emitter(
-                                {
-                                    "type": "chat:message:follow_ups",
-                                    "data": {
-                                        "follow_ups": follow_ups,
-                                    },
-                                }
-                            )
+                    response_string = response_string[
+                        response_string.find("{") : response_string.rfind("}") + 1
+                    ]
 
-                            if not metadata.get("chat_id", "").startswith("local:"):
-                                Chats.upsert_message_to_chat_by_id_and_message_id(
-                                    metadata["chat_id"],
-                                    metadata["message_id"],
-                                    {
-                                        "followUps": follow_ups,
-                                    },
-                                )
+                    try:
+                        return json.loads(response_string)
+                    except Exception as e:
+                        return {}
 
-                        except Exception as e:
-                            pass
+                async def follow_ups_task(combined_result=None):
+                    if combined_result is not None:
+                        data = combined_result
+                    else:
+                        res = await generate_follow_ups(request, task_form_data, user)
+                        data = get_response_json(res)
 
-                if not metadata.get("chat_id", "").startswith(
-                    "local:"
-                ):  # Only update titles and tags for non-temp chats
-                    if TASKS.TITLE_GENERATION in tasks:
-                        user_message = get_last_user_message(messages)
-                        if user_message and len(user_message) > 100:
-                            user_message = user_message[:100] + "..."
+                    if not data:
+                        return
 
-                        title = None
-                        if tasks[TASKS.TITLE_GENERATION]:
-                            res = await generate_title(
-                                request,
+                    try:
+                        follow_ups = data.get("follow_ups", [])
+                        await event_emitter(
+                            {
+                                "type": "chat:message:follow_ups",
+                                "data": {
+                                    "follow_ups": follow_ups,
+                                },
+                            }
+                        )
+
+                        if not is_temp_chat:
+                            Chats.upsert_message_to_chat_by_id_and_message_id(
+                                metadata["chat_id"],
+                                metadata["message_id"],
                                 {
-                                    "model": message["model"],
-                                    "messages": messages,
-                                    "chat_id": metadata["chat_id"],
+                                    "followUps": follow_ups,
                                 },
-                                user,
                             )
 
-                            if res and isinstance(res, dict):
-                                if len(res.get("choices", [])) == 1:
-                                    response_message = res.get("choices", [])[0].get(
-                                        "message", {}
-                                    )
-
-                                    title_string = (
-                                        response_message.get("content")
-                                        or response_message.get(
-                                            "reasoning_content",
-                                        )
-                                        or message.get("content", user_message)
-                                    )
-                                else:
-                                    title_string = ""
-
-                                title_string = title_string[
-                                    title_string.find("{") : title_string.rfind("}") + 1
-                                ]
-
-                                try:
-                                    title = json.loads(title_string).get(
-                                        "title", user_message
-                                    )
-                                except Exception as e:
-                                    title = ""
+                    except Exception as e:
+                        pass
 
-                                if not title:
-                                    title = messages[0].get("content", user_message)
+                async def title_task(combined_result=None):
+                    user_message = get_last_user_message(messages)
+                    if user_message and len(user_message) > 100:
+                        user_message = user_message[:100] + "..."
 
-                                Chats.update_chat_title_by_id(
-                                    metadata["chat_id"], title
-                                )
+                    title = None
+                    if tasks[TASKS.TITLE_GENERATION]:
+                        if combined_result is not None:
+                            data = combined_result
+                        else:
+                            res = await generate_title(request, task_form_data, user)
+                            data = get_response_json(res)
 
-                                await event_emitter(
-                                    {
-                                        "type": "chat:title",
-                                        "data": title,
-                                    }
-                                )
+                        if data is not None:
+                            title = data.get("title", user_message) if data else ""
 
-                        if title == None and len(messages) == 2:
-                            title = messages[0].get("content", user_message)
+                            if not title:
+                                title = messages[0].get("content", user_message)
 
                             Chats.update_chat_title_by_id(metadata["chat_id"], title)
 
                             await event_emitter(
                                 {
                                     "type": "chat:title",
-                                    "data": message.get("content", user_message),
+                                    "data": title,
                                 }
                             )
 
-                    if TASKS.TAGS_GENERATION in tasks and tasks[TASKS.TAGS_GENERATION]:
-                        res = await generate_chat_tags(
-                            request,
+                    if title == None and len(messages) == 2:
+                        title = messages[0].get("content", user_message)
+
+                        Chats.update_chat_title_by_id(metadata["chat_id"], title)
+
+                        await event_emitter(
                             {
-                                "model": message["model"],
-                                "messages": messages,
-                                "chat_id": metadata["chat_id"],
-                            },
-                            user,
+                                "type": "chat:title",
+                                "data": message.get("content", user_message),
+                            }
                         )
 
-                        if res and isinstance(res, dict):
-                            if len(res.get("choices", [])) == 1:
-                                response_message = res.get("choices", [])[0].get(
-                                    "message", {}
-                                )
+                async def tags_task(combined_result=None):
+                    if combined_result is not None:
+                        data = combined_result
+                    else:
+                        res = await generate_chat_tags(request, task_form_data, user)
+                        data = get_response_json(res)
 
-                                tags_string = response_message.get(
-                                    "content"
-                                ) or response_message.get("reasoning_content", "")
-                            else:
-                                tags_string = ""
+                    if not data:
+                        return
 
-                            tags_string = tags_string[
-                                tags_string.find("{") : tags_string.rfind("}") + 1
-                            ]
+                    try:
+                        tags = data.get("tags", [])
+                        Chats.update_chat_tags_by_id(metadata["chat_id"], tags, user)
 
-                            try:
-                                tags = json.loads(tags_string).get("tags", [])
-                                Chats.update_chat_tags_by_id(
-                                    metadata["chat_id"], tags, user
-                                )
+                        await event_emitter(
+                            {
+                                "type": "chat:tags",
+                                "data": tags,
+                            }
+                        )
+                    except Exception as e:
+                        pass
 
-                                await event_emitter(
-                                    {
-                                        "type": "chat:tags",
-                                        "data": tags,
-                                    }
-                                )
-                            except Exception as e:
-                                pass
+                # (task key in the combined response, handler)
+                task_handlers = []
+                if (
+                    TASKS.FOLLOW_UP_GENERATION in tasks
+                    and tasks[TASKS.FOLLOW_UP_GENERATION]
+                ):
+                    task_handlers.append(("follow_ups", follow_ups_task))
+
+                # Only update titles and tags for non-temp chats
+                if not is_temp_chat:
+                    if TASKS.TITLE_GENERATION in tasks:
+                        task_handlers.append(
+                            (
+                                "title" if tasks[TASKS.TITLE_GENERATION] else None,
+                                title_task,
+                            )
+                        )
+
+                    if TASKS.TAGS_GENERATION in tasks and tasks[TASKS.TAGS_GENERATION]:
+                        task_handlers.append(("tags", tags_task))
+
+                combined_keys = [key for key, _ in task_handlers if key]
+                combined_result = {}
+                if (
+                    request.app.state.config.ENABLE_COMBINED_TASK_GENERATION
+                    and len(combined_keys) > 1
+                ):
+                    try:
+                        res = await generate_combined_tasks(
+                            request,
+                            {**task_form_data, "tasks": combined_keys},
+                            user,
+                        )
+                        combined_result = get_response_json(res) or {}
+                    except Exception as e:
+                        log.debug(f"Combined task generation failed: {e}")
+
+                # Tasks missing from the combined response fall back to their own
+                # completion; all remaining work runs concurrently.
+                await asyncio.gather(
+                    *[
+                        handler(
+                            {key: combined_result[key]}
+                            if key and key in combined_result
+                            else None
+                        )
+                        for key, handler in task_handlers
+                    ],
+                    return_exceptions=True,
+                )
 
     event_emitter = None
     event_caller = None
@@ -2000,12 +2011,12 @@ async def process_chat_response(
         "__request__": request,
         "__model__": model,
     }
-    filter_functions = [
-        Functions.get_function_by_id(filter_id)
-        for filter_id in get_sorted_filter_ids(
-            request, model, metadata.get("filter_ids", [])
-        )
-    ]
+    filter_functions = get_filter_chain(
+        request,
+        model,
+        metadata.get("filter_ids", []),
+        user=extra_params.get("__user__"),
+    )
 
     # Streaming response
     if event_emitter and event_caller:
@@ -2817,6 +2828,9 @@ async def process_chat_response(
                 await stream_body_handler(response, form_data)
 
                 tool_call_retries = 0
+                tool_call_semaphore = asyncio.Semaphore(
+                    CHAT_RESPONSE_MAX_CONCURRENT_TOOL_CALLS
+                )
 
                 while (
                     len(tool_calls) > 0
@@ -2845,9 +2859,7 @@ async def process_chat_response(
 
                     tools = metadata.get("tools", {})
 
-                    results = []
-
-                    for tool_call in response_tool_calls:
+                    async def execute_tool_call(tool_call):
                         tool_call_id = tool_call.get("id", "")
                         tool_function_name = tool_call.get("function", {}).get(
                             "name", ""
@@ -2906,19 +2918,22 @@ async def process_chat_response(
                                 }
 
                                 if direct_tool:
-                                    tool_result = await event_caller(
-                                        {
-                                            "type": "execute:tool",
-                                            "data": {
-                                                "id": str(uuid4()),
-                                                "name": tool_function_name,
-                                                "params": tool_function_params,
-                                                "server": tool.get("server", {}),
-                                                "session_id": metadata.get(
-                                                    "session_id", None
-                                                ),
-                                            },
-                                        }
+                                    tool_result = await asyncio.wait_for(
+                                        event_caller(
+                                            {
+                                                "type": "execute:tool",
+                                                "data": {
+                                                    "id": str(uuid4()),
+                                                    "name": tool_function_name,
+                                                    "params": tool_function_params,
+                                                    "server": tool.get("server", {}),
+                                                    "session_id": metadata.get(
+                                                        "session_id", None
+                                                    ),
+                                                },
+                                            }
+                                        ),
+                                        timeout=CHAT_RESPONSE_TOOL_CALL_TIMEOUT,
                                     )
 
                                 else:
@@ -2932,10 +2947,16 @@ async def process_chat_response(
                                         },
                                     )
 
-                                    tool_result = await tool_function(
-                                        **tool_function_params
+                                    tool_result = await asyncio.wait_for(
+                                        tool_function(**tool_function_params),
+                                        timeout=CHAT_RESPONSE_TOOL_CALL_TIMEOUT,
                                     )
 
+                            except asyncio.TimeoutError:
+                                log.warning(
+                                    f"Tool call {tool_function_name} timed out after {CHAT_RESPONSE_TOOL_CALL_TIMEOUT}s"
+                                )
+                                tool_result = f"Tool call timed out after {CHAT_RESPONSE_TOOL_CALL_TIMEOUT} seconds"
                             except Exception as e:
                                 tool_result = str(e)
 
@@ -2951,24 +2972,52 @@ async def process_chat_response(
                             )
                         )
 
-                        results.append(
-                            {
-                                "tool_call_id": tool_call_id,
-                                "content": tool_result or "",
-                                **(
-                                    {"files": tool_result_files}
-                                    if tool_result_files
-                                    else {}
-                                ),
-                                **(
-                                    {"embeds": tool_result_embeds}
-                                    if tool_result_embeds
-                                    else {}
-                                ),
-                            }
-                        )
+                        return {
+                            "tool_call_id": tool_call_id,
+                            "content": tool_result or "",
+                            **(
+                                {"files": tool_result_files}
+                                if tool_result_files
+                                else {}
+                            ),
+                            **(
+                                {"embeds": tool_result_embeds}
+                                if tool_result_embeds
+                                else {}
+                            ),
+                        }
+
+                    tool_calls_block = content_blocks[-1]
+                    results = [None] * len(response_tool_calls)
+
+                    async def run_tool_call(idx, tool_call):
+                        async with tool_call_semaphore:
+                            results[idx] = await execute_tool_call(tool_call)
+
+                        if len(results) > 1:
+                            # Stream each result as soon as it is available
+                            tool_calls_block["results"] = [
+                                result for result in results if result is not None
+                            ]
+                            await event_emitter(
+                                {
+                                    "type": "chat:completion",
+                                    "data": {
+                                        "content": serialize_content_blocks(
+                                            content_blocks
+                                        ),
+                                    },
+                                }
+                            )
+
+                    await asyncio.gather(
+                        *[
+                            run_tool_call(idx, tool_call)
+                            for idx, tool_call in enumerate(response_tool_calls)
+                        ]
+                    )
 
-                    content_blocks[-1]["results"] = results
+                    tool_calls_block["results"] = results
                     content_blocks.append(
                         {
                             "type": "text",
@@ -10,6 +10,8 @@ import logging
 from open_webui.env import SRC_LOG_LEVELS, PIP_OPTIONS, PIP_PACKAGE_INDEX_OPTIONS
 from open_webui.models.functions import Functions
 from open_webui.models.tools import Tools
+from open_webui.utils.executor import register_plugin_source
+from open_webui.utils.readiness import READINESS
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
@@ -104,7 +106,9 @@ def load_tool_module_by_id(tool_id, content=None):
 
         # Create and return the object if the class 'Tools' is found in the module
         if hasattr(module, "Tools"):
-            return module.Tools(), frontmatter
+            tools = module.Tools()
+            register_plugin_source(tools, module_name, content)
+            return tools, frontmatter
         else:
             raise Exception("No Tools class found in the module")
     except Exception as e:
@@ -148,19 +152,24 @@ def load_function_module_by_id(function_id: str, content: str | None = None):
 
         # Create appropriate object based on available class type in the module
         if hasattr(module, "Pipe"):
-            return module.Pipe(), "pipe", frontmatter
+            function_module, function_type = module.Pipe(), "pipe"
         elif hasattr(module, "Filter"):
-            return module.Filter(), "filter", frontmatter
+            function_module, function_type = module.Filter(), "filter"
         elif hasattr(module, "Action"):
-            return module.Action(), "action", frontmatter
+            function_module, function_type = module.Action(), "action"
         else:
             raise Exception("No Function class found in the module")
+
+        register_plugin_source(function_module, module_name, content)
+        return function_module, function_type, frontmatter
     except Exception as e:
         log.error(f"Error loading module: {function_id}: {e}")
         # Cleanup by removing the module in case of error
         del sys.modules[module_name]
 
-        Functions.update_function_by_id(function_id, {"is_active": False})
+        # Its requirements may just not be installed yet (background warm-up)
+        if not READINESS.is_pending("function_dependencies"):
+            Functions.update_function_by_id(function_id, {"is_active": False})
         raise e
     finally:
         os.unlink(temp_file.name)
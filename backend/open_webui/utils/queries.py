@@ -0,0 +1,300 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request
+
+from open_webui.config import DEFAULT_QUERY_GENERATION_PROMPT_TEMPLATE
+from open_webui.env import (
+    QUERIES_CACHE_HISTORY_SIZE,
+    QUERIES_CACHE_MAX_SIZE,
+    QUERIES_CACHE_TTL,
+    SRC_LOG_LEVELS,
+)
+from open_webui.routers.tasks import generate_queries
+from open_webui.utils.misc import get_last_user_message
+from open_webui.utils.task import prompt_template
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+class QueriesCache:
+    """
+    In-process TTL/LRU cache of generated search & retrieval queries.
+
+    Concurrent lookups for the same key share a single in-flight generation,
+    so a regeneration racing the original request does not pay for a second
+    task-model call.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+        self.pending: dict[str, asyncio.Future] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, key: str) -> Optional[list[str]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, queries = entry
+        if expires_at < time.monotonic():
+            self.entries.pop(key, None)
+            return None
+
+        self.entries.move_to_end(key)
+        return queries
+
+    def set(self, key: str, queries: list[str]):
+        self.entries[key] = (time.monotonic() + self.ttl, queries)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def get_or_generate(self, key: str, generate) -> list[str]:
+        if not self.enabled:
+            return await generate()
+
+        if (queries := self.get(key)) is not None:
+            log.debug(f"Reusing cached queries: {queries}")
+            return queries
+
+        if key in self.pending:
+            leader = self.pending[key]
+            try:
+                return await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+                # The leader was cancelled, not us: generate in its place
+                return await self.get_or_generate(key, generate)
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        try:
+            queries = await generate()
+            if queries:
+                self.set(key, queries)
+            future.set_result(queries)
+            return queries
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting on it
+            future.exception()
+            raise
+        finally:
+            # e.g. the leader was cancelled; release the callers waiting on it
+            if not future.done():
+                future.cancel()
+            self.pending.pop(key, None)
+
+
+QUERIES_CACHE = QueriesCache(QUERIES_CACHE_MAX_SIZE, QUERIES_CACHE_TTL)
+
+
+def normalize_message_content(content) -> str:
+    if isinstance(content, list):
+        content = " ".join(
+            item.get("text", "")
+            for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        )
+    if not isinstance(content, str):
+        return ""
+
+    content = re.sub(
+        r"<details\b[^>]*>.*?<\/details>|!\[.*?\]\(.*?\)",
+        "",
+        content,
+        flags=re.S | re.I,
+    )
+    return " ".join(content.lower().split())
+
+
+def get_queries_cache_key(request: Request, form_data: dict, user=None) -> str:
+    """
+    Key on the task model, the query type, the prompt template and the
+    normalized recent history, so edits change the key but regenerations and
+    identical follow-ups do not. The template is keyed with its user and date
+    variables rendered, so users with different details do not share queries.
+    """
+    template = request.app.state.config.QUERY_GENERATION_PROMPT_TEMPLATE
+    if template.strip() == "":
+        template = DEFAULT_QUERY_GENERATION_PROMPT_TEMPLATE
+
+    messages = form_data.get("messages", [])[-QUERIES_CACHE_HISTORY_SIZE:]
+    payload = {
+        "model": form_data.get("model"),
+        "type": form_data.get("type"),
+        "task_model": request.app.state.config.TASK_MODEL,
+        "task_model_external": request.app.state.config.TASK_MODEL_EXTERNAL,
+        "template": prompt_template(template, user),
+        "messages": [
+            (
+                message.get("role", "user"),
+                normalize_message_content(message.get("content", "")),
+            )
+            for message in messages
+        ],
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def parse_queries_response(res) -> list[str]:
+    if isinstance(res, list):
+        # Already parsed (e.g. ENABLE_QUERIES_CACHE reuse within a request)
+        return res
+
+    response = res["choices"][0]["message"]["content"]
+
+    try:
+        bracket_start = response.find("{")
+        bracket_end = response.rfind("}") + 1
+
+        if bracket_start == -1 or bracket_end == -1:
+            raise Exception("No JSON object found in the response")
+
+        response = response[bracket_start:bracket_end]
+        return json.loads(response).get("queries", [])
+    except Exception as e:
+        return [response]
+
+
+async def generate_queries_cached(request: Request, form_data: dict, user) -> list[str]:
+    """
+    Generate search/retrieval queries for the given history, reusing a recent
+    result for the same normalized history when available.
+    """
+
+    async def generate():
+        res = await generate_queries(request, form_data, user)
+        return parse_queries_response(res)
+
+    return await QUERIES_CACHE.get_or_generate(
+        get_queries_cache_key(request, form_data, user), generate
+    )
+
+
+def merge_sources(sources: list[dict], other_sources: list[dict], k: int) -> list[dict]:
+    """
+    Merge two `get_sources_from_items` results, combining documents retrieved
+    for the same source and dropping duplicate chunks. Each merged source
+    keeps its `k` best chunks, or all of them if it already had more (e.g.
+    full context sources).
+    """
+
+    def get_source_key(source: dict) -> str:
+        item = source.get("source") or {}
+        return str(
+            item.get("id")
+            or item.get("collection_name")
+            or item.get("collection_names")
+            or item.get("name")
+            or id(item)
+        )
+
+    merged = {}
+    limits = {}
+    for source in [*sources, *other_sources]:
+        if not source:
+            continue
+
+        key = get_source_key(source)
+        if key not in merged:
+            limits[key] = max(k, len(source.get("document") or []))
+            merged[key] = {
+                **source,
+                "document": list(source.get("document") or []),
+                "metadata": list(source.get("metadata") or []),
+                **(
+                    {"distances": list(source["distances"])}
+                    if "distances" in source
+                    else {}
+                ),
+            }
+            continue
+
+        target = merged[key]
+        seen = set(target["document"])
+        for idx, document in enumerate(source.get("document") or []):
+            if document in seen:
+                continue
+            seen.add(document)
+
+            target["document"].append(document)
+            metadatas = source.get("metadata") or []
+            target["metadata"].append(metadatas[idx] if idx < len(metadatas) else {})
+            if "distances" in target:
+                distances = source.get("distances") or []
+                target["distances"].append(
+                    distances[idx] if idx < len(distances) else 0.0
+                )
+
+    for key, target in merged.items():
+        if len(target["document"]) <= limits[key]:
+            continue
+
+        indices = range(len(target["document"]))
+        if "distances" in target:
+            indices = sorted(
+                indices, key=lambda idx: target["distances"][idx], reverse=True
+            )
+        indices = indices[: limits[key]]
+
+        for field in ("document", "metadata", "distances"):
+            if field in target:
+                target[field] = [target[field][idx] for idx in indices]
+
+    return list(merged.values())
+
+
+async def get_speculative_queries(
+    request: Request, form_data: dict, user, retrieve, k: int
+) -> tuple[list[str], list[dict]]:
+    """
+    Start retrieval with the raw user message while queries are being
+    generated, then retrieve for any new generated queries and merge the
+    results, keeping at most `k` chunks per source. `retrieve` is an async
+    callable taking a list of queries.
+    """
+    user_message = get_last_user_message(form_data["messages"])
+
+    generation_task = asyncio.create_task(
+        generate_queries_cached(request, form_data, user)
+    )
+    raw_sources = await retrieve([user_message])
+
+    try:
+        queries = await generation_task
+    except Exception as e:
+        log.debug(f"Query generation failed, using raw message: {e}")
+        queries = []
+
+    normalized_message = " ".join(user_message.lower().split())
+    new_queries = [
+        query
+        for query in queries
+        if isinstance(query, str)
+        and query.strip()
+        and " ".join(query.lower().split()) != normalized_message
+    ]
+
+    if not new_queries:
+        return [user_message], raw_sources
+
+    return [user_message, *new_queries], merge_sources(
+        raw_sources, await retrieve(new_queries), k
+    )
@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MAIN"])
+
+
+class Component:
+    def __init__(self, name: str):
+        self.name = name
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.event = threading.Event()
+
+    def model_dump(self) -> dict:
+        return {
+            "status": self.status,
+            "error": self.error,
+            "duration": (
+                round(self.finished_at - self.started_at, 3)
+                if self.started_at and self.finished_at
+                else None
+            ),
+        }
+
+
+class Readiness:
+    """
+    Tracks the warm-up of startup components (local models, function
+    dependencies, the model list) so the app can serve traffic while they load
+    and report per-component readiness.
+    """
+
+    def __init__(self):
+        self.components: dict[str, Component] = {}
+
+    def register(self, name: str) -> Component:
+        if name not in self.components:
+            self.components[name] = Component(name)
+        return self.components[name]
+
+    def start(self, name: str):
+        component = self.register(name)
+        component.status = "loading"
+        component.error = None
+        component.started_at = time.monotonic()
+        component.finished_at = None
+        component.event.clear()
+
+    def set_ready(self, name: str):
+        component = self.register(name)
+        component.status = "ready"
+        component.finished_at = time.monotonic()
+        component.event.set()
+
+    def set_failed(self, name: str, error: Exception):
+        component = self.register(name)
+        component.status = "failed"
+        component.error = str(error)
+        component.finished_at = time.monotonic()
+        component.event.set()
+
+    def run(self, name: str, func: Callable, *args, **kwargs):
+        self.start(name)
+        try:
+            result = func(*args, **kwargs)
+            self.set_ready(name)
+            return result
+        except Exception as e:
+            log.exception(f"Failed to warm up {name}: {e}")
+            self.set_failed(name, e)
+
+    def run_in_background(
+        self, name: str, func: Callable, *args, **kwargs
+    ) -> threading.Thread:
+        self.register(name)
+        thread = threading.Thread(
+            target=self.run,
+            args=(name, func, *args),
+            kwargs=kwargs,
+            name=f"warmup-{name}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Block until the component has finished loading (or failed)."""
+        component = self.components.get(name)
+        if component is None:
+            return True
+        return component.event.wait(timeout)
+
+    def is_pending(self, name: str) -> bool:
+        """Whether the component is registered and has not finished loading."""
+        component = self.components.get(name)
+        return component is not None and not component.event.is_set()
+
+    def is_ready(self) -> bool:
+        return all(
+            component.status in ("ready", "failed")
+            for component in self.components.values()
+        )
+
+    def model_dump(self) -> dict:
+        return {
+            name: component.model_dump()
+            for name, component in self.components.items()
+        }
+
+
+READINESS = Readiness()
@@ -4,6 +4,7 @@ import re
 from datetime import datetime
 from typing import Optional, Any
 import uuid
+from functools import lru_cache
 
 
 from open_webui.utils.misc import get_last_user_message, get_messages_content
@@ -16,6 +17,61 @@ log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["RAG"])
 
 
+@lru_cache(maxsize=1)
+def get_task_token_encoder():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        log.debug(f"tiktoken unavailable, estimating token counts: {e}")
+        return None
+
+
+def count_task_tokens(text: str) -> int:
+    encoder = get_task_token_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    return len(text) // 4
+
+
+def truncate_messages_by_tokens(messages: list[dict], max_tokens: int) -> list[dict]:
+    """
+    Keep the most recent messages whose combined content fits in max_tokens.
+    The newest message is always kept; if it alone exceeds the budget, its
+    content is middle-truncated to fit.
+    """
+    if not max_tokens or max_tokens <= 0:
+        return messages
+
+    kept = []
+    total = 0
+    for message in reversed(messages):
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(
+                item.get("text", "")
+                for item in content
+                if isinstance(item, dict) and item.get("type") == "text"
+            )
+        if not isinstance(content, str):
+            content = str(content)
+
+        tokens = count_task_tokens(content)
+        if total + tokens > max_tokens:
+            if not kept and content:
+                keep_chars = max(int(len(content) * max_tokens / tokens), 1)
+                start = content[: math.ceil(keep_chars / 2)]
+                end = content[-math.floor(keep_chars / 2) :] if keep_chars > 1 else ""
+                kept.append({**message, "content": f"{start}...{end}"})
+            break
+
+        kept.append(message)
+        total += tokens
+
+    return list(reversed(kept))
+
+
 def get_task_model_id(
     default_model_id: str, task_model: str, task_model_external: str, models
 ) -> str:
@@ -262,6 +318,47 @@ def tags_generation_template(
     return template
 
 
+COMBINED_TASK_DESCRIPTIONS = {
+    "title": '"title": a concise, 3-5 word title with an emoji summarizing the chat history.',
+    "tags": '"tags": 1-3 broad tags categorizing the main themes of the chat history, along with 1-3 more specific subtopic tags. If the content is too short or too diverse, use only ["General"].',
+    "follow_ups": '"follow_ups": 3-5 relevant follow-up questions the user might naturally ask next, written from the user\'s point of view and directed to the assistant.',
+}
+
+
+def combined_generation_template(
+    template: str,
+    messages: list[dict],
+    tasks: list[str],
+    user: Optional[Any] = None,
+) -> str:
+    task_descriptions = "\n".join(
+        f"- {COMBINED_TASK_DESCRIPTIONS[task]}"
+        for task in tasks
+        if task in COMBINED_TASK_DESCRIPTIONS
+    )
+    template = template.replace("{{TASKS}}", task_descriptions)
+
+    prompt = get_last_user_message(messages)
+    template = replace_prompt_variable(template, prompt)
+    template = replace_messages_variable(template, messages)
+
+    template = prompt_template(template, user)
+    return template
+
+
+def get_combined_generation_schema(tasks: list[str]) -> dict:
+    properties = {
+        "title": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "follow_ups": {"type": "array", "items": {"type": "string"}},
+    }
+    return {
+        "type": "object",
+        "properties": {task: properties[task] for task in tasks if task in properties},
+        "required": [task for task in tasks if task in properties],
+    }
+
+
 def image_prompt_generation_template(
     template: str, messages: list[dict], user: Optional[Any] = None
 ) -> str:
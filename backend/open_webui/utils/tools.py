@@ -4,6 +4,8 @@ import re
 import inspect
 import aiohttp
 import asyncio
+import hashlib
+import time
 import yaml
 import json
 
@@ -38,11 +40,13 @@ from open_webui.utils.misc import is_string_allowed
 from open_webui.models.tools import Tools
 from open_webui.models.users import UserModel
 from open_webui.utils.plugin import load_tool_module_by_id
+from open_webui.utils.executor import run_sync_handler
 from open_webui.env import (
     SRC_LOG_LEVELS,
     AIOHTTP_CLIENT_TIMEOUT,
     AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA,
     AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
+    TOOL_SERVER_SPEC_CACHE_TTL,
 )
 
 import copy
@@ -79,9 +83,12 @@ def get_async_tool_function_and_apply_extra_params(
             return await partial_func(*args, **kwargs)
 
     else:
-        # Make it a coroutine function when it is not already
-        async def new_function(*args, **kwargs):
-            return partial_func(*args, **kwargs)
+        # Make it a coroutine function when it is not already, running it
+        # off the event loop according to the plugin's execution policy
+        async def new_function(**kwargs):
+            return await run_sync_handler(
+                partial_func, plugin_id=extra_params.get("__id__"), **kwargs
+            )
 
     update_wrapper(new_function, function)
     new_function.__signature__ = new_sig
@@ -558,35 +565,222 @@ def convert_openapi_to_tool_payload(openapi_spec):
     return tool_payload
 
 
-async def set_tool_servers(request: Request):
-    request.app.state.TOOL_SERVERS = await get_tool_servers_data(
-        request.app.state.config.TOOL_SERVER_CONNECTIONS
-    )
+# Per-server cache of fetched and converted OpenAPI specs, keyed by a hash of
+# the server connection so edits to one connection only refetch that server.
+TOOL_SERVER_SPEC_CACHE: dict[str, dict] = {}
+TOOL_SERVER_REFRESH_TASKS: dict[str, asyncio.Task] = {}
 
-    if request.app.state.redis is not None:
-        await request.app.state.redis.set(
-            "tool_servers", json.dumps(request.app.state.TOOL_SERVERS)
-        )
 
-    return request.app.state.TOOL_SERVERS
+def get_tool_server_cache_key(idx: int, server: dict) -> str:
+    return hashlib.sha256(
+        json.dumps([idx, server], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
 
 
-async def get_tool_servers(request: Request):
-    tool_servers = []
-    if request.app.state.redis is not None:
+def get_tool_server_source(idx: int, server: dict) -> Optional[dict]:
+    """
+    Resolve where an enabled OpenAPI tool server's spec comes from, or None if
+    the server is disabled, not OpenAPI or has no usable spec.
+    """
+    if not (
+        server.get("config", {}).get("enable")
+        and server.get("type", "openapi") == "openapi"
+    ):
+        return None
+
+    info = server.get("info", {})
+
+    auth_type = server.get("auth_type", "bearer")
+    token = None
+
+    if auth_type == "bearer":
+        token = server.get("key", "")
+    elif auth_type == "none":
+        # No authentication
+        pass
+
+    id = info.get("id")
+    if not id:
+        id = str(idx)
+
+    source = {
+        "id": id,
+        "idx": idx,
+        "server": server,
+        "url": server.get("url"),
+        "info": info,
+        "spec_url": None,
+        "headers": None,
+        "spec": None,
+    }
+
+    spec_type = server.get("spec_type", "url")
+    if spec_type == "url":
+        # Path (to OpenAPI spec URL) can be either a full URL or a path to append to the base URL
+        openapi_path = server.get("path", "openapi.json")
+        source["spec_url"] = get_tool_server_url(server.get("url"), openapi_path)
+        source["headers"] = {"Authorization": f"Bearer {token}"} if token else None
+    elif spec_type == "json" and server.get("spec", ""):
+        # Use provided JSON spec
         try:
-            tool_servers = json.loads(await request.app.state.redis.get("tool_servers"))
-            request.app.state.TOOL_SERVERS = tool_servers
+            source["spec"] = json.loads(server.get("spec", ""))
         except Exception as e:
-            log.error(f"Error fetching tool_servers from Redis: {e}")
+            log.error(f"Error parsing JSON spec for tool server {id}: {e}")
 
-    if not tool_servers:
-        tool_servers = await set_tool_servers(request)
+        if not source["spec"]:
+            return None
+    else:
+        return None
 
-    return tool_servers
+    return source
 
 
-async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, Any]:
+def build_tool_server_data(source: dict, openapi_data: dict) -> dict:
+    specs = convert_openapi_to_tool_payload(openapi_data)
+    openapi_info = openapi_data.get("info", {})
+
+    info = source["info"]
+    if info and isinstance(openapi_data, dict):
+        openapi_data["info"] = openapi_data.get("info", {})
+
+        if "name" in info:
+            openapi_data["info"]["title"] = info.get("name", "Tool Server")
+
+        if "description" in info:
+            openapi_data["info"]["description"] = info.get("description", "")
+
+    return {
+        "id": str(source["id"]),
+        "idx": source["idx"],
+        "url": source["server"].get("url"),
+        "openapi": openapi_data,
+        "info": openapi_info,
+        "specs": specs,
+    }
+
+
+async def fetch_tool_server_source(
+    source: dict, etag: Optional[str] = None, last_modified: Optional[str] = None
+) -> tuple[Optional[dict], Optional[str], Optional[str]]:
+    if source["spec_url"] is None:
+        return copy.deepcopy(source["spec"]), None, None
+
+    return await fetch_tool_server_spec(
+        source["spec_url"],
+        source["headers"],
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+async def refresh_tool_server_cache_entry(key: str):
+    entry = TOOL_SERVER_SPEC_CACHE.get(key)
+    if entry is None:
+        return
+
+    try:
+        openapi_data, etag, last_modified = await fetch_tool_server_source(
+            entry["source"], etag=entry["etag"], last_modified=entry["last_modified"]
+        )
+
+        if openapi_data is not None:
+            entry["data"] = build_tool_server_data(entry["source"], openapi_data)
+            entry["etag"] = etag
+            entry["last_modified"] = last_modified
+            log.debug(f"Refreshed tool server spec {entry['source']['id']}")
+    except Exception as e:
+        log.warning(
+            f"Failed to refresh tool server spec {entry['source']['id']}, serving cached: {e}"
+        )
+    finally:
+        entry["fetched_at"] = time.monotonic()
+        TOOL_SERVER_REFRESH_TASKS.pop(key, None)
+
+
+async def get_cached_tool_servers_data(
+    servers: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Like get_tool_servers_data, but served from TOOL_SERVER_SPEC_CACHE. Missing
+    servers are fetched, stale ones are revalidated in the background with
+    ETag / If-Modified-Since, and entries for removed or edited connections
+    are dropped.
+    """
+    keys = []
+    missing = []
+    for idx, server in enumerate(servers):
+        source = get_tool_server_source(idx, server)
+        if source is None:
+            continue
+
+        key = get_tool_server_cache_key(idx, server)
+        keys.append(key)
+
+        entry = TOOL_SERVER_SPEC_CACHE.get(key)
+        if entry is None:
+            missing.append((key, source))
+        elif (
+            time.monotonic() - entry["fetched_at"] > TOOL_SERVER_SPEC_CACHE_TTL
+            and key not in TOOL_SERVER_REFRESH_TASKS
+        ):
+            TOOL_SERVER_REFRESH_TASKS[key] = asyncio.create_task(
+                refresh_tool_server_cache_entry(key)
+            )
+
+    for key in list(TOOL_SERVER_SPEC_CACHE.keys()):
+        if key not in keys:
+            del TOOL_SERVER_SPEC_CACHE[key]
+
+    responses = await asyncio.gather(
+        *[fetch_tool_server_source(source) for _, source in missing],
+        return_exceptions=True,
+    )
+    for (key, source), response in zip(missing, responses):
+        if isinstance(response, Exception):
+            log.error(f"Failed to connect to {source['url']} OpenAPI tool server")
+            continue
+
+        openapi_data, etag, last_modified = response
+        TOOL_SERVER_SPEC_CACHE[key] = {
+            "source": source,
+            "data": build_tool_server_data(source, openapi_data),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.monotonic(),
+        }
+
+    # Copy the tool specs, callers adjust them per request
+    return [
+        {
+            **TOOL_SERVER_SPEC_CACHE[key]["data"],
+            "specs": copy.deepcopy(TOOL_SERVER_SPEC_CACHE[key]["data"]["specs"]),
+        }
+        for key in keys
+        if key in TOOL_SERVER_SPEC_CACHE
+    ]
+
+
+async def set_tool_servers(request: Request):
+    request.app.state.TOOL_SERVERS = await get_cached_tool_servers_data(
+        request.app.state.config.TOOL_SERVER_CONNECTIONS
+    )
+    return request.app.state.TOOL_SERVERS
+
+
+async def get_tool_servers(request: Request):
+    return await set_tool_servers(request)
+
+
+async def fetch_tool_server_spec(
+    url: str,
+    headers: Optional[dict],
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+    """
+    Fetch an OpenAPI spec, returning (spec, etag, last_modified). When the
+    server answers 304 Not Modified to the conditional request, spec is None.
+    """
     _headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
@@ -595,6 +789,11 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
     if headers:
         _headers.update(headers)
 
+    if etag:
+        _headers["If-None-Match"] = etag
+    if last_modified:
+        _headers["If-Modified-Since"] = last_modified
+
     error = None
     try:
         timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA)
@@ -602,6 +801,9 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
             async with session.get(
                 url, headers=_headers, ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL
             ) as response:
+                if response.status == 304 and (etag or last_modified):
+                    return None, etag, last_modified
+
                 if response.status != 200:
                     error_body = await response.json()
                     raise Exception(error_body)
@@ -623,6 +825,9 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
                     except Exception as e:
                         raise e
 
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
     except Exception as err:
         log.exception(f"Could not fetch tool server spec from {url}")
         if isinstance(err, dict) and "detail" in err:
@@ -632,102 +837,36 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
         raise Exception(error)
 
     log.debug(f"Fetched data: {res}")
-    return res
+    return res, etag, last_modified
 
 
-async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    # Prepare list of enabled servers along with their original index
+async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, Any]:
+    res, _, _ = await fetch_tool_server_spec(url, headers)
+    return res
 
-    tasks = []
-    server_entries = []
-    for idx, server in enumerate(servers):
-        if (
-            server.get("config", {}).get("enable")
-            and server.get("type", "openapi") == "openapi"
-        ):
-            info = server.get("info", {})
-
-            auth_type = server.get("auth_type", "bearer")
-            token = None
-
-            if auth_type == "bearer":
-                token = server.get("key", "")
-            elif auth_type == "none":
-                # No authentication
-                pass
-
-            id = info.get("id")
-            if not id:
-                id = str(idx)
-
-            server_url = server.get("url")
-            spec_type = server.get("spec_type", "url")
-
-            # Create async tasks to fetch data
-            task = None
-            if spec_type == "url":
-                # Path (to OpenAPI spec URL) can be either a full URL or a path to append to the base URL
-                openapi_path = server.get("path", "openapi.json")
-                spec_url = get_tool_server_url(server_url, openapi_path)
-                # Fetch from URL
-                task = get_tool_server_data(
-                    spec_url,
-                    {"Authorization": f"Bearer {token}"} if token else None,
-                )
-            elif spec_type == "json" and server.get("spec", ""):
-                # Use provided JSON spec
-                spec_json = None
-                try:
-                    spec_json = json.loads(server.get("spec", ""))
-                except Exception as e:
-                    log.error(f"Error parsing JSON spec for tool server {id}: {e}")
-
-                if spec_json:
-                    task = asyncio.sleep(
-                        0,
-                        result=spec_json,
-                    )
 
-            if task:
-                tasks.append(task)
-                server_entries.append((id, idx, server, server_url, info, token))
+async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    sources = [
+        source
+        for idx, server in enumerate(servers)
+        if (source := get_tool_server_source(idx, server)) is not None
+    ]
 
     # Execute tasks concurrently
-    responses = await asyncio.gather(*tasks, return_exceptions=True)
+    responses = await asyncio.gather(
+        *[fetch_tool_server_source(source) for source in sources],
+        return_exceptions=True,
+    )
 
     # Build final results with index and server metadata
     results = []
-    for (id, idx, server, url, info, _), response in zip(server_entries, responses):
+    for source, response in zip(sources, responses):
         if isinstance(response, Exception):
-            log.error(f"Failed to connect to {url} OpenAPI tool server")
+            log.error(f"Failed to connect to {source['url']} OpenAPI tool server")
             continue
 
-        response = {
-            "openapi": response,
-            "info": response.get("info", {}),
-            "specs": convert_openapi_to_tool_payload(response),
-        }
-
-        openapi_data = response.get("openapi", {})
-        if info and isinstance(openapi_data, dict):
-            openapi_data["info"] = openapi_data.get("info", {})
-
-            if "name" in info:
-                openapi_data["info"]["title"] = info.get("name", "Tool Server")
-
-            if "description" in info:
-                openapi_data["info"]["description"] = info.get("description", "")
-
-        results.append(
-            {
-                "id": str(id),
-                "idx": idx,
-                "url": server.get("url"),
-                "openapi": openapi_data,
-                "info": response.get("info"),
-                "specs": response.get("specs"),
-            }
-        )
+        openapi_data, _, _ = response
+        results.append(build_tool_server_data(source, openapi_data))
 
     return results
 